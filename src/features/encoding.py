@@ -4,18 +4,53 @@ import pandas as pd
 
 os.chdir("..")
 from src.features.feedback_jefes import procesar_feedback_jefes
-from src.preprocessing.config import RUTA_ENCODED_DATA
-from src.preprocessing.encoding import apply_label_encoding, apply_one_hot_encoding
+from src.preprocessing.columnar_store import save_feature_matrix
+from src.preprocessing.config import (
+  COLUMNAS_BINARIAS,
+  COLUMNAS_NOMINALES,
+  RUTA_ENCODED_DATA,
+  RUTA_ENCODED_INDEX,
+  RUTA_ENCODED_MATRIX,
+  RUTA_PODA_COLUMNAS,
+  RUTA_TARGET_ENCODING,
+  RUTA_TIPOS_ENCODED,
+)
+from src.preprocessing.column_pruning import guardar_poda, podar_columnas
+from src.preprocessing.downcast import guardar_reporte_tipos, reducir_tipos
+from src.preprocessing.encoding import (
+  apply_label_encoding,
+  apply_one_hot_encoding,
+  apply_target_encoding,
+  save_target_encoding,
+)
+from src.preprocessing.pk_index import construir_indice
 
-def encoding_variables():
+def encoding_variables(guardar_matriz=False, codificacion_nominal="one_hot"):
   """
     Transforma las variables categóricas y crea un CSV a partir de la codificación.
 
     Realiza los siguientes pasos:
     1. Carga el dataset de procesar_feedback_jefes.
     2. Aplica Label Encoding a las columnas binarias.
-    3. Aplica One Hot Encoding a las columnas nominales.
-    4. Guarda el dataset en un archivo encoded_data.csv en la ruta data/clean.
+    3. Aplica One Hot Encoding a las columnas nominales o, si se indica,
+       Target Encoding fuera de fold respecto de 'Attrition'.
+    4. Guarda el dataset en un archivo encoded_data.csv en la ruta data/clean
+       y su índice por EmployeeID en encoded_data_pk.npy (ver `pk_index`).
+       Guarda también en encoded_data_tipos.json el tipo más pequeño de cada
+       columna y los bytes antes y después de reducirlos (ver `downcast`).
+    5. Busca las columnas sin información (constantes, duplicadas y la
+       columna redundante de cada grupo One Hot) y guarda cuáles se descartan
+       en encoded_data_poda.json (ver `column_pruning`). El CSV conserva todas
+       las columnas.
+    6. Opcionalmente, guarda la matriz numérica sin esas columnas como
+       encoded_data.npy junto a un manifiesto encoded_data.json, para
+       cargarla con memory-mapping.
+
+    Args:
+      guardar_matriz (bool): Si es True, guarda también la matriz memory-mapped.
+      codificacion_nominal (str): "one_hot" o "target". Con "target" cada
+        columna nominal se reemplaza por una sola columna numérica y las
+        estadísticas se guardan en RUTA_TARGET_ENCODING.
 
     Returns:
       N/A
@@ -25,12 +60,31 @@ def encoding_variables():
   df_feedback_jefes = procesar_feedback_jefes()
 
   # Label Encoding a columnas binarias
-  binary_cols = ['Attrition', 'Gender', 'Over18']
+  binary_cols = COLUMNAS_BINARIAS
   df_encoded, label_encoders = apply_label_encoding(df_feedback_jefes, binary_cols)
 
-  # One Hot Encoding a columnas nominales
-  one_hot_cols = ['BusinessTravel', 'Department', 'EducationField', 'JobRole', 'MaritalStatus']
-  df_encoded = apply_one_hot_encoding(df_encoded, one_hot_cols)
+  # One Hot Encoding (o Target Encoding) a columnas nominales
+  one_hot_cols = COLUMNAS_NOMINALES
+  if codificacion_nominal == "one_hot":
+    df_encoded = apply_one_hot_encoding(df_encoded, one_hot_cols)
+  elif codificacion_nominal == "target":
+    df_encoded, target_encoders = apply_target_encoding(df_encoded, one_hot_cols, target='Attrition')
+    save_target_encoding(target_encoders, RUTA_TARGET_ENCODING)
+  else:
+    raise ValueError(f"Codificación nominal no soportada: '{codificacion_nominal}'.")
 
   # Guardar dataset limpio
-  df_encoded.to_csv(RUTA_ENCODED_DATA, index=False)
\ No newline at end of file
+  df_encoded.to_csv(RUTA_ENCODED_DATA, index=False)
+  construir_indice(RUTA_ENCODED_DATA, 'EmployeeID', RUTA_ENCODED_INDEX)
+
+  # Reducir tipos y guardar el reporte para leer el CSV con dtype
+  df_encoded, reporte_tipos = reducir_tipos(df_encoded)
+  guardar_reporte_tipos(reporte_tipos, RUTA_TIPOS_ENCODED)
+
+  # Descartar columnas sin información y guardar cuáles para puntuar
+  df_encoded, reporte_poda = podar_columnas(df_encoded)
+  guardar_poda(reporte_poda, RUTA_PODA_COLUMNAS)
+
+  # Guardar matriz numérica memory-mapped
+  if guardar_matriz:
+    save_feature_matrix(df_encoded, RUTA_ENCODED_MATRIX)
\ No newline at end of file
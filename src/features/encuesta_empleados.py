@@ -8,8 +8,9 @@ from src.preprocessing.config import (
     EMPLOYEE_COLUMN_JOIN,
 )
 from src.preprocessing import read_employee_files as mf
+from src.preprocessing.read_feedback_files import merge_dataframe
 
-def procesar_encuesta_empleados():
+def procesar_encuesta_empleados(df_general=None, df_encuesta=None):
     """
     Carga y combina los datos de los archivos de encuesta y datos generales de empleados.
 
@@ -18,9 +19,19 @@ def procesar_encuesta_empleados():
     2. Une los DataFrames por la columna `EmployeeID`.
     3. Calcula una nueva columna de promedio de satisfacción del empleado a partir de columnas definidas.
 
+    Si se reciben los DataFrames ya cargados (por ejemplo, leídos en paralelo),
+    se omite la lectura de los archivos y solo se realiza la unión.
+
+    Args:
+        df_general (pd.DataFrame, optional): Datos generales ya cargados.
+        df_encuesta (pd.DataFrame, optional): Encuesta de empleados ya cargada.
+
     Returns:
         pd.DataFrame: DataFrame combinado y enriquecido con la nueva columna de satisfacción.
     """
-    df = mf.merge_files(RUTA_GENERAL, RUTA_EMPLOYEE_SURVEY, EMPLOYEE_COLUMN_JOIN)
+    if df_general is not None and df_encuesta is not None:
+        df = merge_dataframe(df_general, df_encuesta, EMPLOYEE_COLUMN_JOIN)
+    else:
+        df = mf.merge_files(RUTA_GENERAL, RUTA_EMPLOYEE_SURVEY, EMPLOYEE_COLUMN_JOIN)
     df = mf.mean_columns(df, COLUMN_AVERAGE_EMPLOYEE_SATISFACTION, MEAN_COLUMNS)
     return df
\ No newline at end of file
@@ -0,0 +1,280 @@
+"""
+Módulo para ordenar las características por importancia.
+
+A diferencia de `feature_builder.seleccionar_mejores_caracteristicas`, que
+usa una prueba univariada (`f_classif`), aquí la importancia se mide con un
+modelo ajustado, por lo que se capturan las interacciones:
+
+- Importancia del modelo: `feature_importances_` de un bosque aleatorio
+  (reducción media de impureza).
+- Importancia por permutación: caída de la métrica en datos de validación al
+  permutar cada columna.
+
+Las permutaciones se reparten por bloques de columnas entre procesos con
+joblib (`loky`). La matriz se pasa como arreglo de NumPy, que joblib comparte
+con los procesos como un archivo memory-mapped de solo lectura en lugar de
+copiarlo a cada uno. Para muchas filas o columnas se puede evaluar sobre una
+muestra de filas (`muestra`) y detener las repeticiones de una columna en
+cuanto su error estándar baja de `tolerancia`.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Columnas que no se usan como predictores.
+COLUMNAS_NO_PREDICTORAS = ["EmployeeID"]
+
+# Repeticiones mínimas por columna antes de evaluar la parada temprana.
+MIN_REPETICIONES = 2
+
+
+def _matriz(
+    df: pd.DataFrame, columna_objetivo: str, excluir: Optional[List[str]]
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Matriz float de las columnas numéricas y vector objetivo."""
+    if columna_objetivo not in df.columns:
+        raise ValueError(
+            f"La columna objetivo '{columna_objetivo}' no existe en el DataFrame"
+        )
+    excluir = COLUMNAS_NO_PREDICTORAS if excluir is None else excluir
+    X = df.drop(columns=[columna_objetivo] + [c for c in excluir if c in df.columns])
+    X = X.select_dtypes(include=["number", "bool"])
+    if X.empty:
+        raise ValueError("No hay columnas numéricas en el DataFrame")
+    matriz = X.to_numpy(dtype=np.float64, na_value=np.nan)
+    return matriz, df[columna_objetivo].to_numpy(), list(X.columns)
+
+
+def modelo_por_defecto(random_state: int = 42):
+    """
+    Bosque aleatorio usado cuando no se indica un modelo.
+
+    Returns:
+        RandomForestClassifier: Modelo sin ajustar.
+    """
+    from sklearn.ensemble import RandomForestClassifier
+
+    return RandomForestClassifier(
+        n_estimators=200, min_samples_leaf=5, n_jobs=-1, random_state=random_state
+    )
+
+
+def _importancia_columnas(
+    modelo,
+    X: np.ndarray,
+    y: np.ndarray,
+    indices: List[int],
+    scorer,
+    base: float,
+    n_repeticiones: int,
+    tolerancia: Optional[float],
+    random_state: int,
+) -> List[Tuple[int, float, float, int]]:
+    """
+    Importancia por permutación de un bloque de columnas.
+
+    Se copia la matriz una sola vez por bloque; cada columna se permuta en la
+    copia y se restaura antes de pasar a la siguiente.
+    """
+    X_perm = np.array(X, copy=True)
+    resultados = []
+    for j in indices:
+        # La semilla depende solo de la columna: el resultado no cambia con
+        # el número de procesos ni con el tamaño de los bloques
+        rng = np.random.default_rng([random_state, j])
+        original = X_perm[:, j].copy()
+        caidas = []
+        for repeticion in range(n_repeticiones):
+            X_perm[:, j] = original[rng.permutation(len(original))]
+            caidas.append(base - scorer(modelo, X_perm, y))
+            if (
+                tolerancia is not None
+                and repeticion + 1 >= MIN_REPETICIONES
+                and np.std(caidas, ddof=1) / np.sqrt(len(caidas)) < tolerancia
+            ):
+                break
+        X_perm[:, j] = original
+        resultados.append(
+            (j, float(np.mean(caidas)), float(np.std(caidas)), len(caidas))
+        )
+    return resultados
+
+
+def importancia_permutacion(
+    modelo,
+    X: np.ndarray,
+    y: np.ndarray,
+    columnas: List[str],
+    metrica: str = "roc_auc",
+    n_repeticiones: int = 5,
+    muestra: Optional[int] = None,
+    tolerancia: Optional[float] = None,
+    n_jobs: int = -1,
+    random_state: int = 42,
+) -> pd.DataFrame:
+    """
+    Calcula la importancia por permutación de cada columna en paralelo.
+
+    Args:
+        modelo: Modelo ya ajustado de scikit-learn.
+        X (np.ndarray): Matriz de validación (filas × columnas).
+        y (np.ndarray): Objetivo de validación.
+        columnas (List[str]): Nombre de cada columna de `X`.
+        metrica (str, optional): Métrica de `sklearn.metrics.get_scorer`.
+        n_repeticiones (int, optional): Máximo de permutaciones por columna.
+        muestra (Optional[int], optional): Si se indica, número de filas
+            (elegidas al azar) sobre las que se evalúa.
+        tolerancia (Optional[float], optional): Si se indica, se dejan de
+            repetir las permutaciones de una columna cuando el error estándar
+            de su importancia es menor que este valor.
+        n_jobs (int, optional): Procesos; -1 usa todos los núcleos.
+        random_state (int, optional): Semilla.
+
+    Returns:
+        pd.DataFrame: Columnas "caracteristica", "importancia_permutacion",
+        "desviacion_permutacion" y "repeticiones", ordenado de mayor a menor.
+    """
+    from joblib import Parallel, cpu_count, delayed
+    from sklearn.metrics import get_scorer
+
+    if n_repeticiones < 1:
+        raise ValueError("n_repeticiones debe ser al menos 1.")
+    X = np.asarray(X)
+    y = np.asarray(y)
+    if muestra is not None and muestra < len(X):
+        filas = np.sort(
+            np.random.default_rng(random_state).choice(len(X), muestra, replace=False)
+        )
+        X, y = X[filas], y[filas]
+
+    scorer = get_scorer(metrica)
+    base = scorer(modelo, X, y)
+
+    n_procesos = cpu_count() if n_jobs < 0 else max(n_jobs, 1)
+    bloques = [b for b in np.array_split(np.arange(X.shape[1]), n_procesos) if len(b)]
+    resultados = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_importancia_columnas)(
+            modelo,
+            X,
+            y,
+            bloque.tolist(),
+            scorer,
+            base,
+            n_repeticiones,
+            tolerancia,
+            random_state,
+        )
+        for bloque in bloques
+    )
+
+    filas = [fila for bloque in resultados for fila in bloque]
+    return (
+        pd.DataFrame(
+            {
+                "caracteristica": [columnas[j] for j, _, _, _ in filas],
+                "importancia_permutacion": [m for _, m, _, _ in filas],
+                "desviacion_permutacion": [d for _, _, d, _ in filas],
+                "repeticiones": [r for _, _, _, r in filas],
+            }
+        )
+        .sort_values("importancia_permutacion", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def ranking_caracteristicas(
+    df: pd.DataFrame,
+    columna_objetivo: str = "Attrition",
+    modelo: Optional[Any] = None,
+    excluir: Optional[List[str]] = None,
+    test_size: float = 0.25,
+    n_repeticiones: int = 5,
+    muestra: Optional[int] = None,
+    tolerancia: Optional[float] = None,
+    n_jobs: int = -1,
+    random_state: int = 42,
+) -> pd.DataFrame:
+    """
+    Ordena las características por importancia del modelo y por permutación.
+
+    El modelo se ajusta con una partición de entrenamiento estratificada y la
+    importancia por permutación se mide en la partición de validación.
+
+    Ejemplo:
+    ```python
+    df = pd.read_csv(RUTA_ENCODED_DATA)
+    ranking = ranking_caracteristicas(df, muestra=2000, tolerancia=0.002)
+    print(ranking.head(10))
+    ```
+
+    Args:
+        df (pd.DataFrame): Matriz codificada con la columna objetivo.
+        columna_objetivo (str, optional): Nombre de la columna objetivo.
+        modelo (optional): Modelo de scikit-learn sin ajustar con
+            `feature_importances_`. Por defecto, `modelo_por_defecto()`.
+        excluir (Optional[List[str]], optional): Columnas que no son
+            predictores. Por defecto, COLUMNAS_NO_PREDICTORAS.
+        test_size (float, optional): Proporción de la partición de validación.
+        n_repeticiones, muestra, tolerancia, n_jobs: Ver
+            `importancia_permutacion`.
+        random_state (int, optional): Semilla.
+
+    Returns:
+        pd.DataFrame: Una fila por característica con "importancia_modelo",
+        "importancia_permutacion", "desviacion_permutacion", "repeticiones"
+        y "ranking" (1 es la más importante por permutación).
+    """
+    from sklearn.model_selection import train_test_split
+
+    X, y, columnas = _matriz(df, columna_objetivo, excluir)
+    X_train, X_val, y_train, y_val = train_test_split(
+        X, y, test_size=test_size, stratify=y, random_state=random_state
+    )
+
+    modelo = modelo if modelo is not None else modelo_por_defecto(random_state)
+    modelo.fit(X_train, y_train)
+
+    ranking = importancia_permutacion(
+        modelo,
+        X_val,
+        y_val,
+        columnas,
+        n_repeticiones=n_repeticiones,
+        muestra=muestra,
+        tolerancia=tolerancia,
+        n_jobs=n_jobs,
+        random_state=random_state,
+    )
+    importancia_modelo = pd.Series(modelo.feature_importances_, index=columnas)
+    ranking.insert(
+        1,
+        "importancia_modelo",
+        importancia_modelo.loc[ranking["caracteristica"]].to_numpy(),
+    )
+    ranking["ranking"] = np.arange(1, len(ranking) + 1)
+    return ranking
+
+
+def seleccionar_por_importancia(
+    df: pd.DataFrame, columna_objetivo: str = "Attrition", k: int = 5, **kwargs
+) -> pd.DataFrame:
+    """
+    Selecciona las k características más importantes por permutación.
+
+    Tiene el mismo resultado que `seleccionar_mejores_caracteristicas`, pero
+    ordena con `ranking_caracteristicas`.
+
+    Args:
+        df (pd.DataFrame): DataFrame con características y columna objetivo.
+        columna_objetivo (str, optional): Nombre de la columna objetivo.
+        k (int, optional): Número de características a seleccionar.
+        **kwargs: Argumentos de `ranking_caracteristicas`.
+
+    Returns:
+        pd.DataFrame: DataFrame con las k mejores características y la columna objetivo.
+    """
+    ranking = ranking_caracteristicas(df, columna_objetivo, **kwargs)
+    seleccionadas = ranking["caracteristica"].head(k).tolist()
+    return df[seleccionadas + [columna_objetivo]].copy()
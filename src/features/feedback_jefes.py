@@ -3,35 +3,107 @@
 from src.features.encuesta_empleados import procesar_encuesta_empleados
 from src.preprocessing import read_employee_files, read_feedback_files
 from src.preprocessing.config import (
+    BACKEND_EJECUCION,
+    COLUMN_AVERAGE_EMPLOYEE_SATISFACTION,
     COLUMN_AVERAGE_MANAGER_FEEDBACK,
+    COLUMNAS_FUENTES,
+    DTYPES_FUENTES,
     EMPLOYEE_COLUMN_JOIN,
+    ESQUEMAS,
+    MEAN_COLUMNS,
     MEAN_COLUMNS_FEEDBACK,
-    RUTA_MANAGER_SURVEY_PATH,
+    RUTAS_FUENTES,
 )
+from src.preprocessing.parallel_reader import read_files_parallel
 
 
-def procesar_feedback_jefes():
+def _procesar_con_duckdb():
+    """Ejecuta la unión y los promedios como una sola consulta en DuckDB."""
+    # Importar dentro de la función para no depender de duckdb en todo el módulo
+    from src.preprocessing import duckdb_backend
+
+    return duckdb_backend.procesar_fuentes(
+        RUTAS_FUENTES,
+        EMPLOYEE_COLUMN_JOIN,
+        [
+            {"nombre": COLUMN_AVERAGE_EMPLOYEE_SATISFACTION, "columnas": MEAN_COLUMNS},
+            {
+                "nombre": COLUMN_AVERAGE_MANAGER_FEEDBACK,
+                "columnas": MEAN_COLUMNS_FEEDBACK,
+            },
+        ],
+        dtypes=DTYPES_FUENTES,
+    )
+
+
+def _procesar_con_polars():
+    """Ejecuta la unión y los promedios como un único plan de Polars."""
+    from src.preprocessing import polars_backend
+
+    fuentes = {
+        nombre: polars_backend.read_file(
+            ruta, DTYPES_FUENTES.get(nombre), COLUMNAS_FUENTES.get(nombre)
+        )
+        for nombre, ruta in RUTAS_FUENTES.items()
+    }
+    lf = polars_backend.merge_dataframe(
+        fuentes["general"], fuentes["encuesta_empleados"], EMPLOYEE_COLUMN_JOIN
+    )
+    lf = polars_backend.mean_columns(
+        lf, COLUMN_AVERAGE_EMPLOYEE_SATISFACTION, MEAN_COLUMNS
+    )
+    lf = polars_backend.merge_dataframe(
+        lf, fuentes["encuesta_jefes"], EMPLOYEE_COLUMN_JOIN
+    )
+    lf = polars_backend.mean_columns(
+        lf, COLUMN_AVERAGE_MANAGER_FEEDBACK, MEAN_COLUMNS_FEEDBACK
+    )
+    return polars_backend.to_pandas(lf)
+
+
+def procesar_feedback_jefes(backend=BACKEND_EJECUCION):
     """
     Carga los datos del dataset generado por el grupo 1.
 
     Luego lo combina con los datos de manager_survey_data.
 
     Realiza los siguientes pasos:
-    1. Llama al método final del grupo 1
-    2. Carga el dataset de manager_survey_data.
+    1. Carga en paralelo los tres archivos fuente, validando cada uno con su
+    esquema de config.ESQUEMAS, y llama al método final del grupo 1 con los
+    datos generales y la encuesta de empleados.
+    2. Toma el dataset de manager_survey_data ya cargado.
     3. Hace merge con el dataset de manager_survey_data.
     4. Calcula una nueva columna de promedio de feedback del jefe
     a partir de columnas definidas.
     5. Devuelve el DataFrame combinado.
 
+    Con backend="duckdb" los mismos pasos se ejecutan como una consulta SQL que
+    lee los archivos directamente y puede usar disco si no caben en memoria.
+    Con backend="polars" se ejecutan como un único plan perezoso de Polars.
+
+    Args:
+        backend (str): Motor de ejecución, "pandas", "duckdb" o "polars".
+
     Returns:
         df_average_manag_fb: DataFrame combinado con la data de manager_survey_data.
     """
+    if backend == "duckdb":
+        return _procesar_con_duckdb()
+    if backend == "polars":
+        return _procesar_con_polars()
+    if backend != "pandas":
+        raise ValueError(f"Backend no soportado: '{backend}'.")
+
     # Paso 1
-    df_encuesta_empleados = procesar_encuesta_empleados()
+    fuentes = read_files_parallel(
+        RUTAS_FUENTES, DTYPES_FUENTES, COLUMNAS_FUENTES, ESQUEMAS
+    )
+    df_encuesta_empleados = procesar_encuesta_empleados(
+        fuentes["general"], fuentes["encuesta_empleados"]
+    )
 
     # Paso 2
-    df_manager_survey_data = read_employee_files.read_file(RUTA_MANAGER_SURVEY_PATH)
+    df_manager_survey_data = fuentes["encuesta_jefes"]
 
     # Paso 3
     df_merge_employee_manager = read_feedback_files.merge_dataframe(
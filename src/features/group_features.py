@@ -0,0 +1,286 @@
+"""
+Módulo para crear variables de contexto por grupo (departamento, puesto, etc.).
+
+Calcula agregados por grupo sobre la salida de `procesar_feedback_jefes`, por
+ejemplo el ingreso promedio del departamento o el percentil del ingreso de
+cada empleado dentro de su `JobRole`, y los asigna de vuelta a cada fila.
+
+El cálculo se divide en dos pasos para poder reutilizar las estadísticas al
+puntuar empleados nuevos:
+
+1. `ajustar_agregados_grupo`: un único `groupby` ordenado por cada columna de
+   agrupación, con todas las columnas y funciones a la vez.
+2. `aplicar_agregados_grupo`: asigna las estadísticas a cada fila indexando
+   con el código de su grupo, sin bucles de Python por grupo.
+"""
+
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Agregados calculados por defecto.
+AGREGADOS_GRUPO = [
+    {"grupo": "Department", "columna": "MonthlyIncome", "funcion": "mean"},
+    {"grupo": "JobRole", "columna": "MonthlyIncome", "funcion": "percentil"},
+    {
+        "grupo": "Department",
+        "columna": "average_employee_satisfaction",
+        "funcion": "mean",
+    },
+]
+
+# Funciones de agregación admitidas, además de "percentil".
+FUNCIONES = ["mean", "median", "std", "min", "max", "sum", "count"]
+
+
+def nombre_columna(especificacion: Dict[str, str]) -> str:
+    """Retorna el nombre de la columna generada por una especificación."""
+    return (
+        f"{especificacion['columna']}_{especificacion['funcion']}"
+        f"_por_{especificacion['grupo']}"
+    )
+
+
+def _validar(df: pd.DataFrame, especificaciones: List[Dict[str, str]]) -> None:
+    """Verifica columnas y funciones de las especificaciones."""
+    if not especificaciones:
+        raise ValueError("La lista de especificaciones no debe estar vacía.")
+
+    missing_cols = sorted(
+        {
+            col
+            for esp in especificaciones
+            for col in (esp["grupo"], esp["columna"])
+            if col not in df.columns
+        }
+    )
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    invalidas = [
+        esp["funcion"]
+        for esp in especificaciones
+        if esp["funcion"] not in FUNCIONES + ["percentil"]
+    ]
+    if invalidas:
+        raise ValueError(f"Funciones de agregación no soportadas: {invalidas}")
+
+
+def _ajustar_percentil(codigos: np.ndarray, valores: np.ndarray, n_grupos: int) -> Dict:
+    """
+    Prepara las estadísticas para calcular percentiles dentro de cada grupo.
+
+    Cada valor se convierte en su posición entre los valores únicos, y se
+    combina con el código del grupo en una clave entera ordenada. Así, el
+    número de empleados del grupo con valor menor o igual a `x` se obtiene
+    con una búsqueda binaria sobre todas las claves a la vez.
+    """
+    validos = (codigos >= 0) & ~np.isnan(valores)
+    codigos, valores = codigos[validos], valores[validos]
+
+    unicos = np.unique(valores)
+    claves = np.sort(_clave(codigos, valores, unicos))
+    tamano = np.bincount(codigos, minlength=n_grupos)
+    inicio = np.concatenate([[0], np.cumsum(tamano)[:-1]])
+    return {"unicos": unicos, "claves": claves, "inicio": inicio, "tamano": tamano}
+
+
+def _clave(codigos: np.ndarray, valores: np.ndarray, unicos: np.ndarray) -> np.ndarray:
+    """Combina el código de grupo y la posición del valor en una clave entera."""
+    posicion = np.searchsorted(unicos, valores, side="right")
+    return codigos.astype(np.int64) * (len(unicos) + 1) + posicion
+
+
+def _aplicar_percentil(
+    codigos: np.ndarray, valores: np.ndarray, estadisticas: Dict
+) -> np.ndarray:
+    """Fracción de empleados del grupo con valor menor o igual al de cada fila."""
+    resultado = np.full(len(codigos), np.nan)
+    validos = (codigos >= 0) & ~np.isnan(valores)
+    codigos, valores = codigos[validos], valores[validos]
+
+    claves = _clave(codigos, valores, estadisticas["unicos"])
+    menores = (
+        np.searchsorted(estadisticas["claves"], claves, side="right")
+        - estadisticas["inicio"][codigos]
+    )
+    tamano = estadisticas["tamano"][codigos]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        resultado[validos] = np.where(tamano > 0, menores / tamano, np.nan)
+    return resultado
+
+
+def ajustar_agregados_grupo(
+    df: pd.DataFrame, especificaciones: Optional[List[Dict[str, str]]] = None
+) -> Dict:
+    """
+    Calcula las estadísticas por grupo necesarias para los agregados.
+
+    Args:
+        df (pd.DataFrame): Datos de entrenamiento.
+        especificaciones (Optional[List[Dict[str, str]]], optional):
+            Lista de diccionarios con las claves "grupo", "columna" y
+            "funcion". Por defecto: `AGREGADOS_GRUPO`.
+
+    Returns:
+        Dict: Estadísticas por columna de agrupación, reutilizables con
+        `aplicar_agregados_grupo`.
+    """
+    especificaciones = especificaciones or AGREGADOS_GRUPO
+    _validar(df, especificaciones)
+
+    estadisticas = {"especificaciones": list(especificaciones), "grupos": {}}
+    for grupo in dict.fromkeys(esp["grupo"] for esp in especificaciones):
+        propias = [esp for esp in especificaciones if esp["grupo"] == grupo]
+        codigos, categorias = pd.factorize(df[grupo], sort=True)
+
+        # Un único groupby ordenado con todas las columnas y funciones del grupo
+        funciones = {}
+        for esp in propias:
+            if esp["funcion"] != "percentil":
+                funciones.setdefault(esp["columna"], []).append(esp["funcion"])
+        tablas = {}
+        if funciones:
+            agregado = (
+                df[list(funciones)]
+                .groupby(codigos, sort=True)
+                .agg(funciones)
+                .reindex(range(len(categorias)))
+            )
+            tablas = {
+                f"{col}_{funcion}": agregado[(col, funcion)].to_numpy(dtype=float)
+                for col, lista in funciones.items()
+                for funcion in lista
+            }
+
+        percentiles = {
+            esp["columna"]: _ajustar_percentil(
+                codigos,
+                df[esp["columna"]].to_numpy(dtype=float, na_value=np.nan),
+                len(categorias),
+            )
+            for esp in propias
+            if esp["funcion"] == "percentil"
+        }
+
+        estadisticas["grupos"][grupo] = {
+            "categorias": list(categorias),
+            "tablas": tablas,
+            "percentiles": percentiles,
+        }
+    return estadisticas
+
+
+def aplicar_agregados_grupo(df: pd.DataFrame, estadisticas: Dict) -> pd.DataFrame:
+    """
+    Agrega a cada fila las estadísticas de su grupo.
+
+    Los grupos que no se vieron al ajustar reciben NaN.
+
+    Args:
+        df (pd.DataFrame): Datos a enriquecer (entrenamiento o empleados nuevos).
+        estadisticas (Dict): Resultado de `ajustar_agregados_grupo`.
+
+    Returns:
+        pd.DataFrame: Copia de `df` con una columna nueva por especificación.
+    """
+    nuevas = {}
+    for grupo, info in estadisticas["grupos"].items():
+        if grupo not in df.columns:
+            raise KeyError(f"La columna '{grupo}' no está en el DataFrame.")
+        codigos = pd.Index(info["categorias"]).get_indexer(df[grupo])
+
+        for esp in estadisticas["especificaciones"]:
+            if esp["grupo"] != grupo:
+                continue
+            if esp["funcion"] == "percentil":
+                valores = df[esp["columna"]].to_numpy(dtype=float, na_value=np.nan)
+                columna = _aplicar_percentil(
+                    codigos, valores, info["percentiles"][esp["columna"]]
+                )
+            else:
+                tabla = info["tablas"][f"{esp['columna']}_{esp['funcion']}"]
+                # El código -1 (grupo no visto) apunta al NaN agregado al final
+                columna = np.append(tabla, np.nan)[codigos]
+            nuevas[nombre_columna(esp)] = columna
+
+    return df.assign(**nuevas)
+
+
+def calcular_agregados_grupo(
+    df: pd.DataFrame, especificaciones: Optional[List[Dict[str, str]]] = None
+):
+    """
+    Ajusta y aplica los agregados por grupo sobre el mismo DataFrame.
+
+    Ejemplo:
+    ```python
+    df = procesar_feedback_jefes()
+    df_grupos, estadisticas = calcular_agregados_grupo(df)
+    guardar_agregados(estadisticas, "agregados.json")
+    ```
+
+    Args:
+        df (pd.DataFrame): Datos de entrenamiento.
+        especificaciones (Optional[List[Dict[str, str]]], optional):
+            Agregados a calcular. Por defecto: `AGREGADOS_GRUPO`.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict]: Datos enriquecidos y estadísticas ajustadas.
+    """
+    estadisticas = ajustar_agregados_grupo(df, especificaciones)
+    return aplicar_agregados_grupo(df, estadisticas), estadisticas
+
+
+def guardar_agregados(estadisticas: Dict, ruta: str) -> None:
+    """
+    Guarda las estadísticas por grupo en un archivo JSON.
+
+    Args:
+        estadisticas (Dict): Resultado de `ajustar_agregados_grupo`.
+        ruta (str): Ruta del archivo JSON.
+    """
+
+    def _serializar(valor):
+        if isinstance(valor, np.ndarray):
+            return valor.tolist()
+        if isinstance(valor, np.generic):
+            return valor.item()
+        raise TypeError(f"Tipo no serializable: {type(valor)}")
+
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(estadisticas, f, default=_serializar, ensure_ascii=False)
+
+
+def cargar_agregados(ruta: str) -> Dict:
+    """
+    Carga las estadísticas por grupo desde un archivo JSON.
+
+    Args:
+        ruta (str): Ruta del archivo JSON.
+
+    Returns:
+        Dict: Estadísticas listas para `aplicar_agregados_grupo`.
+    """
+    with open(ruta, encoding="utf-8") as f:
+        estadisticas = json.load(f)
+
+    for info in estadisticas["grupos"].values():
+        info["tablas"] = {
+            nombre: np.array(valores, dtype=float)
+            for nombre, valores in info["tablas"].items()
+        }
+        info["percentiles"] = {
+            col: {
+                "unicos": np.array(datos["unicos"], dtype=float),
+                "claves": np.array(datos["claves"], dtype=np.int64),
+                "inicio": np.array(datos["inicio"], dtype=np.int64),
+                "tamano": np.array(datos["tamano"], dtype=np.int64),
+            }
+            for col, datos in info["percentiles"].items()
+        }
+    return estadisticas
@@ -0,0 +1,173 @@
+"""
+Módulo para agrupar consultas individuales en micro-lotes.
+
+Construir un DataFrame por cada consulta tiene un costo fijo que domina el
+tiempo de transformaciones como `crear_variables_dummy` o
+`apply_one_hot_encoding`. `MicroBatcher` recibe consultas concurrentes de un
+solo empleado, las acumula hasta `max_batch_size` registros o hasta
+`max_wait_ms` milisegundos, ejecuta la transformación vectorizada una sola
+vez sobre el lote y devuelve a cada consulta su fila del resultado.
+
+La transformación debe producir las mismas columnas sin importar qué
+registros lleguen juntos (por ejemplo, usando categorías ajustadas de
+antemano), ya que cada lote puede contener registros distintos.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+class MicroBatcher:
+    """
+    Agrupa consultas concurrentes y las transforma en lote.
+
+    Ejemplo:
+    ```python
+    async def main():
+        async with MicroBatcher(crear_flags_riesgo, max_batch_size=32) as batcher:
+            resultados = await asyncio.gather(
+                *(batcher.submit(registro) for registro in registros)
+            )
+    ```
+    """
+
+    def __init__(
+        self,
+        transform_batch: Callable[[pd.DataFrame], pd.DataFrame],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        run_in_thread: bool = False,
+    ):
+        """
+        Inicializa el agrupador.
+
+        Args:
+            transform_batch (Callable[[pd.DataFrame], pd.DataFrame]):
+                Transformación vectorizada. Debe retornar una fila por cada fila
+                de entrada y en el mismo orden.
+            max_batch_size (int, optional): Tamaño máximo de cada lote.
+            max_wait_ms (float, optional): Tiempo máximo que espera el primer
+                registro de un lote antes de procesarlo.
+            run_in_thread (bool, optional): Si es True, la transformación se
+                ejecuta en un hilo para no bloquear el event loop.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size debe ser mayor o igual a 1.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms no puede ser negativo.")
+
+        self.transform_batch = transform_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.run_in_thread = run_in_thread
+        self.batch_sizes: List[int] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Inicia la tarea que procesa los lotes."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Procesa las consultas pendientes y detiene la tarea de lotes."""
+        if self._worker is None:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+        self._queue = None
+
+    async def __aenter__(self) -> "MicroBatcher":
+        """Inicia el agrupador al entrar en un bloque `async with`."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Detiene el agrupador al salir del bloque `async with`."""
+        await self.close()
+
+    async def submit(self, registro: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Envía un registro y espera su fila transformada.
+
+        Args:
+            registro (Dict[str, Any]): Datos de un empleado.
+
+        Returns:
+            Dict[str, Any]: Fila del resultado correspondiente al registro.
+        """
+        if self._worker is None:
+            raise RuntimeError("El MicroBatcher no está iniciado.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((registro, future))
+        return await future
+
+    async def _collect(self, primero) -> Tuple[List, bool]:
+        """Acumula registros hasta llenar el lote o agotar el tiempo de espera."""
+        loop = asyncio.get_running_loop()
+        lote = [primero]
+        deadline = loop.time() + self.max_wait_ms / 1000
+        while len(lote) < self.max_batch_size:
+            restante = deadline - loop.time()
+            if restante > 0:
+                # No se usa asyncio.wait_for: antes de Python 3.12 puede
+                # cancelar un get() que ya sacó un registro de la cola y
+                # perderlo. Aquí, si la tarea terminó al vencer el plazo, se
+                # usa su registro; si se cancela, el registro sigue en la cola.
+                tarea = asyncio.ensure_future(self._queue.get())
+                terminadas, _ = await asyncio.wait({tarea}, timeout=restante)
+                if not terminadas and tarea.cancel():
+                    break
+                item = tarea.result()
+            else:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            if item is None:
+                return lote, True
+            lote.append(item)
+        return lote, False
+
+    async def _run(self) -> None:
+        """Bucle principal: forma lotes, los transforma y reparte resultados."""
+        while True:
+            primero = await self._queue.get()
+            if primero is None:
+                return
+            lote, cerrar = await self._collect(primero)
+            await self._process(lote)
+            if cerrar:
+                return
+
+    async def _process(self, lote: List) -> None:
+        """Transforma un lote y resuelve el future de cada registro."""
+        registros = [registro for registro, _ in lote]
+        futures = [future for _, future in lote]
+        self.batch_sizes.append(len(lote))
+
+        try:
+            df = pd.DataFrame.from_records(registros)
+            if self.run_in_thread:
+                resultado = await asyncio.to_thread(self.transform_batch, df)
+            else:
+                resultado = self.transform_batch(df)
+            if len(resultado) != len(registros):
+                raise ValueError(
+                    "La transformación debe retornar una fila por registro: "
+                    f"se esperaban {len(registros)} y se obtuvieron {len(resultado)}."
+                )
+            filas = resultado.to_dict("records")
+        except Exception as error:  # noqa: BLE001 - se reenvía a cada consulta
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for future, fila in zip(futures, filas):
+            if not future.done():
+                future.set_result(fila)
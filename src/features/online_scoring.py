@@ -0,0 +1,345 @@
+"""
+Módulo para transformar y puntuar un único empleado con baja latencia.
+
+El pipeline por lotes (`procesar_feedback_jefes` → `encoding_variables`)
+construye DataFrames completos, cuyo costo fijo domina cuando se consulta un
+solo empleado. Este módulo reproduce las mismas transformaciones sobre un
+diccionario, con Python puro, a partir de un estado ajustado previamente con
+los datos de entrenamiento:
+
+- Promedios de `mean_columns` (ignorando valores faltantes).
+- Label Encoding de las columnas binarias.
+- One Hot Encoding de las columnas nominales.
+- Derivaciones de `feature_builder` (categorías de edad, ratio salario/edad,
+  índice de satisfacción y flags de riesgo), cuando están configuradas.
+
+El vector del modelo excluye las mismas columnas que
+`training_data.construir_matriz` y, si se indica el reporte de
+`column_pruning`, las columnas que la poda descartó al entrenar.
+
+El estado es un diccionario serializable en JSON, de modo que se ajusta una
+vez y se carga en el servicio que atiende las consultas.
+"""
+
+import json
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.features.training_data import COLUMNAS_NO_PREDICTORAS
+from src.preprocessing.config import (
+    COLUMN_AVERAGE_EMPLOYEE_SATISFACTION,
+    COLUMN_AVERAGE_MANAGER_FEEDBACK,
+    COLUMNAS_BINARIAS,
+    COLUMNAS_NOMINALES,
+    MEAN_COLUMNS,
+    MEAN_COLUMNS_FEEDBACK,
+)
+from src.preprocessing.encoding import apply_label_encoding, apply_one_hot_encoding
+
+# Promedios calculados por el pipeline, en el orden en que se agregan.
+PROMEDIOS = {
+    COLUMN_AVERAGE_EMPLOYEE_SATISFACTION: MEAN_COLUMNS,
+    COLUMN_AVERAGE_MANAGER_FEEDBACK: MEAN_COLUMNS_FEEDBACK,
+}
+
+# Límites y etiquetas de `feature_builder.crear_categorias_edad`.
+_BINS_EDAD = [0, 18, 30, 50, 65, 100]
+_LABELS_EDAD = ["Menor", "Joven", "Adulto", "Senior", "Jubilado"]
+
+# Columnas por defecto de `feature_builder.crear_indice_satisfaccion`.
+_COLUMNAS_SATISFACCION = [
+    "satisfaccion_trabajo",
+    "satisfaccion_ambiente",
+    "satisfaccion_salario",
+]
+
+
+def _is_missing(valor: Any) -> bool:
+    """Indica si un valor se considera faltante (None o NaN)."""
+    return valor is None or (isinstance(valor, float) and math.isnan(valor))
+
+
+def _to_float(valor: Any) -> float:
+    """Convierte a número como `pd.to_numeric(errors="coerce")`."""
+    if _is_missing(valor):
+        return math.nan
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _round2(valor: float) -> float:
+    """Redondea a dos decimales con el mismo algoritmo que `pd.Series.round`."""
+    return float(np.rint(valor * 100) / 100)
+
+
+def _categorias_edad(registro: Dict[str, Any]) -> None:
+    """Equivalente de `crear_categorias_edad` para un solo registro."""
+    edad = _to_float(registro["edad"])
+    registro["grupo_edad"] = None
+    for inicio, fin, label in zip(_BINS_EDAD[:-1], _BINS_EDAD[1:], _LABELS_EDAD):
+        if inicio <= edad < fin:
+            registro["grupo_edad"] = label
+            break
+
+
+def _ratio_salario_edad(registro: Dict[str, Any]) -> None:
+    """Equivalente de `calcular_ratio_salario_edad` para un solo registro."""
+    registro["salario"] = _to_float(registro["salario"])
+    registro["edad"] = _to_float(registro["edad"])
+    registro["ratio_salario_edad"] = _round2(registro["salario"] / registro["edad"])
+
+
+def _indice_satisfaccion(registro: Dict[str, Any]) -> None:
+    """Equivalente de `crear_indice_satisfaccion` con sus valores por defecto."""
+    columnas = [col for col in _COLUMNAS_SATISFACCION if col in registro]
+    if not columnas:
+        raise ValueError(
+            f"Ninguna de las columnas {_COLUMNAS_SATISFACCION} existe en el registro"
+        )
+    peso = 1 / len(columnas)
+    indice = 0.0
+    for col in columnas:
+        registro[col] = _to_float(registro[col])
+        indice += registro[col] * peso
+    registro["indice_satisfaccion"] = _round2(indice)
+
+
+def _flags_riesgo(registro: Dict[str, Any]) -> None:
+    """Equivalente de `crear_flags_riesgo` para un solo registro."""
+    reglas = [
+        ("satisfaccion_trabajo", "flag_baja_satisfaccion", 3),
+        ("salario", "flag_salario_bajo", 1500),
+        ("antiguedad", "flag_empleado_nuevo", 1),
+    ]
+    score = 0
+    for origen, flag, umbral in reglas:
+        valor = 0
+        if origen in registro:
+            registro[origen] = _to_float(registro[origen])
+            # Una comparación con NaN es falsa, igual que en pandas
+            valor = int(registro[origen] < umbral)
+        registro[flag] = valor
+        score += valor
+    registro["score_riesgo"] = score
+
+
+# Derivaciones disponibles, aplicadas en el orden indicado en el estado.
+DERIVACIONES = {
+    "categorias_edad": _categorias_edad,
+    "ratio_salario_edad": _ratio_salario_edad,
+    "indice_satisfaccion": _indice_satisfaccion,
+    "flags_riesgo": _flags_riesgo,
+}
+
+
+def ajustar_estado(
+    df: pd.DataFrame,
+    binary_cols: Optional[List[str]] = None,
+    one_hot_cols: Optional[List[str]] = None,
+    derivaciones: Optional[List[str]] = None,
+    target: str = "Attrition",
+    poda: Optional[Dict[str, Any]] = None,
+    excluir: Optional[List[str]] = None,
+) -> Dict:
+    """
+    Ajusta el estado del pipeline en línea a partir de los datos de entrenamiento.
+
+    Args:
+        df (pd.DataFrame): Salida de `procesar_feedback_jefes`.
+        binary_cols (Optional[List[str]], optional): Columnas con Label
+            Encoding. Por defecto, config.COLUMNAS_BINARIAS, las mismas de
+            `encoding_variables`.
+        one_hot_cols (Optional[List[str]], optional): Columnas con One Hot
+            Encoding. Por defecto, config.COLUMNAS_NOMINALES.
+        derivaciones (Optional[List[str]], optional): Nombres de `DERIVACIONES`
+            a aplicar después de la codificación. Por defecto, ninguna.
+        target (str, optional): Columna objetivo, excluida del vector del modelo.
+        poda (Optional[Dict[str, Any]], optional): Reporte de `column_pruning`
+            (por ejemplo, `cargar_poda(RUTA_PODA_COLUMNAS)`); sus columnas
+            descartadas se excluyen del vector del modelo.
+        excluir (Optional[List[str]], optional): Columnas que no son
+            predictores. Por defecto, `training_data.COLUMNAS_NO_PREDICTORAS`.
+
+    Returns:
+        Dict: Estado serializable en JSON.
+    """
+    binary_cols = COLUMNAS_BINARIAS if binary_cols is None else binary_cols
+    one_hot_cols = COLUMNAS_NOMINALES if one_hot_cols is None else one_hot_cols
+    derivaciones = derivaciones or []
+    excluir = COLUMNAS_NO_PREDICTORAS if excluir is None else excluir
+    descartadas = set(poda["descartadas"]) if poda is not None else set()
+
+    desconocidas = [d for d in derivaciones if d not in DERIVACIONES]
+    if desconocidas:
+        raise ValueError(f"Derivaciones no soportadas: {desconocidas}")
+
+    # Se usan las mismas funciones del pipeline por lotes para obtener las
+    # categorías y el orden final de las columnas
+    df_encoded, encoders = apply_label_encoding(df, binary_cols)
+    df_encoded = apply_one_hot_encoding(df_encoded, one_hot_cols)
+
+    columns = [str(col) for col in df_encoded.columns]
+    return {
+        "label": {
+            col: {str(clase): i for i, clase in enumerate(encoders[col].classes_)}
+            for col in binary_cols
+        },
+        "one_hot": {
+            col: [str(c) for c in sorted(df[col].dropna().unique())]
+            for col in one_hot_cols
+        },
+        "promedios": {
+            nombre: list(cols)
+            for nombre, cols in PROMEDIOS.items()
+            if nombre in df.columns
+        },
+        "derivaciones": list(derivaciones),
+        "columns": columns,
+        "feature_columns": [
+            col
+            for col in columns
+            if col != target and col not in excluir and col not in descartadas
+        ],
+    }
+
+
+def transformar_empleado(registro: Dict[str, Any], estado: Dict) -> Dict[str, Any]:
+    """
+    Transforma los datos crudos de un empleado sin construir DataFrames.
+
+    Args:
+        registro (Dict[str, Any]): Valores crudos del empleado, con las mismas
+            columnas que `general_data.csv` y las encuestas.
+        estado (Dict): Estado obtenido con `ajustar_estado`.
+
+    Returns:
+        Dict[str, Any]: Registro transformado, con las columnas en el mismo
+        orden que la salida por lotes.
+
+    Raises:
+        ValueError: Si una columna binaria trae una categoría no vista.
+    """
+    resultado = dict(registro)
+
+    for nombre, columnas in estado["promedios"].items():
+        valores = [
+            _to_float(resultado.get(col))
+            for col in columnas
+            if not _is_missing(resultado.get(col))
+        ]
+        resultado[nombre] = sum(valores) / len(valores) if valores else math.nan
+
+    for col, codigos in estado["label"].items():
+        if col not in resultado:
+            continue
+        valor = str(resultado[col])
+        if valor not in codigos:
+            raise ValueError(f"Valor no visto en '{col}': {resultado[col]!r}")
+        resultado[col] = codigos[valor]
+
+    for col, categorias in estado["one_hot"].items():
+        valor = resultado.pop(col, None)
+        valor = None if _is_missing(valor) else str(valor)
+        for categoria in categorias:
+            resultado[f"{col}_{categoria}"] = valor == categoria
+
+    for nombre in estado["derivaciones"]:
+        DERIVACIONES[nombre](resultado)
+
+    # Mismo orden de columnas que la salida por lotes; las nuevas van al final
+    ordenado = {col: resultado[col] for col in estado["columns"] if col in resultado}
+    ordenado.update(resultado)
+    return ordenado
+
+
+def vectorizar(registro: Dict[str, Any], estado: Dict) -> np.ndarray:
+    """
+    Construye el vector numérico del modelo a partir de un registro transformado.
+
+    Args:
+        registro (Dict[str, Any]): Salida de `transformar_empleado`.
+        estado (Dict): Estado obtenido con `ajustar_estado`.
+
+    Returns:
+        np.ndarray: Vector de forma (1, n_features) en el orden de
+        `estado["feature_columns"]`.
+    """
+    valores = [_to_float(registro.get(col)) for col in estado["feature_columns"]]
+    return np.array(valores, dtype=np.float64).reshape(1, -1)
+
+
+class OnlineScorer:
+    """
+    API en proceso para puntuar empleados uno a uno.
+
+    Ejemplo:
+    ```python
+    estado = ajustar_estado(
+        procesar_feedback_jefes(), poda=cargar_poda(RUTA_PODA_COLUMNAS)
+    )
+    scorer = OnlineScorer(estado, modelo)
+    riesgo = scorer.score({"Age": 41, "BusinessTravel": "Travel_Rarely", ...})
+    ```
+    """
+
+    def __init__(self, estado: Dict, modelo: Any = None):
+        """
+        Inicializa el scorer.
+
+        Args:
+            estado (Dict): Estado obtenido con `ajustar_estado`.
+            modelo (Any, optional): Modelo con método `predict_proba`, entrenado
+                con las columnas `estado["feature_columns"]`.
+        """
+        self.estado = estado
+        self.modelo = modelo
+
+    def transform(self, registro: Dict[str, Any]) -> Dict[str, Any]:
+        """Transforma un registro crudo; ver `transformar_empleado`."""
+        return transformar_empleado(registro, self.estado)
+
+    def score(self, registro: Dict[str, Any]) -> float:
+        """
+        Retorna la probabilidad de attrition de un empleado.
+
+        Args:
+            registro (Dict[str, Any]): Valores crudos del empleado.
+
+        Returns:
+            float: Probabilidad de la clase positiva.
+        """
+        if self.modelo is None:
+            raise ValueError("El scorer no tiene un modelo asignado.")
+        vector = vectorizar(self.transform(registro), self.estado)
+        return float(self.modelo.predict_proba(vector)[0, 1])
+
+
+def guardar_estado(estado: Dict, ruta: str) -> None:
+    """
+    Guarda el estado del pipeline en línea en un archivo JSON.
+
+    Args:
+        estado (Dict): Estado obtenido con `ajustar_estado`.
+        ruta (str): Ruta del archivo JSON.
+    """
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(estado, f, ensure_ascii=False, indent=2)
+
+
+def cargar_estado(ruta: str) -> Dict:
+    """
+    Carga el estado del pipeline en línea desde un archivo JSON.
+
+    Args:
+        ruta (str): Ruta del archivo JSON.
+
+    Returns:
+        Dict: Estado del pipeline.
+    """
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
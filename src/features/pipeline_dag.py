@@ -0,0 +1,445 @@
+"""
+Módulo para ejecutar el pipeline como un grafo de etapas con caché.
+
+Cada etapa declara su función, las etapas de las que recibe datos
+(`entradas`), los archivos que lee (`archivos`) y sus parámetros. Antes de
+ejecutar se calcula una huella de cada etapa a partir de:
+
+- el código fuente de su función y de los módulos que declara como
+  `dependencias`,
+- sus parámetros,
+- el tamaño y la fecha de modificación de sus archivos,
+- las huellas de sus entradas.
+
+Si existe en caché un resultado con la misma huella, la etapa no se ejecuta
+y, si ninguna etapa posterior la necesita, ni siquiera se carga. Al cambiar
+una etapa cambia su huella y la de las etapas que dependen de ella, de modo
+que solo esas se vuelven a calcular. Las etapas de un mismo nivel del grafo
+(sin dependencias entre sí) se ejecutan en paralelo con un pool de hilos.
+
+Ejemplo:
+```python
+pipeline = construir_pipeline_codificacion()
+df_encoded = pipeline.ejecutar(["codificacion"])["codificacion"]
+print(pipeline.estado)  # {"general": "cache", ..., "codificacion": "ejecutada"}
+```
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.preprocessing import (
+    column_pruning,
+    downcast,
+    encoding,
+    fast_join,
+    read_employee_files,
+    read_feedback_files,
+    schema,
+)
+from src.preprocessing.column_pruning import podar_columnas
+from src.preprocessing.config import (
+    COLUMN_AVERAGE_EMPLOYEE_SATISFACTION,
+    COLUMN_AVERAGE_MANAGER_FEEDBACK,
+    COLUMNAS_BINARIAS,
+    COLUMNAS_FUENTES,
+    COLUMNAS_NOMINALES,
+    DTYPES_FUENTES,
+    EMPLOYEE_COLUMN_JOIN,
+    ESQUEMAS,
+    MEAN_COLUMNS,
+    MEAN_COLUMNS_FEEDBACK,
+    PRECISION_FLOAT,
+    RUTA_CACHE_PIPELINE,
+    RUTAS_FUENTES,
+    UMBRAL_CASI_CONSTANTE,
+)
+from src.preprocessing.downcast import reducir_tipos
+from src.preprocessing.encoding import apply_label_encoding
+
+
+def _huella_funcion(funcion: Callable) -> str:
+    """Texto que identifica el código de una función."""
+    try:
+        return inspect.getsource(funcion)
+    except (OSError, TypeError):
+        codigo = getattr(funcion, "__code__", None)
+        if codigo is None:
+            return repr(funcion)
+        return f"{funcion.__qualname__}:{codigo.co_code.hex()}:{codigo.co_consts}"
+
+
+def _huella_dependencia(dependencia: Any) -> str:
+    """
+    Huella del código de un módulo (contenido de su archivo) o de una función.
+    """
+    if isinstance(dependencia, ModuleType):
+        ruta = getattr(dependencia, "__file__", None)
+        if ruta is None:
+            return f"{dependencia.__name__}:{getattr(dependencia, '__version__', '')}"
+        contenido = Path(ruta).read_bytes()
+        return f"{dependencia.__name__}:{hashlib.sha256(contenido).hexdigest()}"
+    return _huella_funcion(dependencia)
+
+
+def _huella_archivo(ruta: str) -> str:
+    """Tamaño y fecha de modificación de un archivo."""
+    info = os.stat(ruta)
+    return f"{ruta}:{info.st_size}:{info.st_mtime_ns}"
+
+
+class PipelineDAG:
+    """Grafo de etapas con caché por huella y ejecución paralela por niveles."""
+
+    def __init__(
+        self, cache_dir: str = RUTA_CACHE_PIPELINE, max_workers: Optional[int] = None
+    ):
+        """
+        Inicializa un pipeline vacío.
+
+        Args:
+            cache_dir (str, optional): Carpeta donde se guardan los resultados
+                de cada etapa. None desactiva la caché.
+            max_workers (Optional[int], optional): Hilos por nivel del grafo.
+        """
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.etapas: Dict[str, Dict[str, Any]] = {}
+        # Resultado de la última ejecución: "cache" o "ejecutada" por etapa
+        self.estado: Dict[str, str] = {}
+
+    def etapa(
+        self,
+        nombre: str,
+        funcion: Callable,
+        entradas: Iterable[str] = (),
+        archivos: Iterable[str] = (),
+        parametros: Optional[Dict[str, Any]] = None,
+        dependencias: Iterable[Any] = (),
+    ) -> "PipelineDAG":
+        """
+        Declara una etapa.
+
+        La función recibe los resultados de `entradas` como argumentos
+        posicionales, en ese orden, y `parametros` como argumentos con nombre.
+
+        La huella solo incluye el código de `funcion`: el código que llama
+        debe declararse en `dependencias` y los valores de configuración que
+        usa deben pasarse en `parametros`, de lo contrario un cambio en ellos
+        no invalida la caché.
+
+        Args:
+            nombre (str): Nombre único de la etapa.
+            funcion (Callable): Función que calcula el resultado.
+            entradas (Iterable[str], optional): Etapas cuyos resultados recibe.
+            archivos (Iterable[str], optional): Archivos que lee la función.
+            parametros (Optional[Dict[str, Any]], optional): Argumentos con
+                nombre; deben ser serializables en JSON.
+            dependencias (Iterable[Any], optional): Módulos (se usa el
+                contenido de su archivo) o funciones que llama `funcion`.
+
+        Returns:
+            PipelineDAG: El mismo pipeline, para encadenar declaraciones.
+
+        Raises:
+            ValueError: Si la etapa ya existe.
+            KeyError: Si alguna entrada no está declarada.
+        """
+        if nombre in self.etapas:
+            raise ValueError(f"La etapa '{nombre}' ya está declarada.")
+        entradas = list(entradas)
+        faltantes = [e for e in entradas if e not in self.etapas]
+        if faltantes:
+            raise KeyError(f"Las siguientes etapas no están declaradas: {faltantes}")
+        self.etapas[nombre] = {
+            "funcion": funcion,
+            "entradas": entradas,
+            "archivos": list(archivos),
+            "parametros": dict(parametros or {}),
+            "dependencias": list(dependencias),
+        }
+        return self
+
+    def niveles(self) -> List[List[str]]:
+        """
+        Agrupa las etapas en niveles sin dependencias entre sí.
+
+        Como cada etapa solo puede depender de etapas declaradas antes, el
+        grafo no tiene ciclos.
+
+        Returns:
+            List[List[str]]: Etapas de cada nivel, en orden de ejecución.
+        """
+        nivel = {}
+        for nombre, etapa in self.etapas.items():
+            nivel[nombre] = 1 + max((nivel[e] for e in etapa["entradas"]), default=-1)
+        niveles = [[] for _ in range(max(nivel.values(), default=-1) + 1)]
+        for nombre, n in nivel.items():
+            niveles[n].append(nombre)
+        return niveles
+
+    def huellas(self) -> Dict[str, str]:
+        """
+        Calcula la huella de cada etapa.
+
+        Returns:
+            Dict[str, str]: Huella SHA-256 por etapa.
+        """
+        huellas = {}
+        for nombre, etapa in self.etapas.items():
+            contenido = json.dumps(
+                {
+                    "nombre": nombre,
+                    "funcion": _huella_funcion(etapa["funcion"]),
+                    "dependencias": [
+                        _huella_dependencia(d) for d in etapa["dependencias"]
+                    ],
+                    "parametros": etapa["parametros"],
+                    "archivos": [_huella_archivo(r) for r in etapa["archivos"]],
+                    "entradas": [huellas[e] for e in etapa["entradas"]],
+                },
+                sort_keys=True,
+                default=str,
+            )
+            huellas[nombre] = hashlib.sha256(contenido.encode()).hexdigest()
+        return huellas
+
+    def _ruta_cache(self, nombre: str, huella: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return Path(self.cache_dir) / f"{nombre}-{huella[:16]}.pkl"
+
+    def _guardar(self, ruta: Optional[Path], resultado: Any) -> None:
+        if ruta is None:
+            return
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        temporal = ruta.with_suffix(".tmp")
+        with open(temporal, "wb") as f:
+            pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # El reemplazo es atómico: nunca queda un resultado a medio escribir
+        os.replace(temporal, ruta)
+
+    def ejecutar(self, objetivos: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Ejecuta las etapas necesarias para obtener los objetivos.
+
+        Args:
+            objetivos (Optional[Iterable[str]], optional): Etapas cuyo
+                resultado se retorna. Por defecto, las que no son entrada de
+                ninguna otra.
+
+        Returns:
+            Dict[str, Any]: Resultado de cada objetivo.
+
+        Raises:
+            KeyError: Si algún objetivo no está declarado.
+        """
+        if objetivos is None:
+            usadas = {e for etapa in self.etapas.values() for e in etapa["entradas"]}
+            objetivos = [n for n in self.etapas if n not in usadas]
+        objetivos = list(objetivos)
+        faltantes = [o for o in objetivos if o not in self.etapas]
+        if faltantes:
+            raise KeyError(f"Las siguientes etapas no están declaradas: {faltantes}")
+
+        huellas = self.huellas()
+        rutas = {n: self._ruta_cache(n, h) for n, h in huellas.items()}
+        en_cache = {n for n, r in rutas.items() if r is not None and r.exists()}
+
+        # Se recorre el grafo desde los objetivos; una etapa en caché no
+        # necesita sus entradas.
+        a_ejecutar, a_cargar = set(), set()
+        pendientes = list(objetivos)
+        while pendientes:
+            nombre = pendientes.pop()
+            if nombre in a_ejecutar or nombre in a_cargar:
+                continue
+            if nombre in en_cache:
+                a_cargar.add(nombre)
+            else:
+                a_ejecutar.add(nombre)
+                pendientes.extend(self.etapas[nombre]["entradas"])
+
+        resultados = {}
+        for nombre in a_cargar:
+            with open(rutas[nombre], "rb") as f:
+                resultados[nombre] = pickle.load(f)
+
+        def correr(nombre):
+            etapa = self.etapas[nombre]
+            args = [resultados[e] for e in etapa["entradas"]]
+            resultado = etapa["funcion"](*args, **etapa["parametros"])
+            self._guardar(rutas[nombre], resultado)
+            return resultado
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for nivel in self.niveles():
+                nombres = [n for n in nivel if n in a_ejecutar]
+                for nombre, resultado in zip(nombres, executor.map(correr, nombres)):
+                    resultados[nombre] = resultado
+
+        self.estado = {n: "cache" for n in a_cargar}
+        self.estado.update({n: "ejecutada" for n in a_ejecutar})
+        return {o: resultados[o] for o in objetivos}
+
+
+def _leer_fuente(
+    ruta: str,
+    dtype: Optional[Dict[str, str]],
+    columnas: Optional[List[str]],
+    schema: Optional[Dict[str, Dict[str, Any]]],
+) -> pd.DataFrame:
+    """Lee y valida un archivo fuente."""
+    return read_employee_files.read_file(ruta, dtype, columnas, schema=schema)
+
+
+def _unir_y_promediar(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    column_key: str,
+    columna: str,
+    columnas: List[str],
+) -> pd.DataFrame:
+    """Une dos DataFrames por la clave y agrega una columna de promedio."""
+    df = read_feedback_files.merge_dataframe(df1, df2, column_key)
+    return read_employee_files.mean_columns(df, columna, columnas)
+
+
+def _label_encoding(df: pd.DataFrame, columnas: List[str]) -> pd.DataFrame:
+    """Codifica las columnas binarias; retorna solo esas columnas."""
+    return apply_label_encoding(df[columnas], columnas)[0]
+
+
+def _one_hot_encoding(df: pd.DataFrame, columnas: List[str]) -> pd.DataFrame:
+    """Codifica las columnas nominales; retorna solo las columnas indicadoras."""
+    return pd.get_dummies(df[columnas], columns=columnas, drop_first=False)
+
+
+def _combinar_codificaciones(
+    df: pd.DataFrame,
+    binarias: pd.DataFrame,
+    indicadoras: pd.DataFrame,
+    nominales: List[str],
+) -> pd.DataFrame:
+    """Reemplaza las columnas binarias y nominales por sus codificaciones."""
+    df = df.drop(columns=nominales).assign(**binarias)
+    return pd.concat([df, indicadoras], axis=1)
+
+
+def _reducir_tipos(df: pd.DataFrame, precision_float: str) -> pd.DataFrame:
+    """Convierte cada columna al tipo más pequeño que la representa."""
+    return reducir_tipos(df, precision_float)[0]
+
+
+def _podar_columnas(
+    df: pd.DataFrame, umbral_casi_constante: float, prefijos_one_hot: List[str]
+) -> pd.DataFrame:
+    """Descarta las columnas constantes, duplicadas y redundantes."""
+    return podar_columnas(
+        df,
+        umbral_casi_constante=umbral_casi_constante,
+        prefijos_one_hot=prefijos_one_hot,
+    )[0]
+
+
+def construir_pipeline_codificacion(
+    cache_dir: str = RUTA_CACHE_PIPELINE, max_workers: Optional[int] = None
+) -> PipelineDAG:
+    """
+    Declara el pipeline de `encoding_variables` (con One Hot Encoding) como DAG.
+
+    Las tres lecturas forman el primer nivel y se ejecutan en paralelo; el
+    Label Encoding y el One Hot Encoding son ramas independientes que se
+    combinan en la etapa "codificacion". La etapa "reduccion_tipos" convierte
+    cada columna al tipo más pequeño que la representa y la etapa final
+    "poda_columnas" descarta las columnas sin información.
+
+    Args:
+        cache_dir (str, optional): Carpeta de la caché de etapas.
+        max_workers (Optional[int], optional): Hilos por nivel.
+
+    Returns:
+        PipelineDAG: Pipeline listo para `ejecutar`.
+    """
+    pipeline = PipelineDAG(cache_dir, max_workers)
+    for fuente, ruta in RUTAS_FUENTES.items():
+        pipeline.etapa(
+            fuente,
+            _leer_fuente,
+            archivos=[ruta],
+            parametros={
+                "ruta": ruta,
+                "dtype": DTYPES_FUENTES.get(fuente),
+                "columnas": COLUMNAS_FUENTES.get(fuente),
+                "schema": ESQUEMAS.get(fuente),
+            },
+            dependencias=[read_employee_files, schema],
+        )
+    pipeline.etapa(
+        "encuesta_procesada",
+        _unir_y_promediar,
+        entradas=["general", "encuesta_empleados"],
+        parametros={
+            "column_key": EMPLOYEE_COLUMN_JOIN,
+            "columna": COLUMN_AVERAGE_EMPLOYEE_SATISFACTION,
+            "columnas": MEAN_COLUMNS,
+        },
+        dependencias=[read_employee_files, read_feedback_files, fast_join],
+    )
+    pipeline.etapa(
+        "feedback_jefes",
+        _unir_y_promediar,
+        entradas=["encuesta_procesada", "encuesta_jefes"],
+        parametros={
+            "column_key": EMPLOYEE_COLUMN_JOIN,
+            "columna": COLUMN_AVERAGE_MANAGER_FEEDBACK,
+            "columnas": MEAN_COLUMNS_FEEDBACK,
+        },
+        dependencias=[read_employee_files, read_feedback_files, fast_join],
+    )
+    pipeline.etapa(
+        "label_encoding",
+        _label_encoding,
+        entradas=["feedback_jefes"],
+        parametros={"columnas": COLUMNAS_BINARIAS},
+        dependencias=[encoding],
+    )
+    pipeline.etapa(
+        "one_hot_encoding",
+        _one_hot_encoding,
+        entradas=["feedback_jefes"],
+        parametros={"columnas": COLUMNAS_NOMINALES},
+    )
+    pipeline.etapa(
+        "codificacion",
+        _combinar_codificaciones,
+        entradas=["feedback_jefes", "label_encoding", "one_hot_encoding"],
+        parametros={"nominales": COLUMNAS_NOMINALES},
+    )
+    pipeline.etapa(
+        "reduccion_tipos",
+        _reducir_tipos,
+        entradas=["codificacion"],
+        parametros={"precision_float": PRECISION_FLOAT},
+        dependencias=[downcast],
+    )
+    pipeline.etapa(
+        "poda_columnas",
+        _podar_columnas,
+        entradas=["reduccion_tipos"],
+        parametros={
+            "umbral_casi_constante": UMBRAL_CASI_CONSTANTE,
+            "prefijos_one_hot": COLUMNAS_NOMINALES,
+        },
+        dependencias=[column_pruning],
+    )
+    return pipeline
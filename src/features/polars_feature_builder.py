@@ -0,0 +1,250 @@
+"""
+Módulo de feature engineering con el backend de Polars.
+
+Contiene las mismas funciones que `feature_builder`, escritas sobre
+`LazyFrame` de Polars para que las transformaciones se ejecuten en varios
+hilos y puedan encadenarse en un único plan optimizado. Cada función
+reproduce exactamente el resultado de su equivalente en pandas.
+"""
+
+from typing import List, Optional
+
+from src.preprocessing.polars_backend import (
+    get_categories,
+    get_columns,
+    import_polars,
+    to_lazy,
+)
+
+
+def _to_numeric(lf, column: str):
+    """Convierte una columna a número como `pd.to_numeric(errors="coerce")`."""
+    pl = import_polars()
+    if lf.collect_schema()[column].is_numeric():
+        return pl.col(column)
+    return pl.col(column).cast(pl.Float64, strict=False)
+
+
+def crear_categorias_edad(df):
+    """
+    Crea categorías de edad a partir de la columna 'edad'.
+
+    Args:
+        df (pl.LazyFrame): Datos con la columna 'edad'.
+
+    Returns:
+        pl.LazyFrame: Datos con la nueva columna 'grupo_edad'.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+
+    bins = [0, 18, 30, 50, 65, 100]
+    labels = ["Menor", "Joven", "Adulto", "Senior", "Jubilado"]
+
+    # Intervalos cerrados a la izquierda, igual que pd.cut(..., right=False)
+    expresion = pl.lit(None, dtype=pl.String)
+    for inicio, fin, label in reversed(list(zip(bins[:-1], bins[1:], labels))):
+        expresion = (
+            pl.when((pl.col("edad") >= inicio) & (pl.col("edad") < fin))
+            .then(pl.lit(label))
+            .otherwise(expresion)
+        )
+
+    return lf.with_columns(expresion.cast(pl.Enum(labels)).alias("grupo_edad"))
+
+
+def calcular_ratio_salario_edad(df):
+    """
+    Calcula el ratio entre salario y edad.
+
+    Args:
+        df (pl.LazyFrame): Datos con las columnas 'salario' y 'edad'.
+
+    Returns:
+        pl.LazyFrame: Datos con la nueva columna 'ratio_salario_edad'.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+    lf = lf.with_columns(_to_numeric(lf, "salario"), _to_numeric(lf, "edad"))
+    return lf.with_columns(
+        (pl.col("salario") / pl.col("edad")).round(2).alias("ratio_salario_edad")
+    )
+
+
+def crear_indice_satisfaccion(
+    df,
+    columnas_satisfaccion: Optional[List[str]] = None,
+    pesos: Optional[List[float]] = None,
+):
+    """
+    Crea un índice de satisfacción a partir de múltiples columnas.
+
+    Args:
+        df (pl.LazyFrame): Datos con columnas de satisfacción.
+        columnas_satisfaccion (Optional[List[str]], optional):
+            Lista de columnas a incluir en el índice.
+        pesos (Optional[List[float]], optional):
+            Lista de pesos para cada columna. Por defecto, pesos iguales.
+
+    Returns:
+        pl.LazyFrame: Datos con la nueva columna 'indice_satisfaccion'.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+
+    if columnas_satisfaccion is None:
+        columnas_satisfaccion = [
+            "satisfaccion_trabajo",
+            "satisfaccion_ambiente",
+            "satisfaccion_salario",
+        ]
+
+    columnas_existentes = [
+        col for col in columnas_satisfaccion if col in get_columns(lf)
+    ]
+    if not columnas_existentes:
+        raise ValueError(
+            f"Ninguna de las columnas {columnas_satisfaccion} existe en el DataFrame"
+        )
+
+    if pesos is None:
+        pesos = [1 / len(columnas_existentes)] * len(columnas_existentes)
+
+    if len(columnas_existentes) < len(columnas_satisfaccion):
+        indices = [columnas_satisfaccion.index(col) for col in columnas_existentes]
+        pesos = [pesos[i] for i in indices]
+        pesos = [p / sum(pesos) for p in pesos]
+
+    lf = lf.with_columns([_to_numeric(lf, col) for col in columnas_existentes])
+
+    # Misma suma acumulada que en pandas para obtener el mismo redondeo
+    indice = pl.lit(0.0)
+    for col, peso in zip(columnas_existentes, pesos):
+        indice = indice + pl.col(col) * peso
+
+    return lf.with_columns(indice.round(2).alias("indice_satisfaccion"))
+
+
+def crear_variables_dummy(
+    df, columnas: Optional[List[str]] = None, drop_first: bool = True
+):
+    """
+    Crea variables dummy a partir de variables categóricas.
+
+    A diferencia de `apply_one_hot_encoding`, conserva las columnas originales.
+
+    Args:
+        df (pl.LazyFrame): Datos con variables categóricas.
+        columnas (Optional[List[str]], optional):
+            Lista de columnas categóricas para convertir a dummy.
+            Por defecto: ['departamento', 'ciudad'].
+        drop_first (bool, optional): Si es True, elimina la primera categoría.
+
+    Returns:
+        pl.LazyFrame: Datos con nuevas columnas dummy.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+
+    if columnas is None:
+        columnas = ["departamento", "ciudad"]
+
+    columnas_existentes = [col for col in columnas if col in get_columns(lf)]
+    if not columnas_existentes:
+        raise ValueError(f"Ninguna de las columnas {columnas} existe en el DataFrame")
+
+    categorias = get_categories(lf, columnas_existentes)
+    inicio = 1 if drop_first else 0
+    dummies = [
+        (pl.col(col) == valor).fill_null(False).alias(f"{col}_{valor}")
+        for col in columnas_existentes
+        for valor in categorias[col][inicio:]
+    ]
+    return lf.with_columns(dummies)
+
+
+def crear_flags_riesgo(df):
+    """
+    Crea flags de riesgo y un score global de riesgo.
+
+    Args:
+        df (pl.LazyFrame): Datos con las columnas necesarias.
+
+    Returns:
+        pl.LazyFrame: Datos con nuevas columnas de flags y score de riesgo.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+    columnas = get_columns(lf)
+
+    reglas = [
+        ("satisfaccion_trabajo", "flag_baja_satisfaccion", 3),
+        ("salario", "flag_salario_bajo", 1500),
+        ("antiguedad", "flag_empleado_nuevo", 1),
+    ]
+
+    lf = lf.with_columns(
+        [_to_numeric(lf, origen) for origen, _, _ in reglas if origen in columnas]
+    )
+    flags = [
+        (
+            (pl.col(origen) < umbral).fill_null(False).cast(pl.Int64)
+            if origen in columnas
+            else pl.lit(0, dtype=pl.Int64)
+        ).alias(flag)
+        for origen, flag, umbral in reglas
+    ]
+    lf = lf.with_columns(flags)
+
+    return lf.with_columns(
+        pl.sum_horizontal([flag for _, flag, _ in reglas]).alias("score_riesgo")
+    )
+
+
+def seleccionar_mejores_caracteristicas(
+    df, columna_objetivo: str = "abandono", k: int = 5
+):
+    """
+    Selecciona las k mejores características para predecir la columna objetivo.
+
+    Args:
+        df (pl.LazyFrame): Datos con características y columna objetivo.
+        columna_objetivo (str, optional): Nombre de la columna objetivo.
+        k (int, optional): Número de características a seleccionar.
+
+    Returns:
+        pl.LazyFrame: Datos con las k mejores características y la columna objetivo.
+    """
+    # Importar dentro de la función para no depender de scikit-learn en todo el módulo
+    from sklearn.feature_selection import SelectKBest, f_classif
+
+    pl = import_polars()
+    lf = to_lazy(df)
+    schema = lf.collect_schema()
+
+    if columna_objetivo not in schema.names():
+        raise ValueError(
+            f"La columna objetivo '{columna_objetivo}' no existe en el DataFrame"
+        )
+
+    numericas = [
+        col
+        for col, tipo in schema.items()
+        if col != columna_objetivo and tipo.is_numeric()
+    ]
+    if not numericas:
+        raise ValueError("No hay columnas numéricas en el DataFrame")
+
+    datos = lf.select(
+        [pl.col(c).fill_null(0).fill_nan(0) for c in numericas]
+        + [pl.col(columna_objetivo)]
+    ).collect()
+
+    k = min(k, len(numericas))
+    selector = SelectKBest(f_classif, k=k)
+    selector.fit(datos.select(numericas).to_numpy(), datos[columna_objetivo])
+
+    selected_features = [
+        c for c, elegido in zip(numericas, selector.get_support()) if elegido
+    ]
+    return lf.select(selected_features + [columna_objetivo])
@@ -0,0 +1,199 @@
+"""
+Módulo para balancear las clases sin copiar la matriz de características.
+
+`Attrition` está desbalanceada (cerca de 16% de positivos). En lugar de
+duplicar filas del DataFrame, el remuestreo se representa sobre la matriz
+compartida:
+
+- `indices_sobremuestreo` / `indices_submuestreo`: arreglos de índices de
+  filas; `X[indices]` se materializa solo cuando el modelo lo necesita.
+- `pesos_balanceados`: un peso por fila (`sample_weight`), sin filas nuevas.
+- `sintetizar_smote`: solo las filas sintéticas, calculadas por lotes con
+  operaciones vectorizadas sobre el bloque numérico. Las filas originales no
+  se copian; por ejemplo, LightGBM acepta la lista `[X, X_sinteticas]` como
+  datos de un `Dataset`.
+
+Ejemplo:
+```python
+X, y, columnas = construir_matriz(pd.read_csv(RUTA_ENCODED_DATA))
+modelo.fit(X, y, sample_weight=pesos_balanceados(y))
+```
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Filas base procesadas por lote en `sintetizar_smote`.
+TAMANO_LOTE_SMOTE = 10_000
+
+
+def _clases(y: np.ndarray, clase_minoritaria=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Máscaras de la clase minoritaria y del resto."""
+    y = np.asarray(y)
+    valores, conteos = np.unique(y, return_counts=True)
+    if len(valores) < 2:
+        raise ValueError("El objetivo debe tener al menos dos clases.")
+    if clase_minoritaria is None:
+        clase_minoritaria = valores[np.argmin(conteos)]
+    minoria = y == clase_minoritaria
+    if not minoria.any():
+        raise ValueError(f"La clase '{clase_minoritaria}' no está en el objetivo.")
+    return minoria, ~minoria
+
+
+def _validar_proporcion(proporcion: float) -> None:
+    if not 0 < proporcion <= 1:
+        raise ValueError("La proporción debe estar en el intervalo (0, 1].")
+
+
+def indices_sobremuestreo(
+    y: np.ndarray,
+    proporcion: float = 1.0,
+    clase_minoritaria=None,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Índices de filas con la clase minoritaria repetida al azar.
+
+    Args:
+        y (np.ndarray): Objetivo.
+        proporcion (float, optional): Tamaño final de la clase minoritaria
+            respecto del resto (1.0 iguala ambas).
+        clase_minoritaria (optional): Clase a sobremuestrear. Por defecto,
+            la menos frecuente.
+        random_state (int, optional): Semilla.
+
+    Returns:
+        np.ndarray: Todas las filas originales seguidas de las repetidas.
+    """
+    _validar_proporcion(proporcion)
+    minoria, resto = _clases(y, clase_minoritaria)
+    faltantes = max(int(round(resto.sum() * proporcion)) - int(minoria.sum()), 0)
+    rng = np.random.default_rng(random_state)
+    extra = rng.choice(np.flatnonzero(minoria), faltantes, replace=True)
+    return np.concatenate([np.arange(len(minoria)), extra])
+
+
+def indices_submuestreo(
+    y: np.ndarray,
+    proporcion: float = 1.0,
+    clase_minoritaria=None,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Índices de filas con una muestra al azar del resto de clases.
+
+    Args:
+        y (np.ndarray): Objetivo.
+        proporcion (float, optional): Tamaño de la clase minoritaria respecto
+            del resto tras submuestrear (1.0 iguala ambas).
+        clase_minoritaria (optional): Clase que se conserva completa.
+        random_state (int, optional): Semilla.
+
+    Returns:
+        np.ndarray: Índices ordenados de las filas conservadas.
+    """
+    _validar_proporcion(proporcion)
+    minoria, resto = _clases(y, clase_minoritaria)
+    conservar = min(int(round(minoria.sum() / proporcion)), int(resto.sum()))
+    rng = np.random.default_rng(random_state)
+    elegidas = rng.choice(np.flatnonzero(resto), conservar, replace=False)
+    return np.sort(np.concatenate([np.flatnonzero(minoria), elegidas]))
+
+
+def pesos_balanceados(y: np.ndarray) -> np.ndarray:
+    """
+    Peso por fila inversamente proporcional a la frecuencia de su clase.
+
+    Equivale a `class_weight="balanced"` de scikit-learn:
+    n_filas / (n_clases * n_filas_de_la_clase).
+
+    Args:
+        y (np.ndarray): Objetivo.
+
+    Returns:
+        np.ndarray: Pesos (float64), uno por fila.
+    """
+    _, codigos, conteos = np.unique(
+        np.asarray(y), return_inverse=True, return_counts=True
+    )
+    return (len(codigos) / (len(conteos) * conteos))[codigos]
+
+
+def sintetizar_smote(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_sinteticas: Optional[int] = None,
+    k_vecinos: int = 5,
+    discretas: Optional[Sequence[int]] = None,
+    clase_minoritaria=None,
+    tamano_lote: int = TAMANO_LOTE_SMOTE,
+    random_state: int = 42,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Genera filas sintéticas de la clase minoritaria (SMOTE).
+
+    Cada fila sintética es x + u * (vecino - x), con x una fila minoritaria
+    al azar, vecino uno de sus k vecinos más cercanos de la misma clase y
+    u ~ U(0, 1). Los vecinos y las interpolaciones se calculan por lotes de
+    `tamano_lote` filas base. En las columnas `discretas` (binarias o one-hot)
+    no se interpola: se copia el valor de x o del vecino, el más cercano a la
+    interpolación.
+
+    Args:
+        X (np.ndarray): Matriz numérica sin valores faltantes.
+        y (np.ndarray): Objetivo.
+        n_sinteticas (Optional[int], optional): Filas a generar. Por defecto,
+            las necesarias para igualar la clase minoritaria con el resto.
+        k_vecinos (int, optional): Vecinos considerados por fila.
+        discretas (Optional[Sequence[int]], optional): Posiciones de las
+            columnas que no se interpolan.
+        clase_minoritaria (optional): Clase a sintetizar. Por defecto, la
+            menos frecuente.
+        tamano_lote (int, optional): Filas base por lote.
+        random_state (int, optional): Semilla.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Solo las filas sintéticas y su clase.
+
+    Raises:
+        ValueError: Si X tiene valores faltantes o la clase minoritaria tiene
+            menos de dos filas.
+    """
+    from sklearn.neighbors import NearestNeighbors
+
+    X = np.asarray(X)
+    y = np.asarray(y)
+    minoria, resto = _clases(y, clase_minoritaria)
+    X_min = X[minoria].astype(np.float64)
+    if np.isnan(X_min).any():
+        raise ValueError("La matriz no debe tener valores faltantes; impútelos antes.")
+    if len(X_min) < 2:
+        raise ValueError("La clase minoritaria necesita al menos dos filas.")
+    if n_sinteticas is None:
+        n_sinteticas = max(int(resto.sum()) - len(X_min), 0)
+
+    k = min(k_vecinos, len(X_min) - 1)
+    vecinos = NearestNeighbors(n_neighbors=k + 1).fit(X_min)
+    rng = np.random.default_rng(random_state)
+    base = rng.integers(0, len(X_min), n_sinteticas)
+    sinteticas = np.empty((n_sinteticas, X.shape[1]), dtype=np.float64)
+
+    for inicio in range(0, n_sinteticas, tamano_lote):
+        lote = base[inicio : inicio + tamano_lote]
+        # La primera columna de kneighbors es la propia fila
+        cercanos = vecinos.kneighbors(X_min[lote], return_distance=False)[:, 1:]
+        elegido = cercanos[np.arange(len(lote)), rng.integers(0, k, len(lote))]
+        x, vecino = X_min[lote], X_min[elegido]
+        u = rng.random((len(lote), 1))
+        bloque = x + u * (vecino - x)
+        if discretas is not None and len(discretas):
+            discretas = np.asarray(discretas)
+            bloque[:, discretas] = np.where(
+                u < 0.5, x[:, discretas], vecino[:, discretas]
+            )
+        sinteticas[inicio : inicio + len(lote)] = bloque
+
+    tipo = X.dtype if np.issubdtype(X.dtype, np.floating) else np.float64
+    return sinteticas.astype(tipo, copy=False), np.full(n_sinteticas, y[minoria][0])
@@ -0,0 +1,220 @@
+"""
+Módulo para crear variables en ventanas de tiempo sobre el historial de empleados.
+
+Extiende `mean_columns` y `crear_indice_satisfaccion` a datos con varios
+periodos por empleado (por ejemplo, el panel de `SnapshotStore.historia`):
+
+- Promedio de las últimas `w` meses de cada columna de satisfacción.
+- Cambio respecto del periodo anterior (por ejemplo, en `JobInvolvement`).
+- Pendiente por mes en las últimas `w` meses (por ejemplo, de `MonthlyIncome`).
+
+Los datos se ordenan una sola vez por (empleado, fecha). Cada ventana se
+resuelve con sumas acumuladas y búsquedas binarias sobre una clave entera
+(empleado, mes), sin recorrer los empleados uno por uno.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.config import EMPLOYEE_COLUMN_JOIN, MEAN_COLUMNS
+
+# Ventanas por defecto, en meses.
+VENTANAS_MESES = [3, 12]
+
+# Columnas por defecto de cada tipo de variable.
+COLUMNAS_MEDIA = MEAN_COLUMNS
+COLUMNAS_CAMBIO = ["JobInvolvement"]
+COLUMNAS_PENDIENTE = ["MonthlyIncome"]
+
+
+def _indice_mes(fechas: pd.Series) -> np.ndarray:
+    """Número de mes absoluto (año * 12 + mes) de cada fecha."""
+    fechas = pd.to_datetime(fechas)
+    return (fechas.dt.year * 12 + fechas.dt.month).to_numpy(dtype=np.int64)
+
+
+def _sumas_ventana(
+    valores: np.ndarray, inicio: np.ndarray, fin: np.ndarray
+) -> np.ndarray:
+    """Suma de `valores[inicio:fin]` para cada fila, con una suma acumulada."""
+    acumulado = np.concatenate([[0.0], np.cumsum(valores)])
+    return acumulado[fin] - acumulado[inicio]
+
+
+def _limites_ventanas(
+    codigos: np.ndarray, meses: np.ndarray, ventanas: List[int]
+) -> Dict[int, tuple]:
+    """
+    Calcula, para cada ventana, el rango de filas que cubre cada fila.
+
+    La clave `codigo * rango + mes` ordena las filas por empleado y mes, y
+    el relleno de `max(ventanas)` meses evita que una ventana alcance las
+    filas del empleado anterior.
+    """
+    desplazado = meses - meses.min() + max(ventanas)
+    rango = int(desplazado.max()) + 1
+    claves = codigos.astype(np.int64) * rango + desplazado
+
+    fin = np.searchsorted(claves, claves, side="right")
+    return {
+        w: (np.searchsorted(claves, claves - w + 1, side="left"), fin) for w in ventanas
+    }
+
+
+def calcular_ventanas(
+    df: pd.DataFrame,
+    columnas_media: Optional[List[str]] = None,
+    columnas_cambio: Optional[List[str]] = None,
+    columnas_pendiente: Optional[List[str]] = None,
+    ventanas: Optional[List[int]] = None,
+    column_fecha: str = "snapshot_date",
+    column_key: str = EMPLOYEE_COLUMN_JOIN,
+) -> pd.DataFrame:
+    """
+    Calcula las variables en ventanas de tiempo de cada empleado.
+
+    La ventana de `w` meses de una fila incluye los registros del mismo
+    empleado con fecha en los `w` meses calendario que terminan en su mes
+    (incluido). Los valores faltantes se ignoran.
+
+    Args:
+        df (pd.DataFrame): Historial con una fila por empleado y periodo.
+        columnas_media (Optional[List[str]], optional): Columnas a promediar.
+            Por defecto: `COLUMNAS_MEDIA`.
+        columnas_cambio (Optional[List[str]], optional): Columnas para el
+            cambio respecto del periodo anterior. Por defecto: `COLUMNAS_CAMBIO`.
+        columnas_pendiente (Optional[List[str]], optional): Columnas para la
+            pendiente por mes. Por defecto: `COLUMNAS_PENDIENTE`.
+        ventanas (Optional[List[int]], optional): Tamaños de ventana en meses.
+            Por defecto: `VENTANAS_MESES`.
+        column_fecha (str, optional): Columna con la fecha del periodo.
+        column_key (str, optional): Columna que identifica a cada empleado.
+
+    Returns:
+        pd.DataFrame: Historial ordenado por empleado y fecha, con las
+        columnas `<col>_media_<w>m`, `<col>_cambio` y `<col>_pendiente_<w>m`.
+    """
+    columnas_media = COLUMNAS_MEDIA if columnas_media is None else columnas_media
+    columnas_cambio = COLUMNAS_CAMBIO if columnas_cambio is None else columnas_cambio
+    columnas_pendiente = (
+        COLUMNAS_PENDIENTE if columnas_pendiente is None else columnas_pendiente
+    )
+    ventanas = VENTANAS_MESES if ventanas is None else ventanas
+
+    if not ventanas or min(ventanas) < 1:
+        raise ValueError("Las ventanas deben ser enteros mayores o iguales a 1.")
+    columnas = [column_key, column_fecha] + list(
+        dict.fromkeys(columnas_media + columnas_cambio + columnas_pendiente)
+    )
+    missing_cols = [col for col in columnas if col not in df.columns]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    # Único ordenamiento por (empleado, fecha)
+    resultado = df.sort_values(
+        [column_key, column_fecha], kind="stable", ignore_index=True
+    )
+    codigos, _ = pd.factorize(resultado[column_key], sort=True)
+    meses = _indice_mes(resultado[column_fecha])
+    limites = _limites_ventanas(codigos, meses, ventanas)
+    x = (meses - meses.min()).astype(float)
+
+    nuevas = {}
+    for col in columnas_media:
+        y = resultado[col].to_numpy(dtype=float, na_value=np.nan)
+        presente = ~np.isnan(y)
+        y0 = np.where(presente, y, 0.0)
+        for w in ventanas:
+            inicio, fin = limites[w]
+            n = _sumas_ventana(presente.astype(float), inicio, fin)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                nuevas[f"{col}_media_{w}m"] = _sumas_ventana(y0, inicio, fin) / n
+
+    # El periodo anterior es la fila previa del mismo empleado
+    primera = np.ones(len(codigos), dtype=bool)
+    primera[1:] = codigos[1:] != codigos[:-1]
+    for col in columnas_cambio:
+        y = resultado[col].to_numpy(dtype=float, na_value=np.nan)
+        cambio = np.full(len(y), np.nan)
+        cambio[1:] = y[1:] - y[:-1]
+        cambio[primera] = np.nan
+        nuevas[f"{col}_cambio"] = cambio
+
+    # Pendiente de mínimos cuadrados: (nΣxy - ΣxΣy) / (nΣx² - (Σx)²)
+    for col in columnas_pendiente:
+        y = resultado[col].to_numpy(dtype=float, na_value=np.nan)
+        presente = ~np.isnan(y)
+        xp, yp = np.where(presente, x, 0.0), np.where(presente, y, 0.0)
+        for w in ventanas:
+            inicio, fin = limites[w]
+            n = _sumas_ventana(presente.astype(float), inicio, fin)
+            sx = _sumas_ventana(xp, inicio, fin)
+            sy = _sumas_ventana(yp, inicio, fin)
+            sxy = _sumas_ventana(xp * yp, inicio, fin)
+            sxx = _sumas_ventana(xp * xp, inicio, fin)
+            denominador = n * sxx - sx**2
+            with np.errstate(invalid="ignore", divide="ignore"):
+                nuevas[f"{col}_pendiente_{w}m"] = np.where(
+                    denominador > 0, (n * sxy - sx * sy) / denominador, np.nan
+                )
+
+    return resultado.assign(**nuevas)
+
+
+def actualizar_ventanas(
+    df_historia: pd.DataFrame,
+    df_nuevo: pd.DataFrame,
+    column_fecha: str = "snapshot_date",
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Calcula las variables en ventana solo para un periodo nuevo.
+
+    Del historial solo se usan los meses que caben en la ventana más larga,
+    de modo que el costo no crece con la longitud del historial.
+
+    Ejemplo:
+    ```python
+    ventanas = calcular_ventanas(historia)
+    nuevas = actualizar_ventanas(historia, df_marzo)
+    ventanas = pd.concat([ventanas, nuevas], ignore_index=True)
+    ```
+
+    Args:
+        df_historia (pd.DataFrame): Historial previo, sin el periodo nuevo.
+        df_nuevo (pd.DataFrame): Registros del periodo nuevo.
+        column_fecha (str, optional): Columna con la fecha del periodo.
+        **kwargs: Argumentos adicionales de `calcular_ventanas`.
+
+    Returns:
+        pd.DataFrame: Registros del periodo nuevo con sus variables en ventana.
+    """
+    ventanas = kwargs.get("ventanas") or VENTANAS_MESES
+    meses_nuevos = _indice_mes(df_nuevo[column_fecha])
+    meses_historia = _indice_mes(df_historia[column_fecha])
+    if len(meses_historia) and meses_nuevos.min() <= meses_historia.max():
+        raise ValueError("El periodo nuevo debe ser posterior a todo el historial.")
+
+    # Meses que caben en la ventana más larga, más el último periodo de cada
+    # empleado para calcular el cambio
+    column_key = kwargs.get("column_key", EMPLOYEE_COLUMN_JOIN)
+    en_ventana = meses_historia > meses_nuevos.min() - max(ventanas)
+    ultimo = (
+        ~df_historia.sort_values(column_fecha, kind="stable")[column_key]
+        .duplicated(keep="last")
+        .reindex(df_historia.index)
+        .to_numpy()
+    )
+    recientes = df_historia[en_ventana | ultimo]
+    combinado = pd.concat(
+        [recientes.assign(__nuevo=False), df_nuevo.assign(__nuevo=True)],
+        ignore_index=True,
+    )
+    resultado = calcular_ventanas(combinado, column_fecha=column_fecha, **kwargs)
+    return (
+        resultado[resultado["__nuevo"]].drop(columns="__nuevo").reset_index(drop=True)
+    )
@@ -0,0 +1,255 @@
+"""
+Módulo para exportar los datos de entrenamiento en formatos binarios nativos.
+
+`exportar_datos_entrenamiento` construye una sola vez la matriz de
+características (float32) y la etiqueta `Attrition` a partir de la salida de
+`encoding_variables`, y guarda:
+
+- `lightgbm.bin`: `lightgbm.Dataset.save_binary`, con los bins ya calculados.
+- `xgboost.buffer`: `xgboost.DMatrix.save_binary`.
+- `manifiesto.json`: columnas, filas, huella y parámetros de LightGBM.
+
+Los archivos se guardan en una carpeta con la huella (SHA-256) de los datos,
+las columnas y los parámetros de binning. Si la carpeta ya existe no se
+vuelve a construir nada, de modo que cada prueba de un estudio de Optuna
+solo abre los archivos binarios, sin parsear el CSV ni recalcular los bins.
+
+Ejemplo:
+```python
+manifiesto = exportar_datos_entrenamiento(pd.read_csv(RUTA_ENCODED_DATA))
+dtrain = cargar_lightgbm(manifiesto)
+parametros = {"objective": "binary", **manifiesto["parametros_lightgbm"]}
+booster = lgb.train(parametros, dtrain)
+```
+
+LightGBM y XGBoost se importan dentro de las funciones que los usan.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.column_pruning import aplicar_poda
+from src.preprocessing.config import EMPLOYEE_COLUMN_JOIN, RUTA_DATOS_ENTRENAMIENTO
+
+# Columna objetivo.
+TARGET = "Attrition"
+
+# Columnas que no se usan como predictores además del objetivo.
+COLUMNAS_NO_PREDICTORAS = [EMPLOYEE_COLUMN_JOIN]
+
+# Formatos binarios soportados y el nombre de su archivo.
+ARCHIVOS = {"lightgbm": "lightgbm.bin", "xgboost": "xgboost.buffer"}
+
+# Parámetros de construcción del Dataset de LightGBM. Deben repetirse al
+# cargar el archivo binario y al entrenar.
+PARAMETROS_LIGHTGBM = {"max_bin": 255, "verbose": -1}
+
+
+def construir_matriz(
+    df: pd.DataFrame,
+    target: str = TARGET,
+    excluir: Optional[List[str]] = None,
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Separa la matriz de características y la etiqueta.
+
+    Args:
+        df (pd.DataFrame): Salida de `encoding_variables`.
+        target (str, optional): Columna objetivo, ya codificada como 0/1.
+        excluir (Optional[List[str]], optional): Columnas que no son
+            predictores. Por defecto, COLUMNAS_NO_PREDICTORAS.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[str]]: Matriz float32 (filas ×
+        características), etiqueta float32 y nombres de las características.
+
+    Raises:
+        KeyError: Si el objetivo no está en el DataFrame.
+        ValueError: Si alguna característica no es numérica.
+    """
+    excluir = COLUMNAS_NO_PREDICTORAS if excluir is None else excluir
+    if target not in df.columns:
+        raise KeyError(f"Las siguientes columnas no están en el DataFrame: {[target]}")
+
+    columnas = [c for c in df.columns if c != target and c not in excluir]
+    no_numericas = [
+        c
+        for c in columnas
+        if not (
+            pd.api.types.is_numeric_dtype(df[c]) or pd.api.types.is_bool_dtype(df[c])
+        )
+    ]
+    if no_numericas:
+        raise ValueError(f"Las siguientes columnas no son numéricas: {no_numericas}")
+
+    X = df[columnas].to_numpy(dtype=np.float32, na_value=np.nan)
+    y = df[target].to_numpy(dtype=np.float32)
+    return X, y, columnas
+
+
+def huella_datos(
+    X: np.ndarray, y: np.ndarray, columnas: List[str], parametros: Dict[str, Any]
+) -> str:
+    """
+    Huella SHA-256 del conjunto de características y sus parámetros.
+
+    Returns:
+        str: Huella en hexadecimal.
+    """
+    huella = hashlib.sha256()
+    huella.update(json.dumps([columnas, parametros], sort_keys=True).encode())
+    huella.update(np.ascontiguousarray(X).tobytes())
+    huella.update(np.ascontiguousarray(y).tobytes())
+    return huella.hexdigest()
+
+
+def _guardar_lightgbm(X, y, columnas, parametros, ruta):
+    import lightgbm as lgb
+
+    dataset = lgb.Dataset(
+        X, label=y, feature_name=columnas, params=parametros, free_raw_data=True
+    )
+    dataset.construct().save_binary(ruta)
+
+
+def _guardar_xgboost(X, y, columnas, ruta):
+    import xgboost as xgb
+
+    xgb.DMatrix(X, label=y, feature_names=columnas).save_binary(ruta)
+
+
+def exportar_datos_entrenamiento(
+    df: pd.DataFrame,
+    destino: str = RUTA_DATOS_ENTRENAMIENTO,
+    formatos: Iterable[str] = tuple(ARCHIVOS),
+    parametros_lightgbm: Optional[Dict[str, Any]] = None,
+    target: str = TARGET,
+    poda: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Guarda los datos de entrenamiento en los formatos binarios indicados.
+
+    Args:
+        df (pd.DataFrame): Salida de `encoding_variables`.
+        destino (str, optional): Carpeta base; los archivos se guardan en
+            `<destino>/<huella>`.
+        formatos (Iterable[str], optional): "lightgbm" y/o "xgboost".
+        parametros_lightgbm (Optional[Dict[str, Any]], optional): Parámetros
+            de construcción del Dataset. Por defecto, PARAMETROS_LIGHTGBM.
+        target (str, optional): Columna objetivo.
+        poda (Optional[Dict[str, Any]], optional): Reporte de
+            `column_pruning` (por ejemplo, `cargar_poda(RUTA_PODA_COLUMNAS)`);
+            sus columnas descartadas no se exportan.
+
+    Returns:
+        Dict[str, Any]: Manifiesto con "huella", "columnas", "filas",
+        "parametros_lightgbm" y "rutas" (ruta de cada formato).
+
+    Raises:
+        ValueError: Si algún formato no está soportado.
+    """
+    formatos = list(formatos)
+    no_soportados = [f for f in formatos if f not in ARCHIVOS]
+    if no_soportados:
+        raise ValueError(f"Formatos no soportados: {no_soportados}")
+    parametros = dict(parametros_lightgbm or PARAMETROS_LIGHTGBM)
+
+    if poda is not None:
+        df = aplicar_poda(df, poda)
+    X, y, columnas = construir_matriz(df, target)
+    huella = huella_datos(X, y, columnas, parametros)
+    carpeta = Path(destino) / huella[:16]
+    carpeta.mkdir(parents=True, exist_ok=True)
+
+    manifiesto = {"rutas": {}}
+    ruta_manifiesto = carpeta / "manifiesto.json"
+    if ruta_manifiesto.exists():
+        manifiesto = cargar_manifiesto(str(carpeta))
+
+    for formato in formatos:
+        ruta = carpeta / ARCHIVOS[formato]
+        if ruta.exists():
+            continue
+        # Se escribe en un archivo temporal nuevo: LightGBM no sobrescribe
+        # archivos existentes y así nunca queda un archivo a medio escribir
+        temporal = carpeta / f"{ARCHIVOS[formato]}.{os.getpid()}.tmp"
+        if temporal.exists():
+            temporal.unlink()
+        if formato == "lightgbm":
+            _guardar_lightgbm(X, y, columnas, parametros, str(temporal))
+        else:
+            _guardar_xgboost(X, y, columnas, str(temporal))
+        os.replace(temporal, ruta)
+
+    manifiesto.update(
+        {
+            "huella": huella,
+            "columnas": columnas,
+            "filas": int(len(y)),
+            "target": target,
+            "parametros_lightgbm": parametros,
+        }
+    )
+    for formato in formatos:
+        manifiesto["rutas"][formato] = str(carpeta / ARCHIVOS[formato])
+    ruta_manifiesto.write_text(
+        json.dumps(manifiesto, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return manifiesto
+
+
+def cargar_manifiesto(carpeta: str) -> Dict[str, Any]:
+    """
+    Carga el manifiesto de una exportación.
+
+    Args:
+        carpeta (str): Carpeta `<destino>/<huella>` de la exportación.
+
+    Returns:
+        Dict[str, Any]: Manifiesto de la exportación.
+    """
+    ruta = Path(carpeta) / "manifiesto.json"
+    if not ruta.exists():
+        raise FileNotFoundError(f"No se encontró el manifiesto en: {carpeta}")
+    return json.loads(ruta.read_text(encoding="utf-8"))
+
+
+def cargar_lightgbm(manifiesto: Dict[str, Any]):
+    """
+    Abre el Dataset binario de LightGBM con sus parámetros de construcción.
+
+    LightGBM reemplaza los espacios de los nombres de las características por
+    "_" (por ejemplo, "Department_Human_Resources").
+
+    Args:
+        manifiesto (Dict[str, Any]): Resultado de `exportar_datos_entrenamiento`.
+
+    Returns:
+        lightgbm.Dataset: Dataset listo para `lightgbm.train`.
+    """
+    import lightgbm as lgb
+
+    return lgb.Dataset(
+        manifiesto["rutas"]["lightgbm"], params=manifiesto["parametros_lightgbm"]
+    )
+
+
+def cargar_xgboost(manifiesto: Dict[str, Any]):
+    """
+    Abre el DMatrix binario de XGBoost.
+
+    Args:
+        manifiesto (Dict[str, Any]): Resultado de `exportar_datos_entrenamiento`.
+
+    Returns:
+        xgboost.DMatrix: DMatrix listo para `xgboost.train`.
+    """
+    import xgboost as xgb
+
+    return xgb.DMatrix(manifiesto["rutas"]["xgboost"])
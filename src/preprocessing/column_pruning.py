@@ -0,0 +1,268 @@
+"""
+Módulo para descartar las columnas sin información de la matriz codificada.
+
+`detectar_columnas_redundantes` revisa todas las columnas en una sola pasada
+sobre una matriz de hashes (un hash de 64 bits por celda) y encuentra:
+
+- Constantes: un solo valor, por ejemplo `EmployeeCount`, `StandardHours` y
+  `Over18` en general_data.csv.
+- Casi constantes: el valor más frecuente ocupa al menos
+  `umbral_casi_constante` de las filas.
+- Duplicadas: columnas con los mismos valores en todas las filas. Cada
+  columna se resume en una firma (suma ponderada de sus hashes con pesos
+  aleatorios por fila), de modo que solo se comparan las columnas con la
+  misma firma, en lugar de todos los pares.
+- Redundantes del One Hot Encoding: `apply_one_hot_encoding` usa
+  `drop_first=False`, así que en cada grupo completo (una y solo una columna
+  vale 1 en cada fila) la primera columna se deduce de las demás.
+
+El reporte guarda las columnas descartadas para repetir la misma poda al
+puntuar (`aplicar_poda`), sin volver a revisar los datos.
+
+Ejemplo:
+```python
+df, poda = podar_columnas(pd.read_csv(RUTA_ENCODED_DATA))
+guardar_poda(poda, RUTA_PODA_COLUMNAS)
+...
+df_nuevo = aplicar_poda(df_nuevo, cargar_poda(RUTA_PODA_COLUMNAS))
+```
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.config import (
+    COLUMNAS_NOMINALES,
+    EMPLOYEE_COLUMN_JOIN,
+    UMBRAL_CASI_CONSTANTE,
+)
+
+# Columnas que nunca se descartan.
+COLUMNAS_PROTEGIDAS = [EMPLOYEE_COLUMN_JOIN, "Attrition"]
+
+# Constantes del mezclador splitmix64 (biyectivo en 64 bits).
+_MEZCLA = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+
+
+def _mezclar(x: np.ndarray) -> np.ndarray:
+    """Distribuye los bits de cada valor uint64 sin generar colisiones."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * _MEZCLA[0]
+    x = x ^ (x >> np.uint64(27))
+    x = x * _MEZCLA[1]
+    return x ^ (x >> np.uint64(31))
+
+
+def _matriz_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Hash de cada celda (filas × columnas).
+
+    Las columnas numéricas y booleanas se comparan por valor (True es igual a
+    1), a partir de los bits de su representación float64; el resto usa
+    `pd.util.hash_array`.
+    """
+    hashes = np.empty(df.shape, dtype=np.uint64)
+    numericas = [
+        i
+        for i, c in enumerate(df.columns)
+        if pd.api.types.is_numeric_dtype(df.iloc[:, i])
+        or pd.api.types.is_bool_dtype(df.iloc[:, i])
+    ]
+    if numericas:
+        valores = df.iloc[:, numericas].to_numpy(dtype=np.float64, na_value=np.nan)
+        # Un solo patrón de bits para NaN y para el cero
+        valores = np.where(np.isnan(valores), np.nan, valores + 0.0)
+        hashes[:, numericas] = _mezclar(valores.view(np.uint64))
+    for i in sorted(set(range(df.shape[1])) - set(numericas)):
+        hashes[:, i] = pd.util.hash_array(df.iloc[:, i].to_numpy(dtype=object))
+    return hashes
+
+
+def _frecuencia_moda(hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Valores distintos y proporción del valor más frecuente por columna."""
+    ordenados = np.sort(hashes, axis=0)
+    nuevo = np.ones(ordenados.shape, dtype=bool)
+    nuevo[1:] = ordenados[1:] != ordenados[:-1]
+    # Largo de cada racha de valores iguales en las columnas ordenadas
+    filas = np.arange(len(ordenados))[:, None]
+    inicio = np.maximum.accumulate(np.where(nuevo, filas, 0), axis=0)
+    moda = (filas - inicio + 1).max(axis=0)
+    return nuevo.sum(axis=0), moda / len(ordenados)
+
+
+def _duplicadas(
+    hashes: np.ndarray, columnas: List[str], candidatas: List[int], proteger: List[str]
+) -> Dict[str, str]:
+    """Columnas iguales a otra anterior (o protegida), agrupadas por firma."""
+    pesos = np.random.default_rng(0).integers(
+        1, np.iinfo(np.int64).max, size=(2, len(hashes)), dtype=np.uint64
+    )
+    firmas = pesos @ hashes[:, candidatas]
+    grupos: Dict[Tuple[int, int], List[int]] = {}
+    for posicion, firma in zip(candidatas, firmas.T):
+        grupos.setdefault((int(firma[0]), int(firma[1])), []).append(posicion)
+
+    duplicadas = {}
+    for grupo in grupos.values():
+        # Primero las protegidas, para conservarlas
+        grupo.sort(key=lambda i: (columnas[i] not in proteger, i))
+        representantes: List[int] = []
+        for i in grupo:
+            igual = next(
+                (
+                    r
+                    for r in representantes
+                    if np.array_equal(hashes[:, r], hashes[:, i])
+                ),
+                None,
+            )
+            if igual is None or columnas[i] in proteger:
+                representantes.append(i)
+            else:
+                duplicadas[columnas[i]] = columnas[igual]
+    return duplicadas
+
+
+def detectar_columnas_redundantes(
+    df: pd.DataFrame,
+    umbral_casi_constante: Optional[float] = UMBRAL_CASI_CONSTANTE,
+    prefijos_one_hot: Optional[List[str]] = None,
+    proteger: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Encuentra las columnas constantes, casi constantes, duplicadas y
+    redundantes del One Hot Encoding.
+
+    Args:
+        df (pd.DataFrame): Matriz codificada.
+        umbral_casi_constante (Optional[float], optional): Proporción mínima
+            del valor más frecuente para considerar una columna casi
+            constante. None desactiva esta regla. Por defecto,
+            config.UMBRAL_CASI_CONSTANTE.
+        prefijos_one_hot (Optional[List[str]], optional): Columnas originales
+            del One Hot Encoding; sus indicadoras son "<prefijo>_<categoría>".
+            Por defecto, config.COLUMNAS_NOMINALES.
+        proteger (Optional[List[str]], optional): Columnas que nunca se
+            descartan. Por defecto, COLUMNAS_PROTEGIDAS.
+
+    Returns:
+        Dict[str, Any]: Reporte con "constantes", "casi_constantes",
+        "duplicadas" ({columna: columna que se conserva}), "one_hot"
+        ({prefijo: columna descartada}), "descartadas" y "columnas" (las que
+        se conservan), en el orden de `df`.
+
+    Raises:
+        ValueError: Si el umbral no está en el intervalo (0, 1].
+    """
+    if umbral_casi_constante is not None and not 0 < umbral_casi_constante <= 1:
+        raise ValueError("El umbral de casi constantes debe estar en (0, 1].")
+    prefijos_one_hot = (
+        COLUMNAS_NOMINALES if prefijos_one_hot is None else prefijos_one_hot
+    )
+    proteger = COLUMNAS_PROTEGIDAS if proteger is None else proteger
+    columnas = list(df.columns)
+
+    constantes, casi_constantes, duplicadas, one_hot = [], [], {}, {}
+    if len(df) and columnas:
+        hashes = _matriz_hashes(df)
+        distintos, frecuencia = _frecuencia_moda(hashes)
+        libres = [c not in proteger for c in columnas]
+        constantes = [
+            c for c, d, libre in zip(columnas, distintos, libres) if d == 1 and libre
+        ]
+        if umbral_casi_constante is not None:
+            casi_constantes = [
+                c
+                for c, d, f, libre in zip(columnas, distintos, frecuencia, libres)
+                if d > 1 and f >= umbral_casi_constante and libre
+            ]
+        descartadas = set(constantes) | set(casi_constantes)
+        candidatas = [i for i, c in enumerate(columnas) if c not in descartadas]
+        duplicadas = _duplicadas(hashes, columnas, candidatas, proteger)
+
+        descartadas |= set(duplicadas)
+        for prefijo in prefijos_one_hot:
+            grupo = [
+                c
+                for c in columnas
+                if c.startswith(f"{prefijo}_") and c not in descartadas
+            ]
+            if len(grupo) < 2 or grupo[0] in proteger:
+                continue
+            suma = df[grupo].to_numpy(dtype=np.float64, na_value=np.nan).sum(axis=1)
+            if np.all(suma == 1):
+                one_hot[prefijo] = grupo[0]
+
+    descartadas = set(constantes) | set(casi_constantes)
+    descartadas |= set(duplicadas) | set(one_hot.values())
+    return {
+        "constantes": constantes,
+        "casi_constantes": casi_constantes,
+        "duplicadas": duplicadas,
+        "one_hot": one_hot,
+        "descartadas": [c for c in columnas if c in descartadas],
+        "columnas": [c for c in columnas if c not in descartadas],
+    }
+
+
+def aplicar_poda(df: pd.DataFrame, reporte: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Descarta las columnas de un reporte ya calculado, por ejemplo al puntuar.
+
+    Las columnas del reporte que no están en `df` se ignoran.
+
+    Args:
+        df (pd.DataFrame): Datos con la misma codificación que los de
+            entrenamiento.
+        reporte (Dict[str, Any]): Reporte de `detectar_columnas_redundantes`.
+
+    Returns:
+        pd.DataFrame: `df` sin las columnas descartadas.
+    """
+    descartadas = [c for c in reporte["descartadas"] if c in df.columns]
+    return df.drop(columns=descartadas)
+
+
+def podar_columnas(df: pd.DataFrame, **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Detecta y descarta las columnas sin información.
+
+    Args:
+        df (pd.DataFrame): Matriz codificada.
+        **kwargs: Argumentos de `detectar_columnas_redundantes`.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, Any]]: `df` sin las columnas
+        descartadas y el reporte de `detectar_columnas_redundantes`.
+    """
+    reporte = detectar_columnas_redundantes(df, **kwargs)
+    return aplicar_poda(df, reporte), reporte
+
+
+def guardar_poda(reporte: Dict[str, Any], ruta: str) -> None:
+    """
+    Guarda el reporte de la poda en un archivo JSON.
+
+    Args:
+        reporte (Dict[str, Any]): Reporte de `detectar_columnas_redundantes`.
+        ruta (str): Ruta del archivo JSON.
+    """
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(reporte, f, ensure_ascii=False, indent=2)
+
+
+def cargar_poda(ruta: str) -> Dict[str, Any]:
+    """
+    Carga el reporte de una poda.
+
+    Args:
+        ruta (str): Ruta del reporte JSON.
+
+    Returns:
+        Dict[str, Any]: Reporte de `detectar_columnas_redundantes`.
+    """
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,150 @@
+"""
+Módulo para guardar la matriz de características en un archivo memory-mapped.
+
+La matriz numérica se guarda en un archivo `.npy` en orden de columnas
+(Fortran), de modo que cada columna ocupa un bloque contiguo del archivo.
+Junto a él se guarda un manifiesto `.json` con el nombre y tipo original de
+cada columna. Al abrir el archivo con `mmap_mode="r"` el sistema operativo
+comparte una única copia física entre todos los procesos del mismo host y solo
+se leen del disco las columnas que realmente se usan.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _rutas(ruta_base: str) -> Tuple[Path, Path]:
+    """Retorna las rutas del archivo `.npy` y de su manifiesto `.json`."""
+    return Path(f"{ruta_base}.npy"), Path(f"{ruta_base}.json")
+
+
+def save_feature_matrix(
+    df: pd.DataFrame, ruta_base: str, dtype: str = "float64"
+) -> Dict:
+    """
+    Guarda las columnas numéricas de un DataFrame como matriz memory-mapped.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame con columnas numéricas o booleanas.
+    ruta_base : str
+        Ruta sin extensión. Se crean `<ruta_base>.npy` y `<ruta_base>.json`.
+    dtype : str, optional
+        Tipo de la matriz en disco. Por defecto "float64", que representa
+        exactamente enteros de hasta 2**53.
+
+    Returns
+    -------
+    Dict
+        Manifiesto con las columnas, sus tipos originales y la forma.
+
+    Raises
+    ------
+    ValueError
+        Si el DataFrame contiene columnas no numéricas.
+    """
+    no_numericas = [
+        col
+        for col in df.columns
+        if not (
+            pd.api.types.is_numeric_dtype(df[col])
+            or pd.api.types.is_bool_dtype(df[col])
+        )
+    ]
+    if no_numericas:
+        raise ValueError(f"Las siguientes columnas no son numéricas: {no_numericas}")
+
+    ruta_npy, ruta_json = _rutas(ruta_base)
+    ruta_npy.parent.mkdir(parents=True, exist_ok=True)
+
+    matriz = np.lib.format.open_memmap(
+        ruta_npy, mode="w+", dtype=dtype, shape=df.shape, fortran_order=True
+    )
+    # Se escribe columna por columna para no crear una copia 2D en memoria
+    for i, col in enumerate(df.columns):
+        matriz[:, i] = df[col].to_numpy(dtype=dtype, na_value=np.nan)
+    matriz.flush()
+    del matriz
+
+    manifiesto = {
+        "columns": [str(col) for col in df.columns],
+        "dtypes": {str(col): str(df[col].dtype) for col in df.columns},
+        "shape": list(df.shape),
+        "dtype": dtype,
+    }
+    ruta_json.write_text(json.dumps(manifiesto, indent=2), encoding="utf-8")
+    return manifiesto
+
+
+def open_feature_matrix(ruta_base: str) -> Tuple[np.memmap, Dict]:
+    """
+    Abre la matriz de características en modo solo lectura sin copiarla.
+
+    Parameters
+    ----------
+    ruta_base : str
+        Ruta sin extensión usada en `save_feature_matrix`.
+
+    Returns
+    -------
+    Tuple[np.memmap, Dict]
+        Matriz memory-mapped de forma (filas, columnas) y su manifiesto.
+    """
+    ruta_npy, ruta_json = _rutas(ruta_base)
+    if not ruta_npy.exists() or not ruta_json.exists():
+        raise FileNotFoundError(f"No se encontró la matriz en: {ruta_base}")
+
+    manifiesto = json.loads(ruta_json.read_text(encoding="utf-8"))
+    matriz = np.load(ruta_npy, mmap_mode="r")
+    return matriz, manifiesto
+
+
+def load_feature_columns(
+    ruta_base: str, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Carga un subconjunto de columnas de la matriz memory-mapped.
+
+    Cada columna es un bloque contiguo del archivo, por lo que solo se leen
+    del disco las columnas solicitadas. Los tipos originales, incluidos los
+    tipos nullable de pandas, se restauran a partir del manifiesto.
+
+    Parameters
+    ----------
+    ruta_base : str
+        Ruta sin extensión usada en `save_feature_matrix`.
+    columns : List[str], optional
+        Columnas a cargar. Por defecto, todas.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame con las columnas solicitadas.
+    """
+    matriz, manifiesto = open_feature_matrix(ruta_base)
+    posiciones = {col: i for i, col in enumerate(manifiesto["columns"])}
+
+    if columns is None:
+        columns = manifiesto["columns"]
+
+    missing_cols = [col for col in columns if col not in posiciones]
+    if missing_cols:
+        raise KeyError(f"Las siguientes columnas no están en la matriz: {missing_cols}")
+
+    datos = {}
+    for col in columns:
+        columna = matriz[:, posiciones[col]]
+        dtype_original = pd.api.types.pandas_dtype(manifiesto["dtypes"][col])
+        if isinstance(dtype_original, pd.api.extensions.ExtensionDtype):
+            # Tipos nullable de pandas (Int64, boolean, ...): NaN vuelve a NA
+            columna = pd.array(columna, dtype=dtype_original)
+        elif manifiesto["dtype"] != dtype_original:
+            columna = columna.astype(dtype_original)
+        datos[col] = columna
+
+    return pd.DataFrame(datos, copy=False)
@@ -30,7 +30,64 @@ if not RUTA_GENERAL_PATH.exists():
 # Convertir rutas a string para uso posterior (por ejemplo, en pandas).
 RUTA_EMPLOYEE_SURVEY = str(RUTA_EMPLOYEE_SURVEY_PATH)
 RUTA_GENERAL = str(RUTA_GENERAL_PATH)
+RUTA_MANAGER_SURVEY = str(RUTA_MANAGER_SURVEY_PATH)
 RUTA_ENCODED_DATA = str(CLEAN_DATA_DIR / "encoded_data.csv")
+# Ruta base (sin extensión) de la matriz numérica memory-mapped.
+RUTA_ENCODED_MATRIX = str(CLEAN_DATA_DIR / "encoded_data")
+# Índice de llave primaria (EmployeeID) de encoded_data.csv.
+RUTA_ENCODED_INDEX = str(CLEAN_DATA_DIR / "encoded_data_pk.npy")
+# Tipos reducidos de encoded_data.csv (ver downcast), para leerlo con dtype.
+RUTA_TIPOS_ENCODED = str(CLEAN_DATA_DIR / "encoded_data_tipos.json")
+# Columnas descartadas de encoded_data.csv por column_pruning, para repetir
+# la poda al puntuar.
+RUTA_PODA_COLUMNAS = str(CLEAN_DATA_DIR / "encoded_data_poda.json")
+# Carpeta de los datasets binarios de LightGBM y XGBoost (ver training_data).
+RUTA_DATOS_ENTRENAMIENTO = str(CLEAN_DATA_DIR / "training")
+# Estadísticas del Target Encoding de las columnas nominales.
+RUTA_TARGET_ENCODING = str(CLEAN_DATA_DIR / "target_encoding.json")
+
+# Archivos fuente que se cargan en conjunto al inicio del pipeline.
+# RUTAS_FUENTES: Nombre lógico de cada fuente y la ruta de su archivo CSV.
+RUTAS_FUENTES = {
+    "general": RUTA_GENERAL,
+    "encuesta_empleados": RUTA_EMPLOYEE_SURVEY,
+    "encuesta_jefes": RUTA_MANAGER_SURVEY,
+}
+
+# Tipos de datos de las columnas numéricas de cada fuente.
+# DTYPES_FUENTES: Evita la inferencia de tipos al leer los archivos.
+# Las columnas con valores faltantes se declaran como float64.
+DTYPES_FUENTES = {
+    "general": {
+        "Age": "int64",
+        "DistanceFromHome": "int64",
+        "Education": "int64",
+        "EmployeeCount": "int64",
+        "EmployeeID": "int64",
+        "JobLevel": "int64",
+        "MonthlyIncome": "int64",
+        "NumCompaniesWorked": "float64",
+        "PercentSalaryHike": "int64",
+        "StandardHours": "int64",
+        "StockOptionLevel": "int64",
+        "TotalWorkingYears": "float64",
+        "TrainingTimesLastYear": "int64",
+        "YearsAtCompany": "int64",
+        "YearsSinceLastPromotion": "int64",
+        "YearsWithCurrManager": "int64",
+    },
+    "encuesta_empleados": {
+        "EmployeeID": "int64",
+        "EnvironmentSatisfaction": "float64",
+        "JobSatisfaction": "float64",
+        "WorkLifeBalance": "float64",
+    },
+    "encuesta_jefes": {
+        "EmployeeID": "int64",
+        "JobInvolvement": "int64",
+        "PerformanceRating": "int64",
+    },
+}
 
 # Columna clave para la unión de datasets.
 # EMPLOYEE_COLUMN_JOIN: Usada como clave primaria para unir los archivos de datos.
@@ -52,6 +109,14 @@ MEAN_COLUMNS = [
 # que serán promediadas para crear una nueva variable.
 MEAN_COLUMNS_FEEDBACK = ["JobInvolvement", "PerformanceRating"]
 
+# Columnas que se leen de cada fuente. Las fuentes que no aparecen se
+# leen completas.
+# COLUMNAS_FUENTES: De la encuesta de empleados solo se necesitan la
+# columna clave y las columnas de satisfacción.
+COLUMNAS_FUENTES = {
+    "encuesta_empleados": [EMPLOYEE_COLUMN_JOIN] + MEAN_COLUMNS,
+}
+
 # Validación: asegurar que MEAN_COLUMNS no esté vacía.
 if not MEAN_COLUMNS:
     raise ValueError("La lista MEAN_COLUMNS no debe estar vacía.")
@@ -65,3 +130,108 @@ COLUMN_AVERAGE_EMPLOYEE_SATISFACTION = "average_employee_satisfaction"
 # COLUMN_AVERAGE_MANAGER_FEEDBACK: Nombre asignado a la
 # nueva variable agregada en el paso 2
 COLUMN_AVERAGE_MANAGER_FEEDBACK = "average_manager_feedback"
+
+# Motor de ejecución usado para las uniones y promedios.
+# BACKEND_EJECUCION: "pandas" (en memoria), "duckdb" (SQL embebido que
+# puede usar disco cuando los datos no caben en memoria) o "polars"
+# (plan perezoso ejecutado en varios hilos).
+BACKEND_EJECUCION = "pandas"
+
+# Columnas categóricas del dataset combinado, según su codificación.
+# COLUMNAS_BINARIAS: Se codifican con Label Encoding.
+# COLUMNAS_NOMINALES: Se codifican con One Hot Encoding (o Target Encoding).
+COLUMNAS_BINARIAS = ["Attrition", "Gender", "Over18"]
+COLUMNAS_NOMINALES = [
+    "BusinessTravel",
+    "Department",
+    "EducationField",
+    "JobRole",
+    "MaritalStatus",
+]
+
+# Política de precisión de las columnas float al reducir tipos (ver downcast).
+# PRECISION_FLOAT: "float64" (conservar), "float32" o "exacta" (float32 solo
+# si no se pierde precisión).
+PRECISION_FLOAT = "float32"
+
+# Poda de columnas sin información (ver column_pruning).
+# UMBRAL_CASI_CONSTANTE: Se descartan las columnas cuyo valor más frecuente
+# ocupa al menos esta proporción de las filas.
+UMBRAL_CASI_CONSTANTE = 0.99
+
+# Directorio de la caché de resultados por etapa (ver pipeline_dag).
+# RUTA_CACHE_PIPELINE: Cada resultado se guarda con la huella de su etapa.
+RUTA_CACHE_PIPELINE = str(ROOT_DIR / "data" / "cache")
+
+# Directorio del historial de snapshots mensuales (ver snapshot_store).
+# RUTA_SNAPSHOTS: Cada extracto se guarda como una partición Parquet con
+# los cambios respecto del snapshot anterior.
+RUTA_SNAPSHOTS = str(ROOT_DIR / "data" / "snapshots")
+
+# Reglas de validez de los valores de cada fuente (ver data_profiler).
+# REGLAS_CALIDAD: Por columna, "valores" lista las categorías permitidas y
+# "rango" el mínimo y máximo permitidos (ambos incluidos).
+_RANGO_ENCUESTA = {"rango": [1, 4]}
+REGLAS_CALIDAD = {
+    "general": {
+        "Age": {"rango": [18, 100]},
+        "Attrition": {"valores": ["Yes", "No"]},
+        "Education": {"rango": [1, 5]},
+        "Gender": {"valores": ["Male", "Female"]},
+        "JobLevel": {"rango": [1, 5]},
+        "Over18": {"valores": ["Y"]},
+    },
+    "encuesta_empleados": {col: _RANGO_ENCUESTA for col in MEAN_COLUMNS},
+    "encuesta_jefes": {col: _RANGO_ENCUESTA for col in MEAN_COLUMNS_FEEDBACK},
+}
+
+# Límites plausibles de las columnas numéricas para el filtro 'rango' de
+# outlier_detector.screen_outliers (None si no hay límite).
+RANGOS_PLAUSIBLES = {
+    "Age": [18, 100],
+    "MonthlyIncome": [0, None],
+    "TotalWorkingYears": [0, 60],
+    "YearsAtCompany": [0, 60],
+    "NumCompaniesWorked": [0, None],
+}
+
+# Tasa máxima de valores nulos permitida por columna antes de detener el
+# pipeline (ver data_profiler.verificar_calidad).
+MAX_TASA_NULOS = 0.05
+
+# Esquema de cada fuente, validado al leer los archivos (ver schema).
+# ESQUEMAS: Por columna, tipo, nulabilidad, rango, categorías permitidas y
+# unicidad. Las columnas no listadas no se validan.
+_ID_EMPLEADO = {"tipo": "int", "unico": True}
+_ESCALA_ENCUESTA = {"tipo": "float", "nullable": True, "rango": [1, 4]}
+ESQUEMAS = {
+    "general": {
+        EMPLOYEE_COLUMN_JOIN: _ID_EMPLEADO,
+        "Age": {"tipo": "int", "rango": [18, 100]},
+        "Attrition": {"tipo": "str", "valores": ["Yes", "No"]},
+        "BusinessTravel": {
+            "tipo": "str",
+            "valores": ["Non-Travel", "Travel_Frequently", "Travel_Rarely"],
+        },
+        "Department": {
+            "tipo": "str",
+            "valores": ["Human Resources", "Research & Development", "Sales"],
+        },
+        "Education": {"tipo": "int", "rango": [1, 5]},
+        "Gender": {"tipo": "str", "valores": ["Male", "Female"]},
+        "JobLevel": {"tipo": "int", "rango": [1, 5]},
+        "MaritalStatus": {"tipo": "str", "valores": ["Divorced", "Married", "Single"]},
+        "MonthlyIncome": {"tipo": "int", "rango": [0, None]},
+        "NumCompaniesWorked": {"tipo": "float", "nullable": True, "rango": [0, None]},
+        "Over18": {"tipo": "str", "valores": ["Y"]},
+        "TotalWorkingYears": {"tipo": "float", "nullable": True, "rango": [0, None]},
+    },
+    "encuesta_empleados": {
+        EMPLOYEE_COLUMN_JOIN: _ID_EMPLEADO,
+        **{col: _ESCALA_ENCUESTA for col in MEAN_COLUMNS},
+    },
+    "encuesta_jefes": {
+        EMPLOYEE_COLUMN_JOIN: _ID_EMPLEADO,
+        **{col: {"tipo": "int", "rango": [1, 4]} for col in MEAN_COLUMNS_FEEDBACK},
+    },
+}
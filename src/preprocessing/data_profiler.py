@@ -0,0 +1,511 @@
+"""
+Módulo para perfilar la calidad de los archivos de datos en una sola lectura.
+
+Cada archivo se lee por bloques y, por cada columna, se acumulan en la misma
+pasada:
+
+- Filas, nulos y valores inválidos según `config.REGLAS_CALIDAD`.
+- Mínimo y máximo de las columnas numéricas.
+- Número aproximado de valores distintos con HyperLogLog.
+- Cuantiles aproximados con un sketch tipo KLL.
+- Frecuencias exactas mientras la columna tenga pocas categorías.
+
+Los sketches se pueden combinar (`merge`), de modo que los perfiles de
+bloques o de archivos procesados por separado se unen sin volver a leer los
+datos. `perfil_archivo` y `perfiles_fuentes` retornan esos perfiles
+combinables (`FileProfile`); `perfilar_archivo` y `perfilar_fuentes`, su
+reporte, un diccionario compacto serializable en JSON. `verificar_calidad`
+permite detener el pipeline si no se cumplen los umbrales.
+
+Ejemplo:
+```python
+enero = perfil_archivo("general_enero.csv", REGLAS_CALIDAD["general"])
+febrero = perfil_archivo("general_febrero.csv", REGLAS_CALIDAD["general"])
+reporte = enero.merge(febrero).report()
+```
+"""
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.config import MAX_TASA_NULOS, REGLAS_CALIDAD, RUTAS_FUENTES
+from src.preprocessing.read_employee_files import CHUNKSIZE
+
+# Número máximo de categorías con frecuencias exactas por columna.
+MAX_CATEGORIAS = 50
+
+# Cuantiles incluidos en el reporte de las columnas numéricas.
+CUANTILES = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+
+def _hash(valores: np.ndarray) -> np.ndarray:
+    """Hash de 64 bits estable (clave fija) de cada valor."""
+    return pd.util.hash_array(valores)
+
+
+class HyperLogLog:
+    """
+    Sketch HyperLogLog para contar valores distintos de forma aproximada.
+
+    Usa 2**p registros; el error relativo típico es 1.04 / sqrt(2**p)
+    (alrededor de 1.6 % con p=12).
+    """
+
+    def __init__(self, p: int = 12):
+        """
+        Inicializa los registros.
+
+        Args:
+            p (int, optional): Bits del hash usados para elegir el registro.
+        """
+        if not 4 <= p <= 16:
+            raise ValueError("p debe estar entre 4 y 16.")
+        self.p = p
+        self.registros = np.zeros(2**p, dtype=np.uint8)
+
+    def add(self, valores: np.ndarray) -> None:
+        """Agrega un arreglo de valores (ya sin nulos)."""
+        if len(valores) == 0:
+            return
+        hashes = _hash(valores)
+        bits_resto = 64 - self.p
+        indice = (hashes >> np.uint64(bits_resto)).astype(np.int64)
+        resto = hashes & np.uint64((1 << bits_resto) - 1)
+        # Posición del primer bit en 1 del resto; frexp es exacto hasta 2**53
+        longitud = np.frexp(resto.astype(np.float64))[1]
+        rango = (bits_resto - longitud + 1).astype(np.uint8)
+        np.maximum.at(self.registros, indice, rango)
+
+    def merge(self, otro: "HyperLogLog") -> "HyperLogLog":
+        """Combina otro sketch con la misma precisión."""
+        if otro.p != self.p:
+            raise ValueError("Solo se pueden combinar sketches con el mismo p.")
+        self.registros = np.maximum(self.registros, otro.registros)
+        return self
+
+    def count(self) -> int:
+        """Retorna el número estimado de valores distintos."""
+        m = len(self.registros)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimado = alpha * m * m / np.sum(2.0 ** -self.registros.astype(np.float64))
+        vacios = int(np.sum(self.registros == 0))
+        # Corrección para conteos pequeños (linear counting)
+        if estimado <= 2.5 * m and vacios > 0:
+            estimado = m * np.log(m / vacios)
+        return int(round(estimado))
+
+
+class KLLSketch:
+    """
+    Sketch de cuantiles tipo KLL.
+
+    Los valores se guardan en compactadores por nivel; un valor del nivel `h`
+    representa 2**h valores originales. Cuando un nivel supera su capacidad se
+    ordena y se conserva un elemento de cada par (con desplazamiento
+    aleatorio) en el nivel siguiente. Con `k=200` el error de rango es
+    cercano al 1 %.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        """
+        Inicializa el sketch.
+
+        Args:
+            k (int, optional): Capacidad de cada compactador.
+            seed (int, optional): Semilla para los desplazamientos aleatorios.
+        """
+        self.k = k
+        self.niveles: List[np.ndarray] = [np.empty(0)]
+        self.n = 0
+        self._rng = np.random.default_rng(seed)
+
+    def _compactar(self) -> None:
+        """Compacta los niveles que superan su capacidad."""
+        h = 0
+        while h < len(self.niveles):
+            nivel = self.niveles[h]
+            if len(nivel) > self.k:
+                nivel = np.sort(nivel)
+                # Con tamaño impar, el último valor se queda en el nivel
+                par = len(nivel) - len(nivel) % 2
+                desplazamiento = int(self._rng.integers(2))
+                promovidos = nivel[desplazamiento:par:2]
+                self.niveles[h] = nivel[par:]
+                if h + 1 == len(self.niveles):
+                    self.niveles.append(np.empty(0))
+                self.niveles[h + 1] = np.concatenate([self.niveles[h + 1], promovidos])
+            h += 1
+
+    def add(self, valores: np.ndarray) -> None:
+        """Agrega un arreglo de valores numéricos (ya sin nulos)."""
+        if len(valores) == 0:
+            return
+        self.n += len(valores)
+        self.niveles[0] = np.concatenate(
+            [self.niveles[0], np.asarray(valores, dtype=np.float64)]
+        )
+        self._compactar()
+
+    def merge(self, otro: "KLLSketch") -> "KLLSketch":
+        """Combina otro sketch nivel por nivel."""
+        for h, nivel in enumerate(otro.niveles):
+            if h == len(self.niveles):
+                self.niveles.append(np.empty(0))
+            self.niveles[h] = np.concatenate([self.niveles[h], nivel])
+        self.n += otro.n
+        self._compactar()
+        return self
+
+    def quantiles(self, qs: List[float]) -> List[Optional[float]]:
+        """Retorna los cuantiles aproximados indicados (entre 0 y 1)."""
+        if self.n == 0:
+            return [None] * len(qs)
+        valores = np.concatenate(self.niveles)
+        pesos = np.concatenate(
+            [np.full(len(nivel), 2.0**h) for h, nivel in enumerate(self.niveles)]
+        )
+        orden = np.argsort(valores, kind="stable")
+        valores, acumulado = valores[orden], np.cumsum(pesos[orden])
+        posiciones = np.searchsorted(
+            acumulado, np.asarray(qs) * acumulado[-1], side="left"
+        )
+        posiciones = np.minimum(posiciones, len(valores) - 1)
+        return [float(v) for v in valores[posiciones]]
+
+
+class ColumnProfile:
+    """Estadísticas acumuladas de una columna."""
+
+    def __init__(self, numerica: bool, regla: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el perfil.
+
+        Args:
+            numerica (bool): Si la columna se perfila como numérica.
+            regla (Optional[Dict[str, Any]], optional): Regla de validez con
+                las claves "valores" (lista permitida) y/o "rango" (mínimo y
+                máximo, ambos incluidos).
+        """
+        self.numerica = numerica
+        self.regla = regla or {}
+        self.filas = 0
+        self.nulos = 0
+        self.invalidos = 0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+        self.hll = HyperLogLog()
+        self.kll = KLLSketch() if numerica else None
+        self.frecuencias: Optional[pd.Series] = pd.Series(dtype="int64")
+
+    def update(self, serie: pd.Series) -> None:
+        """Actualiza el perfil con un bloque de la columna."""
+        presentes = serie.notna().to_numpy()
+        self.filas += len(serie)
+        self.nulos += int((~presentes).sum())
+        valores = serie[presentes]
+
+        invalidos = np.zeros(len(valores), dtype=bool)
+        if self.numerica:
+            numeros = pd.to_numeric(valores, errors="coerce").to_numpy(dtype=np.float64)
+            no_numericos = np.isnan(numeros)
+            invalidos |= no_numericos
+            numeros = numeros[~no_numericos]
+            if len(numeros):
+                self.minimo = min(self.minimo, float(numeros.min()))
+                self.maximo = max(self.maximo, float(numeros.max()))
+            self.kll.add(numeros)
+            self.hll.add(numeros)
+            claves = pd.Series(numeros)
+        else:
+            claves = valores.astype(str)
+            self.hll.add(claves.to_numpy(dtype=object))
+
+        if "valores" in self.regla:
+            invalidos |= ~valores.isin(self.regla["valores"]).to_numpy()
+        if "rango" in self.regla:
+            minimo, maximo = self.regla["rango"]
+            numeros = pd.to_numeric(valores, errors="coerce")
+            invalidos |= ~numeros.between(minimo, maximo).to_numpy(
+                dtype=bool, na_value=False
+            )
+        self.invalidos += int(invalidos.sum())
+
+        if self.frecuencias is not None:
+            self.frecuencias = self.frecuencias.add(
+                claves.value_counts(), fill_value=0
+            ).astype("int64")
+            if len(self.frecuencias) > MAX_CATEGORIAS:
+                self.frecuencias = None
+
+    def merge(self, otro: "ColumnProfile") -> "ColumnProfile":
+        """Combina el perfil de otro bloque o archivo de la misma columna."""
+        if otro.numerica != self.numerica:
+            raise ValueError(
+                "Solo se pueden combinar perfiles numéricos con numéricos y "
+                "categóricos con categóricos."
+            )
+        self.filas += otro.filas
+        self.nulos += otro.nulos
+        self.invalidos += otro.invalidos
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        self.hll.merge(otro.hll)
+        if self.kll is not None and otro.kll is not None:
+            self.kll.merge(otro.kll)
+        if self.frecuencias is None or otro.frecuencias is None:
+            self.frecuencias = None
+        else:
+            self.frecuencias = self.frecuencias.add(
+                otro.frecuencias, fill_value=0
+            ).astype("int64")
+            if len(self.frecuencias) > MAX_CATEGORIAS:
+                self.frecuencias = None
+        return self
+
+    def report(self) -> Dict[str, Any]:
+        """Retorna el resumen de la columna como diccionario."""
+        reporte = {
+            "tipo": "numerica" if self.numerica else "categorica",
+            "filas": self.filas,
+            "nulos": self.nulos,
+            "tasa_nulos": self.nulos / self.filas if self.filas else 0.0,
+            "distintos_aprox": self.hll.count(),
+            "invalidos": self.invalidos,
+        }
+        if self.numerica and self.kll.n:
+            reporte["min"] = self.minimo
+            reporte["max"] = self.maximo
+            reporte["cuantiles"] = dict(
+                zip([str(q) for q in CUANTILES], self.kll.quantiles(CUANTILES))
+            )
+        if self.frecuencias is not None:
+            frecuencias = self.frecuencias.sort_index()
+            reporte["frecuencias"] = {
+                str(valor): int(n) for valor, n in frecuencias.items()
+            }
+        return reporte
+
+
+class FileProfile:
+    """
+    Perfil combinable de un archivo o de un conjunto de bloques.
+
+    Ejemplo:
+    ```python
+    perfil = FileProfile(REGLAS_CALIDAD["general"])
+    for chunk in pd.read_csv(RUTA_GENERAL, chunksize=100_000):
+        perfil.update(chunk)
+    perfil.merge(otro_perfil).report()
+    ```
+    """
+
+    def __init__(self, reglas: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Inicializa un perfil vacío.
+
+        Args:
+            reglas (Optional[Dict[str, Dict[str, Any]]], optional): Reglas de
+                validez por columna (ver `ColumnProfile`).
+        """
+        self.reglas = reglas or {}
+        self.filas = 0
+        self.columnas: Dict[str, ColumnProfile] = {}
+
+    def update(self, chunk: pd.DataFrame) -> "FileProfile":
+        """Actualiza el perfil con un bloque de filas."""
+        self.filas += len(chunk)
+        for col in chunk.columns:
+            if col not in self.columnas:
+                # El tipo se decide con el primer bloque; los valores no
+                # numéricos de bloques siguientes se cuentan como inválidos
+                numerica = pd.api.types.is_numeric_dtype(chunk[col])
+                self.columnas[col] = ColumnProfile(numerica, self.reglas.get(col))
+            self.columnas[col].update(chunk[col])
+        return self
+
+    def merge(self, otro: "FileProfile") -> "FileProfile":
+        """
+        Combina el perfil de otro bloque o archivo con las mismas columnas.
+
+        Una columna que solo está en uno de los perfiles se copia tal cual.
+
+        Raises:
+            ValueError: Si una columna es numérica en un perfil y categórica
+                en el otro.
+        """
+        self.filas += otro.filas
+        for col, perfil in otro.columnas.items():
+            if col in self.columnas:
+                self.columnas[col].merge(perfil)
+            else:
+                self.columnas[col] = copy.deepcopy(perfil)
+        return self
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Retorna el reporte del perfil.
+
+        Returns:
+            Dict[str, Any]: Número de filas y perfil de cada columna.
+        """
+        return {
+            "filas": self.filas,
+            "columnas": {col: perfil.report() for col, perfil in self.columnas.items()},
+        }
+
+
+def perfil_archivo(
+    ruta: str,
+    reglas: Optional[Dict[str, Dict[str, Any]]] = None,
+    chunksize: int = CHUNKSIZE,
+) -> FileProfile:
+    """
+    Perfila un archivo CSV en una sola lectura por bloques.
+
+    Args:
+        ruta (str): Ruta al archivo CSV.
+        reglas (Optional[Dict[str, Dict[str, Any]]], optional): Reglas de
+            validez por columna (ver `ColumnProfile`).
+        chunksize (int, optional): Filas por bloque.
+
+    Returns:
+        FileProfile: Perfil combinable con los de otros archivos.
+
+    Raises:
+        KeyError: Si alguna columna con regla no está en el archivo.
+    """
+    perfil = FileProfile(reglas)
+    for chunk in pd.read_csv(ruta, chunksize=chunksize):
+        perfil.update(chunk)
+
+    faltantes = [col for col in perfil.reglas if col not in perfil.columnas]
+    if faltantes:
+        raise KeyError(f"Las siguientes columnas no están en el archivo: {faltantes}")
+    return perfil
+
+
+def perfilar_archivo(
+    ruta: str,
+    reglas: Optional[Dict[str, Dict[str, Any]]] = None,
+    chunksize: int = CHUNKSIZE,
+) -> Dict[str, Any]:
+    """
+    Reporte del perfil de un archivo CSV (ver `perfil_archivo`).
+
+    Returns:
+        Dict[str, Any]: Reporte con el número de filas y el perfil de cada
+        columna.
+    """
+    return perfil_archivo(ruta, reglas, chunksize).report()
+
+
+def perfiles_fuentes(
+    rutas: Optional[Dict[str, str]] = None,
+    reglas: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+    chunksize: int = CHUNKSIZE,
+    max_workers: Optional[int] = None,
+) -> Dict[str, FileProfile]:
+    """
+    Perfila varios archivos en paralelo.
+
+    Args:
+        rutas (Optional[Dict[str, str]], optional): Nombre lógico y ruta de
+            cada archivo. Por defecto: `config.RUTAS_FUENTES`.
+        reglas (Optional[Dict[str, Dict[str, Dict[str, Any]]]], optional):
+            Reglas por fuente y columna. Por defecto: `config.REGLAS_CALIDAD`.
+        chunksize (int, optional): Filas por bloque.
+        max_workers (Optional[int], optional): Número máximo de hilos.
+
+    Returns:
+        Dict[str, FileProfile]: Perfil combinable de cada fuente.
+    """
+    rutas = RUTAS_FUENTES if rutas is None else rutas
+    reglas = REGLAS_CALIDAD if reglas is None else reglas
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            nombre: executor.submit(perfil_archivo, ruta, reglas.get(nombre), chunksize)
+            for nombre, ruta in rutas.items()
+        }
+        return {nombre: future.result() for nombre, future in futures.items()}
+
+
+def perfilar_fuentes(
+    rutas: Optional[Dict[str, str]] = None,
+    reglas: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+    chunksize: int = CHUNKSIZE,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Reporte del perfil de varios archivos (ver `perfiles_fuentes`).
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Reporte de cada fuente.
+    """
+    perfiles = perfiles_fuentes(rutas, reglas, chunksize, max_workers)
+    return {nombre: perfil.report() for nombre, perfil in perfiles.items()}
+
+
+def problemas_calidad(
+    reportes: Dict[str, Dict[str, Any]],
+    max_tasa_nulos: float = MAX_TASA_NULOS,
+    max_invalidos: int = 0,
+) -> List[str]:
+    """
+    Lista las columnas que no cumplen los umbrales de calidad.
+
+    Args:
+        reportes (Dict[str, Dict[str, Any]]): Resultado de `perfilar_fuentes`.
+        max_tasa_nulos (float, optional): Tasa máxima de nulos por columna.
+        max_invalidos (int, optional): Número máximo de valores inválidos.
+
+    Returns:
+        List[str]: Descripción de cada problema encontrado.
+    """
+    problemas = []
+    for fuente, reporte in reportes.items():
+        for col, perfil in reporte["columnas"].items():
+            if perfil["tasa_nulos"] > max_tasa_nulos:
+                problemas.append(
+                    f"{fuente}.{col}: tasa de nulos {perfil['tasa_nulos']:.2%} "
+                    f"> {max_tasa_nulos:.2%}"
+                )
+            if perfil["invalidos"] > max_invalidos:
+                problemas.append(
+                    f"{fuente}.{col}: {perfil['invalidos']} valores inválidos"
+                )
+    return problemas
+
+
+def verificar_calidad(
+    reportes: Dict[str, Dict[str, Any]],
+    max_tasa_nulos: float = MAX_TASA_NULOS,
+    max_invalidos: int = 0,
+) -> None:
+    """
+    Detiene el pipeline si algún archivo no cumple los umbrales de calidad.
+
+    Ejemplo:
+    ```python
+    reportes = perfilar_fuentes()
+    verificar_calidad(reportes)
+    df = procesar_feedback_jefes()
+    ```
+
+    Args:
+        reportes (Dict[str, Dict[str, Any]]): Resultado de `perfilar_fuentes`.
+        max_tasa_nulos (float, optional): Tasa máxima de nulos por columna.
+        max_invalidos (int, optional): Número máximo de valores inválidos.
+
+    Raises:
+        ValueError: Con el resumen de los problemas encontrados.
+    """
+    problemas = problemas_calidad(reportes, max_tasa_nulos, max_invalidos)
+    if problemas:
+        raise ValueError(
+            "Los datos no cumplen los umbrales de calidad:\n- " + "\n- ".join(problemas)
+        )
@@ -0,0 +1,192 @@
+"""
+Módulo para reducir los tipos de datos de un DataFrame numérico.
+
+Tras el Label Encoding y el One Hot Encoding casi todas las columnas caben en
+int8, bool o float32, pero se guardan como int64 o float64. `reducir_tipos`
+calcula el mínimo y el máximo de todas las columnas enteras en una sola
+pasada sobre la matriz de valores y elige para cada una el entero con signo
+(sin signo, si la columna ya lo es) más pequeño que contiene su rango. Si
+ninguno lo contiene, la columna conserva su tipo.
+
+Las columnas float se tratan según `precision_float`:
+
+- "float64": se conservan.
+- "float32": se convierten a float32 (pérdida de precisión aceptada).
+- "exacta": se convierten a float32 solo si todos sus valores se
+  representan sin pérdida.
+
+En todos los casos, una columna float sin faltantes y con solo valores
+enteros se convierte al entero más pequeño que la contiene. Las columnas no
+numéricas y las booleanas no se modifican.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.config import PRECISION_FLOAT
+
+# Enteros candidatos, de menor a mayor tamaño.
+TIPOS_ENTEROS = [np.int8, np.int16, np.int32, np.int64]
+TIPOS_SIN_SIGNO = [np.uint8, np.uint16, np.uint32, np.uint64]
+
+# Políticas admitidas para las columnas float.
+PRECISIONES_FLOAT = ("float64", "float32", "exacta")
+
+
+def _tipos_enteros(
+    minimos: List[int], maximos: List[int], candidatos: List[type] = TIPOS_ENTEROS
+) -> List[Optional[str]]:
+    """
+    Entero más pequeño de `candidatos` que contiene cada rango [mínimo,
+    máximo], o None si ninguno lo contiene.
+
+    Los límites se comparan como enteros de Python, sin redondeos de float.
+    """
+    limites = [(int(np.iinfo(t).min), int(np.iinfo(t).max)) for t in candidatos]
+    cabe = np.array(
+        [
+            [lo <= mn and mx <= hi for lo, hi in limites]
+            for mn, mx in zip(minimos, maximos)
+        ],
+        dtype=bool,
+    ).reshape(len(minimos), len(candidatos))
+    return [
+        np.dtype(candidatos[i]).name if fila.any() else None
+        for i, fila in zip(cabe.argmax(axis=1), cabe)
+    ]
+
+
+def reducir_tipos(
+    df: pd.DataFrame,
+    precision_float: str = PRECISION_FLOAT,
+    columnas: Optional[List[str]] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Convierte cada columna numérica al tipo más pequeño que la representa.
+
+    Las columnas enteras sin signo se reducen a enteros sin signo. Si ningún
+    entero contiene el rango de una columna (por ejemplo, un float entero de
+    1e20), la columna conserva su tipo.
+
+    Args:
+        df (pd.DataFrame): Datos a reducir.
+        precision_float (str, optional): "float64", "float32" o "exacta".
+            Por defecto, config.PRECISION_FLOAT.
+        columnas (Optional[List[str]], optional): Columnas a revisar. Por
+            defecto, todas.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, Any]]: Copia de `df` con los nuevos
+        tipos y un reporte con "bytes_antes", "bytes_despues" y "tipos"
+        (el tipo final de cada columna revisada).
+
+    Raises:
+        KeyError: Si alguna columna no está en el DataFrame.
+        ValueError: Si la política de precisión no es válida.
+    """
+    if precision_float not in PRECISIONES_FLOAT:
+        raise ValueError(
+            f"Precisión no soportada: '{precision_float}'. Use {PRECISIONES_FLOAT}."
+        )
+    columnas = list(df.columns) if columnas is None else columnas
+    missing_cols = [col for col in columnas if col not in df.columns]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    enteras = [
+        c
+        for c in columnas
+        if pd.api.types.is_integer_dtype(df[c])
+        and not isinstance(df[c].dtype, pd.api.extensions.ExtensionDtype)
+    ]
+    sin_signo = [c for c in enteras if pd.api.types.is_unsigned_integer_dtype(df[c])]
+    enteras = [c for c in enteras if c not in sin_signo]
+    flotantes = [c for c in columnas if pd.api.types.is_float_dtype(df[c])]
+    if not len(df):
+        enteras, sin_signo, flotantes = [], [], []
+
+    nuevos_tipos = {}
+    nombres, minimos, maximos = [], [], []
+
+    if flotantes:
+        valores = df[flotantes].to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            enteros = np.isfinite(valores) & (valores % 1 == 0)
+        integrales = enteros.all(axis=0)
+        if precision_float == "float32":
+            reducibles = np.ones(len(flotantes), dtype=bool)
+        elif precision_float == "exacta":
+            exactos = valores.astype(np.float32).astype(np.float64) == valores
+            reducibles = (exactos | np.isnan(valores)).all(axis=0)
+        else:
+            reducibles = np.zeros(len(flotantes), dtype=bool)
+        for col, reducible in zip(flotantes, reducibles & ~integrales):
+            if reducible:
+                nuevos_tipos[col] = "float32"
+        # Las columnas float con solo enteros pasan al bloque entero
+        nombres += [c for c, integral in zip(flotantes, integrales) if integral]
+        # Un float entero se representa exactamente como int de Python
+        minimos += [int(v) for v in valores[:, integrales].min(axis=0)]
+        maximos += [int(v) for v in valores[:, integrales].max(axis=0)]
+
+    if enteras:
+        valores = df[enteras].to_numpy(dtype=np.int64)
+        nombres += enteras
+        minimos += valores.min(axis=0).tolist()
+        maximos += valores.max(axis=0).tolist()
+
+    if nombres:
+        tipos = _tipos_enteros(minimos, maximos)
+        nuevos_tipos.update((c, t) for c, t in zip(nombres, tipos) if t is not None)
+
+    if sin_signo:
+        valores = df[sin_signo].to_numpy(dtype=np.uint64)
+        tipos = _tipos_enteros(
+            valores.min(axis=0).tolist(), valores.max(axis=0).tolist(), TIPOS_SIN_SIGNO
+        )
+        nuevos_tipos.update(zip(sin_signo, tipos))
+
+    nuevos_tipos = {c: t for c, t in nuevos_tipos.items() if df[c].dtype != t}
+    resultado = df.astype(nuevos_tipos) if nuevos_tipos else df.copy()
+    reporte = {
+        "bytes_antes": int(df.memory_usage(deep=True).sum()),
+        "bytes_despues": int(resultado.memory_usage(deep=True).sum()),
+        "tipos": {c: str(resultado[c].dtype) for c in columnas},
+    }
+    return resultado, reporte
+
+
+def guardar_reporte_tipos(reporte: Dict[str, Any], ruta: str) -> None:
+    """
+    Guarda el reporte de `reducir_tipos` en un archivo JSON.
+
+    Args:
+        reporte (Dict[str, Any]): Reporte de `reducir_tipos`.
+        ruta (str): Ruta del archivo JSON.
+    """
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(reporte, f, ensure_ascii=False, indent=2)
+
+
+def cargar_tipos(ruta: str) -> Dict[str, str]:
+    """
+    Carga los tipos reducidos para usarlos como `dtype` de `pd.read_csv`.
+
+    Ejemplo:
+    ```python
+    df = pd.read_csv(RUTA_ENCODED_DATA, dtype=cargar_tipos(RUTA_TIPOS_ENCODED))
+    ```
+
+    Args:
+        ruta (str): Ruta del reporte JSON.
+
+    Returns:
+        Dict[str, str]: Tipo de cada columna.
+    """
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)["tipos"]
@@ -0,0 +1,328 @@
+"""
+Backend de ejecución basado en DuckDB para uniones y promedios.
+
+Expresa en SQL la misma lógica que `read_employee_files.merge_files`,
+`read_feedback_files.merge_dataframe` y `read_employee_files.mean_columns`:
+unir por `EmployeeID` y luego promediar columnas por fila. DuckDB lee los
+archivos CSV o Parquet directamente, ejecuta la consulta por bloques y, cuando
+los datos no caben en memoria, escribe resultados intermedios en disco.
+
+Los resultados son idénticos a los del camino con pandas: mismas columnas en
+el mismo orden, filas en el orden del DataFrame izquierdo y promedios que
+ignoran los valores faltantes.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# Equivalencia entre los tipos de pandas usados en config.DTYPES_FUENTES y los
+# tipos de DuckDB.
+_TIPOS_DUCKDB = {
+    "int8": "TINYINT",
+    "int16": "SMALLINT",
+    "int32": "INTEGER",
+    "int64": "BIGINT",
+    "float32": "FLOAT",
+    "float64": "DOUBLE",
+    "bool": "BOOLEAN",
+}
+
+# Columna auxiliar con la posición original de cada fila.
+_COLUMNA_FILA = "__fila"
+
+
+def _quote(nombre: str) -> str:
+    """Escapa un identificador para usarlo en una consulta SQL."""
+    return '"' + str(nombre).replace('"', '""') + '"'
+
+
+def _literal(valor: str) -> str:
+    """Escapa un texto para usarlo como literal en una consulta SQL."""
+    return "'" + str(valor).replace("'", "''") + "'"
+
+
+def connect(memory_limit: Optional[str] = None, temp_directory: Optional[str] = None):
+    """
+    Crea una conexión a DuckDB en memoria.
+
+    Parámetros:
+    ----------
+    memory_limit : str, opcional
+        Memoria máxima que puede usar DuckDB, por ejemplo "2GB". Al superarla,
+        los operadores de unión y agregación escriben en disco.
+    temp_directory : str, opcional
+        Directorio donde DuckDB escribe los datos que no caben en memoria.
+
+    Retorna:
+    -------
+    duckdb.DuckDBPyConnection
+        Conexión configurada.
+    """
+    # Importar dentro de la función para no depender de duckdb en todo el módulo
+    import duckdb
+
+    con = duckdb.connect()
+    if memory_limit is not None:
+        con.execute(f"SET memory_limit = {_literal(memory_limit)}")
+    if temp_directory is not None:
+        con.execute(f"SET temp_directory = {_literal(temp_directory)}")
+    return con
+
+
+def _source(file: str, dtype: Optional[Dict[str, str]] = None) -> str:
+    """
+    Construye la expresión SQL que lee un archivo CSV o Parquet.
+
+    En los CSV, las columnas indicadas en `dtype` se leen con el tipo de
+    DuckDB equivalente. El resto se infiere solo entre entero, decimal y
+    texto, igual que hace pandas (por ejemplo, "Yes"/"No" no se convierte en
+    booleano). También se tratan "NA" y los campos vacíos como faltantes.
+    """
+    if not Path(file).exists():
+        raise FileNotFoundError(f"El archivo {file} no existe.")
+
+    if Path(file).suffix.lower() == ".parquet":
+        return f"read_parquet({_literal(file)})"
+
+    opciones = (
+        "header = true, nullstr = ['NA', ''], "
+        "auto_type_candidates = ['BIGINT', 'DOUBLE', 'VARCHAR']"
+    )
+    if dtype:
+        tipos = ", ".join(
+            f"{_literal(col)}: {_literal(_TIPOS_DUCKDB[tipo])}"
+            for col, tipo in dtype.items()
+        )
+        opciones += f", types = {{{tipos}}}"
+    return f"read_csv({_literal(file)}, {opciones})"
+
+
+def _numbered(source: str) -> str:
+    """Agrega a una fuente la posición original de cada fila."""
+    return f"(SELECT *, row_number() OVER () AS {_COLUMNA_FILA} FROM {source})"
+
+
+def _join_query(left: str, right: str, column_join: str) -> str:
+    """Une dos fuentes numeradas conservando el orden de la izquierda."""
+    key = _quote(column_join)
+    return (
+        f"SELECT l.* EXCLUDE ({_COLUMNA_FILA}), "
+        f"r.* EXCLUDE ({key}, {_COLUMNA_FILA}) "
+        f"FROM {left} AS l INNER JOIN {right} AS r ON l.{key} = r.{key} "
+        f"ORDER BY l.{_COLUMNA_FILA}"
+    )
+
+
+def _mean_expression(columns: List[str]) -> str:
+    """Promedio por fila que ignora los valores faltantes, como pandas."""
+    suma = " + ".join(f"COALESCE({_quote(c)}, 0)" for c in columns)
+    conteo = " + ".join(f"CAST({_quote(c)} IS NOT NULL AS INTEGER)" for c in columns)
+    return f"CAST(({suma}) AS DOUBLE) / NULLIF({conteo}, 0)"
+
+
+def _columns(con, query: str) -> List[str]:
+    """Retorna los nombres de columnas de una consulta sin ejecutarla."""
+    return [fila[0] for fila in con.execute(f"DESCRIBE {query}").fetchall()]
+
+
+def merge_files(
+    file1: str,
+    file2: str,
+    column_join: str,
+    dtypes: Optional[List[Optional[Dict[str, str]]]] = None,
+    con=None,
+) -> pd.DataFrame:
+    """
+    Une dos archivos CSV o Parquet usando una columna común.
+
+    Parámetros:
+    ----------
+    file1 : str
+        Ruta al primer archivo.
+    file2 : str
+        Ruta al segundo archivo.
+    column_join : str
+        Nombre de la columna común para unir ambos archivos.
+    dtypes : list, opcional
+        Tipos de datos por columna de cada archivo, en el mismo orden.
+    con : duckdb.DuckDBPyConnection, opcional
+        Conexión a usar. Por defecto, se crea una nueva.
+
+    Retorna:
+    -------
+    pd.DataFrame
+        DataFrame resultante de la unión.
+    """
+    con = con or connect()
+    dtype1, dtype2 = dtypes or [None, None]
+    left, right = _source(file1, dtype1), _source(file2, dtype2)
+
+    if column_join not in _columns(con, f"SELECT * FROM {left}") or (
+        column_join not in _columns(con, f"SELECT * FROM {right}")
+    ):
+        raise KeyError(f"La columna '{column_join}' no se encuentra en ambos archivos.")
+
+    return con.execute(_join_query(_numbered(left), _numbered(right), column_join)).df()
+
+
+def merge_dataframe(
+    df1: pd.DataFrame, df2: pd.DataFrame, column_join: str, con=None
+) -> pd.DataFrame:
+    """
+    Une dos dataframes en un único dataframe usando una columna común.
+
+    Parámetros:
+    ----------
+    df1 : pd.DataFrame
+        Primer DataFrame.
+    df2 : pd.DataFrame
+        Segundo DataFrame.
+    column_join : str
+        Nombre de la columna común para unir ambos DataFrames.
+    con : duckdb.DuckDBPyConnection, opcional
+        Conexión a usar. Por defecto, se crea una nueva.
+
+    Retorna:
+    -------
+    pd.DataFrame
+        DataFrame resultante de la unión.
+    """
+    if column_join not in df1.columns or column_join not in df2.columns:
+        raise KeyError(f"La columna '{column_join}' no se encuentra en ambos archivos.")
+
+    con = con or connect()
+    con.register("__df1", df1)
+    con.register("__df2", df2)
+    try:
+        query = _join_query(_numbered("__df1"), _numbered("__df2"), column_join)
+        return con.execute(query).df()
+    finally:
+        con.unregister("__df1")
+        con.unregister("__df2")
+
+
+def mean_columns(
+    df: pd.DataFrame, columnaName: str, columns: list, con=None
+) -> pd.DataFrame:
+    """
+    Calcula el promedio por fila de columnas específicas en una nueva columna.
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        DataFrame que contiene los datos.
+    columnaName : str
+        Nombre de la nueva columna que almacenará el promedio.
+    columns : list
+        Lista de nombres de columnas numéricas para calcular el promedio.
+    con : duckdb.DuckDBPyConnection, opcional
+        Conexión a usar. Por defecto, se crea una nueva.
+
+    Retorna:
+    -------
+    pd.DataFrame
+        DataFrame con la nueva columna agregada.
+    """
+    if not columns:
+        raise ValueError("La lista de columnas no debe estar vacía.")
+
+    missing_cols = [col for col in columns if col not in df.columns]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    con = con or connect()
+    con.register("__df", df)
+    try:
+        query = (
+            f"SELECT {_mean_expression(columns)} AS {_quote(columnaName)} "
+            f"FROM {_numbered('__df')} ORDER BY {_COLUMNA_FILA}"
+        )
+        promedio = con.execute(query).df()[columnaName]
+    finally:
+        con.unregister("__df")
+
+    df[columnaName] = promedio.to_numpy()
+    return df
+
+
+def procesar_fuentes(
+    rutas: Dict[str, str],
+    column_join: str,
+    columnas_promedio: List[Dict],
+    dtypes: Optional[Dict[str, Dict[str, str]]] = None,
+    destino: Optional[str] = None,
+    con=None,
+):
+    """
+    Une varias fuentes en cadena y agrega un promedio después de cada unión.
+
+    Toda la cadena se ejecuta como una sola consulta, leyendo los archivos
+    directamente, de modo que DuckDB puede procesarla por bloques y escribir
+    en disco si no cabe en memoria.
+
+    Parámetros:
+    ----------
+    rutas : dict
+        Nombre lógico y ruta de cada fuente, en el orden de unión.
+    column_join : str
+        Nombre de la columna común para unir las fuentes.
+    columnas_promedio : list
+        Un diccionario por cada fuente a partir de la segunda, con las claves
+        "nombre" (columna nueva) y "columnas" (columnas a promediar).
+        Si es None para alguna fuente, no se agrega promedio en esa unión.
+    dtypes : dict, opcional
+        Tipos de datos por fuente, con el mismo nombre lógico que `rutas`.
+    destino : str, opcional
+        Si se indica, el resultado se escribe en ese archivo (CSV o Parquet
+        según la extensión) sin materializarlo en memoria y se retorna la ruta.
+    con : duckdb.DuckDBPyConnection, opcional
+        Conexión a usar. Por defecto, se crea una nueva.
+
+    Retorna:
+    -------
+    pd.DataFrame o str
+        DataFrame resultante, o la ruta de `destino` si se indicó.
+    """
+    if len(rutas) < 2:
+        raise ValueError("Se necesitan al menos dos fuentes para unir.")
+    if len(columnas_promedio) != len(rutas) - 1:
+        raise ValueError("Se necesita un promedio (o None) por cada unión.")
+
+    con = con or connect()
+    dtypes = dtypes or {}
+    fuentes = [_source(ruta, dtypes.get(nombre)) for nombre, ruta in rutas.items()]
+
+    query = f"SELECT * FROM {_numbered(fuentes[0])}"
+    for fuente, promedio in zip(fuentes[1:], columnas_promedio):
+        right = f"SELECT * FROM {fuente}"
+        if column_join not in _columns(con, query) or (
+            column_join not in _columns(con, right)
+        ):
+            raise KeyError(
+                f"La columna '{column_join}' no se encuentra en ambos archivos."
+            )
+        # La fila izquierda conserva su posición original para ordenar al final
+        query = (
+            f"SELECT l.*, r.* EXCLUDE ({_quote(column_join)}) "
+            f"FROM ({query}) AS l INNER JOIN {fuente} AS r "
+            f"ON l.{_quote(column_join)} = r.{_quote(column_join)}"
+        )
+        if promedio is not None:
+            query = (
+                f"SELECT *, {_mean_expression(promedio['columnas'])} "
+                f"AS {_quote(promedio['nombre'])} FROM ({query})"
+            )
+
+    query = (
+        f"SELECT * EXCLUDE ({_COLUMNA_FILA}) FROM ({query}) ORDER BY {_COLUMNA_FILA}"
+    )
+
+    if destino is not None:
+        formato = "PARQUET" if Path(destino).suffix.lower() == ".parquet" else "CSV"
+        con.execute(f"COPY ({query}) TO {_literal(destino)} (FORMAT {formato})")
+        return destino
+    return con.execute(query).df()
@@ -1,4 +1,9 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
+from sklearn.model_selection import KFold
 from sklearn.preprocessing import LabelEncoder
 
 def apply_label_encoding(df, columns):
@@ -40,3 +45,296 @@ def apply_one_hot_encoding(df, columns):
     """
     df_encoded = pd.get_dummies(df, columns=columns, drop_first=False)
     return df_encoded
+
+
+def _target_binario(serie):
+    """
+    Convierte la columna objetivo en 0/1.
+
+    Las columnas no numéricas se codifican como LabelEncoder (categorías
+    ordenadas), de modo que 'Yes' corresponde a 1 en 'Attrition'.
+    """
+    if pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie):
+        return serie.to_numpy(dtype=float)
+    codigos, _ = pd.factorize(serie, sort=True)
+    return codigos.astype(float)
+
+
+def _codificar_columna(serie, y, folds, n_splits, smoothing):
+    """
+    Calcula la codificación fuera de fold de una columna y sus estadísticas.
+
+    Las sumas y conteos por (fold, categoría) se obtienen con un solo
+    np.bincount; las estadísticas fuera de fold se calculan restando las del
+    propio fold a las totales, para todos los folds a la vez.
+    """
+    codigos, categorias = pd.factorize(serie, sort=True)
+    # Los valores faltantes se tratan como una categoría más
+    faltantes = codigos < 0
+    n_cat = len(categorias) + int(faltantes.any())
+    codigos = np.where(faltantes, len(categorias), codigos)
+
+    celda = folds * n_cat + codigos
+    n_celdas = n_splits * n_cat
+    suma_fold = np.bincount(celda, weights=y, minlength=n_celdas).reshape(
+        n_splits, n_cat
+    )
+    conteo_fold = np.bincount(celda, minlength=n_celdas).reshape(n_splits, n_cat)
+    suma, conteo = suma_fold.sum(axis=0), conteo_fold.sum(axis=0)
+
+    # Media global fuera de fold usada como prior de cada fila
+    suma_oof = suma.sum() - suma_fold.sum(axis=1)
+    conteo_oof = conteo.sum() - conteo_fold.sum(axis=1)
+    prior_oof = suma_oof / conteo_oof
+
+    suma_celda = (suma - suma_fold)[folds, codigos]
+    conteo_celda = (conteo - conteo_fold)[folds, codigos]
+    codificado = (suma_celda + smoothing * prior_oof[folds]) / (
+        conteo_celda + smoothing
+    )
+
+    prior = suma.sum() / conteo.sum()
+    valores = (suma + smoothing * prior) / (conteo + smoothing)
+    estadisticas = {
+        "categorias": [c.item() if hasattr(c, "item") else c for c in categorias],
+        "valores": valores[: len(categorias)].tolist(),
+        "valor_faltante": float(valores[-1]) if faltantes.any() else float(prior),
+        "media_global": float(prior),
+    }
+    return codificado, estadisticas
+
+
+def apply_target_encoding(
+    df,
+    columns,
+    target="Attrition",
+    n_splits=5,
+    smoothing=10.0,
+    random_state=42,
+    n_jobs=None,
+):
+    """
+    Aplica Target Encoding fuera de fold (out-of-fold) con suavizado.
+
+    Cada categoría se reemplaza por la media suavizada del objetivo,
+    (suma + smoothing * media_global) / (conteo + smoothing). Para evitar
+    fuga del objetivo, el valor de cada fila se calcula solo con las filas de
+    los otros folds. Las columnas se procesan en paralelo con hilos.
+
+    Parámetros:
+    ----------
+      df (pd.DataFrame): DataFrame original.
+      columns (list): Lista de nombres de columnas a codificar.
+      target (str): Columna objetivo binaria. Por defecto 'Attrition'.
+      n_splits (int): Número de folds.
+      smoothing (float): Peso de la media global en el suavizado.
+      random_state (int): Semilla para asignar las filas a los folds.
+      n_jobs (int): Número máximo de hilos. Por defecto, el de ThreadPoolExecutor.
+
+    Retorna:
+    -------
+      df_encoded (pd.DataFrame): DataFrame con columnas codificadas (float).
+      encoders (dict): Estadísticas por columna, ajustadas con todos los datos,
+        para usar con transform_target_encoding.
+    """
+    if target not in df.columns:
+        raise KeyError(f"La columna objetivo '{target}' no está en el DataFrame.")
+    missing_cols = [col for col in columns if col not in df.columns]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+    if n_splits < 2:
+        raise ValueError("n_splits debe ser mayor o igual a 2.")
+
+    y = _target_binario(df[target])
+    folds = np.empty(len(df), dtype=np.int64)
+    kfold = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    for i, (_, indices) in enumerate(kfold.split(folds)):
+        folds[indices] = i
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        futures = {
+            col: executor.submit(
+                _codificar_columna, df[col], y, folds, n_splits, smoothing
+            )
+            for col in columns
+        }
+        resultados = {col: future.result() for col, future in futures.items()}
+
+    df_encoded = df.copy()
+    encoders = {}
+    for col, (codificado, estadisticas) in resultados.items():
+        df_encoded[col] = codificado
+        encoders[col] = estadisticas
+
+    return df_encoded, encoders
+
+
+def transform_target_encoding(df, encoders):
+    """
+    Aplica las estadísticas de apply_target_encoding a datos nuevos.
+
+    Las categorías no vistas reciben la media global del objetivo.
+
+    Parámetros:
+    ----------
+      df (pd.DataFrame): DataFrame a codificar.
+      encoders (dict): Estadísticas retornadas por apply_target_encoding o
+        cargadas con load_target_encoding.
+
+    Retorna:
+    -------
+      df_encoded (pd.DataFrame): DataFrame con columnas codificadas (float).
+    """
+    df_encoded = df.copy()
+    for col, estadisticas in encoders.items():
+        codigos = pd.Index(estadisticas["categorias"]).get_indexer(df_encoded[col])
+        valores = np.append(estadisticas["valores"], estadisticas["media_global"])
+        codificado = valores[codigos]
+        codificado[df_encoded[col].isna().to_numpy()] = estadisticas["valor_faltante"]
+        df_encoded[col] = codificado
+
+    return df_encoded
+
+
+def save_target_encoding(encoders, ruta):
+    """
+    Guarda las estadísticas del Target Encoding en un archivo JSON.
+
+    Parámetros:
+    ----------
+      encoders (dict): Estadísticas retornadas por apply_target_encoding.
+      ruta (str): Ruta del archivo JSON.
+    """
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(encoders, f, ensure_ascii=False, indent=2)
+
+
+def load_target_encoding(ruta):
+    """
+    Carga las estadísticas del Target Encoding desde un archivo JSON.
+
+    Parámetros:
+    ----------
+      ruta (str): Ruta del archivo JSON.
+
+    Retorna:
+    -------
+      encoders (dict): Estadísticas por columna.
+    """
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _valor_canonico(valor):
+    """
+    Texto de un valor que no depende del tipo de la columna.
+
+    Los números enteros se escriben sin decimales (1, 1.0 y np.int8(1) dan
+    '1'), los demás números con repr de float y el resto con str.
+    """
+    if isinstance(valor, (bool, np.bool_)):
+        return str(bool(valor))
+    if isinstance(valor, (int, np.integer)):
+        return str(int(valor))
+    if isinstance(valor, (float, np.floating)):
+        valor = float(valor)
+        return str(int(valor)) if valor.is_integer() else repr(valor)
+    return str(valor)
+
+
+def _textos_canonicos(serie):
+    """
+    Aplica _valor_canonico a una serie sin valores faltantes.
+
+    Solo las columnas de objetos con tipos mezclados (por ejemplo, textos y
+    números) y los decimales se recorren valor a valor; el resto se convierte
+    con operaciones de pandas y NumPy.
+    """
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Se convierten solo las categorías y se reparten con los códigos
+        categorias = _textos_canonicos(pd.Series(serie.cat.categories))
+        return categorias[serie.cat.codes.to_numpy()]
+    if pd.api.types.is_bool_dtype(serie):
+        return serie.astype(bool).astype(str).to_numpy(dtype=object)
+    if pd.api.types.is_integer_dtype(serie):
+        return serie.astype(str).to_numpy(dtype=object)
+    if pd.api.types.is_float_dtype(serie):
+        valores = serie.to_numpy(dtype=np.float64)
+        enteros = np.abs(valores) < 2.0**63
+        enteros[enteros] = valores[enteros] % 1 == 0
+        textos = np.empty(len(valores), dtype=object)
+        textos[enteros] = valores[enteros].astype(np.int64).astype(str)
+        # repr solo para los decimales (y los enteros fuera de int64 o inf)
+        textos[~enteros] = [_valor_canonico(v) for v in valores[~enteros].tolist()]
+        return textos
+
+    tipo = pd.api.types.infer_dtype(serie, skipna=True)
+    if tipo in ("string", "empty", "integer"):
+        return serie.astype(str).to_numpy(dtype=object)
+    if tipo == "boolean":
+        return _textos_canonicos(serie.astype(bool))
+    if tipo in ("floating", "mixed-integer-float"):
+        return _textos_canonicos(serie.astype(np.float64))
+    return np.array([_valor_canonico(v) for v in serie.tolist()], dtype=object)
+
+
+def apply_hashing_encoding(df, columns, n_features=1024, alternate_sign=False):
+    """
+    Aplica Feature Hashing a columnas categóricas.
+
+    Cada valor se convierte en el texto '<columna>=<valor>' y se asigna a la
+    columna hash(texto) % n_features de una matriz dispersa. El texto del
+    valor no depende del tipo de la columna: un 1 en una columna int64 y un
+    1.0 en una columna float64 (por ejemplo, en un bloque con faltantes) van
+    a la misma columna. No requiere
+    ajuste ni vocabulario: el ancho de la salida es fijo y la posición de cada
+    categoría no depende de los demás datos, por lo que cada bloque de un
+    archivo o de un flujo se puede codificar por separado. Las colisiones se
+    suman y los valores faltantes no generan entradas.
+
+    Parámetros:
+    ----------
+      df (pd.DataFrame): DataFrame original.
+      columns (list): Lista de nombres de columnas a codificar.
+      n_features (int): Número de columnas de la matriz de salida.
+      alternate_sign (bool): Si es True, el signo de cada entrada también se
+        obtiene del hash, de modo que las colisiones tienden a compensarse.
+
+    Retorna:
+    -------
+      matriz (scipy.sparse.csr_matrix): Matriz de forma (len(df), n_features).
+    """
+    from scipy import sparse
+
+    if n_features < 1:
+        raise ValueError("n_features debe ser mayor o igual a 1.")
+    missing_cols = [col for col in columns if col not in df.columns]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+    if not columns:
+        return sparse.csr_matrix((len(df), n_features))
+
+    filas, indices, valores = [], [], []
+    for col in columns:
+        serie = df[col]
+        presentes = serie.notna().to_numpy()
+        textos = f"{col}=" + _textos_canonicos(serie[presentes])
+        # hash_array usa una clave fija, por lo que el resultado es estable
+        hashes = pd.util.hash_array(textos)
+
+        filas.append(np.flatnonzero(presentes))
+        indices.append((hashes % np.uint64(n_features)).astype(np.int64))
+        if alternate_sign:
+            valores.append(np.where(hashes >> np.uint64(63), -1.0, 1.0))
+        else:
+            valores.append(np.ones(len(hashes)))
+
+    matriz = sparse.coo_matrix(
+        (np.concatenate(valores), (np.concatenate(filas), np.concatenate(indices))),
+        shape=(len(df), n_features),
+    )
+    return matriz.tocsr()
@@ -0,0 +1,107 @@
+"""
+Módulo para unir DataFrames por una llave entera sin tabla hash.
+
+Los archivos de empleados están ordenados por `EmployeeID` y usan el rango
+denso 1..4410, por lo que la posición de cada llave en la tabla derecha se
+puede obtener sin construir una tabla hash:
+
+- "posicional": ambas llaves son idénticas; las filas ya están alineadas.
+- "denso": las llaves derechas son consecutivas; posición = llave - mínimo.
+- "ordenado": las llaves derechas son estrictamente crecientes; la posición
+  se obtiene con una búsqueda binaria vectorizada (`np.searchsorted`).
+- "hash": cualquier otro caso se resuelve con `pd.merge`.
+
+El resultado es el mismo que `pd.merge(left, right, on=key, how="inner")`.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def estrategia_union(left: pd.DataFrame, right: pd.DataFrame, key: str) -> str:
+    """
+    Elige la estrategia de unión con verificaciones de costo lineal.
+
+    Args:
+        left (pd.DataFrame): Tabla izquierda.
+        right (pd.DataFrame): Tabla derecha.
+        key (str): Columna de unión.
+
+    Returns:
+        str: "posicional", "denso", "ordenado" o "hash".
+    """
+    llave_izq, llave_der = left[key], right[key]
+    solapadas = (set(left.columns) & set(right.columns)) - {key}
+    if (
+        solapadas
+        or not len(left)
+        or not len(right)
+        or llave_izq.dtype != llave_der.dtype
+        or not pd.api.types.is_integer_dtype(llave_der.dtype)
+    ):
+        return "hash"
+
+    valores_izq = llave_izq.to_numpy()
+    valores_der = llave_der.to_numpy()
+    if not (np.diff(valores_der) > 0).all():
+        return "hash"
+    if len(valores_izq) == len(valores_der) and (valores_izq == valores_der).all():
+        return "posicional"
+    if int(valores_der[-1]) - int(valores_der[0]) == len(valores_der) - 1:
+        return "denso"
+    return "ordenado"
+
+
+def _posiciones(
+    valores_izq: np.ndarray, valores_der: np.ndarray, estrategia: str
+) -> np.ndarray:
+    """Posición en la tabla derecha de cada llave izquierda (-1 si no está)."""
+    if estrategia == "denso":
+        posiciones = valores_izq.astype(np.int64) - int(valores_der[0])
+        posiciones[(posiciones < 0) | (posiciones >= len(valores_der))] = -1
+        return posiciones
+
+    posiciones = np.searchsorted(valores_der, valores_izq)
+    acotadas = np.minimum(posiciones, len(valores_der) - 1)
+    return np.where(valores_der[acotadas] == valores_izq, acotadas, -1)
+
+
+def join_on_key(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    key: str,
+    estrategia: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Une dos DataFrames por una llave (inner join).
+
+    Args:
+        left (pd.DataFrame): Tabla izquierda; su orden se conserva.
+        right (pd.DataFrame): Tabla derecha.
+        key (str): Columna de unión.
+        estrategia (Optional[str], optional): Fuerza una estrategia; por
+            defecto se elige con `estrategia_union`.
+
+    Returns:
+        pd.DataFrame: Mismo resultado que `pd.merge(..., how="inner")`.
+    """
+    if estrategia is None:
+        estrategia = estrategia_union(left, right, key)
+    if estrategia == "hash":
+        return pd.merge(left, right, on=key, how="inner")
+
+    derecha = right.drop(columns=key)
+    if estrategia == "posicional":
+        izquierda = left.reset_index(drop=True)
+        derecha = derecha.reset_index(drop=True)
+    else:
+        posiciones = _posiciones(
+            left[key].to_numpy(), right[key].to_numpy(), estrategia
+        )
+        encontradas = posiciones >= 0
+        izquierda = left.iloc[np.flatnonzero(encontradas)].reset_index(drop=True)
+        derecha = derecha.iloc[posiciones[encontradas]].reset_index(drop=True)
+
+    return pd.concat([izquierda, derecha], axis=1)
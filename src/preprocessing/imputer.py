@@ -0,0 +1,201 @@
+"""
+Módulo para imputar valores faltantes con estadísticas ajustadas.
+
+`ajustar_imputador` aprende, con los datos de entrenamiento, la mediana de
+cada columna numérica y la moda de cada columna categórica, opcionalmente
+por grupo (por ejemplo, por `Department`). Todas las medianas se calculan con
+una sola llamada sobre el bloque de columnas numéricas (o un solo `groupby`).
+
+`aplicar_imputador` rellena el bloque numérico completo con un único
+`np.where` sobre la matriz de valores, en lugar de copiar columna por
+columna, y puede agregar columnas indicadoras `<columna>_faltante`. El estado
+se guarda en JSON para imputar igual al entrenar y al puntuar.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Sufijo de las columnas indicadoras de valores faltantes.
+SUFIJO_INDICADOR = "_faltante"
+
+
+def _modas_por_grupo(df: pd.DataFrame, grupo: str, col: str) -> pd.Series:
+    """Moda de una columna en cada grupo; los empates se resuelven por orden."""
+    conteos = df.groupby([grupo, col], sort=True).size().rename("n").reset_index()
+    conteos = conteos.sort_values([grupo, "n"], ascending=[True, False], kind="stable")
+    return conteos.drop_duplicates(grupo).set_index(grupo)[col]
+
+
+def _a_json(valor: Any) -> Any:
+    """Convierte un valor de NumPy o pandas en un tipo serializable."""
+    if valor is None or (isinstance(valor, float) and np.isnan(valor)):
+        return None
+    return valor.item() if hasattr(valor, "item") else valor
+
+
+def ajustar_imputador(
+    df: pd.DataFrame,
+    columnas: Optional[List[str]] = None,
+    grupo: Optional[str] = None,
+    indicadores: bool = False,
+) -> Dict[str, Any]:
+    """
+    Ajusta las estadísticas de imputación.
+
+    Args:
+        df (pd.DataFrame): Datos de entrenamiento.
+        columnas (Optional[List[str]], optional): Columnas a imputar. Por
+            defecto, las columnas con valores faltantes (excepto `grupo`).
+        grupo (Optional[str], optional): Columna para imputar por grupo, por
+            ejemplo "Department". Los grupos no vistos o sin datos usan el
+            valor global.
+        indicadores (bool, optional): Si es True, `aplicar_imputador` agrega
+            una columna booleana `<columna>_faltante` por columna imputada.
+
+    Returns:
+        Dict[str, Any]: Estado serializable en JSON.
+    """
+    if columnas is None:
+        columnas = [c for c in df.columns[df.isna().any()] if c != grupo]
+    missing_cols = [c for c in columnas + ([grupo] if grupo else []) if c not in df]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    numericas = [c for c in columnas if pd.api.types.is_numeric_dtype(df[c])]
+    categoricas = [c for c in columnas if c not in numericas]
+
+    globales = df[numericas].median().to_dict() if numericas else {}
+    for col in categoricas:
+        modas = df[col].mode()
+        globales[col] = modas.iloc[0] if len(modas) else None
+
+    estado = {
+        "numericas": numericas,
+        "categoricas": categoricas,
+        "globales": {c: _a_json(v) for c, v in globales.items()},
+        "grupo": grupo,
+        "grupos": [],
+        "por_grupo": {},
+        "indicadores": indicadores,
+    }
+
+    if grupo is not None:
+        grupos = pd.Index(sorted(df[grupo].dropna().unique()))
+        tablas = {}
+        if numericas:
+            medianas = df.groupby(grupo, sort=True)[numericas].median()
+            tablas.update(medianas.reindex(grupos).to_dict("list"))
+        for col in categoricas:
+            tablas[col] = list(_modas_por_grupo(df, grupo, col).reindex(grupos))
+        estado["grupos"] = [_a_json(g) for g in grupos]
+        estado["por_grupo"] = {
+            c: [_a_json(v) for v in valores] for c, valores in tablas.items()
+        }
+
+    return estado
+
+
+def _valores_relleno(
+    df: pd.DataFrame, estado: Dict[str, Any], columnas: List[str]
+) -> np.ndarray:
+    """
+    Matriz (filas × columnas) con el valor de relleno de cada fila.
+
+    Sin grupos, cada columna usa su valor global. Con grupos, se indexa una
+    tabla (grupos + fila global) con el código del grupo de cada fila.
+    """
+    globales = [estado["globales"][c] for c in columnas]
+    if estado["grupo"] is None:
+        return np.array([globales], dtype=object)
+
+    tabla = pd.DataFrame(
+        {c: estado["por_grupo"][c] for c in columnas}, index=estado["grupos"]
+    )
+    # Los grupos sin datos para una columna usan el valor global
+    tabla = tabla.astype(object).where(
+        tabla.notna(), pd.Series(globales, columnas), axis=1
+    )
+    tabla = np.vstack([tabla.to_numpy(dtype=object), np.array(globales, dtype=object)])
+    codigos = pd.Index(estado["grupos"]).get_indexer(df[estado["grupo"]])
+    return tabla[codigos]
+
+
+def aplicar_imputador(df: pd.DataFrame, estado: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Imputa los valores faltantes con las estadísticas ajustadas.
+
+    Args:
+        df (pd.DataFrame): Datos a imputar (entrenamiento o nuevos).
+        estado (Dict[str, Any]): Resultado de `ajustar_imputador` o
+            `cargar_imputador`.
+
+    Returns:
+        pd.DataFrame: Copia de `df` imputada y, si se configuró, con las
+        columnas indicadoras al final.
+    """
+    columnas = estado["numericas"] + estado["categoricas"]
+    missing_cols = [c for c in columnas if c not in df.columns]
+    if estado["grupo"] is not None and estado["grupo"] not in df.columns:
+        missing_cols.append(estado["grupo"])
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    faltantes = df[columnas].isna().to_numpy()
+    resultado = df.copy()
+
+    numericas = estado["numericas"]
+    if numericas:
+        n = len(numericas)
+        bloque = df[numericas].to_numpy(dtype=np.float64, na_value=np.nan)
+        relleno = _valores_relleno(df, estado, numericas).astype(np.float64)
+        resultado[numericas] = np.where(faltantes[:, :n], relleno, bloque)
+
+    categoricas = estado["categoricas"]
+    if categoricas:
+        n = len(numericas)
+        bloque = df[categoricas].to_numpy(dtype=object)
+        relleno = _valores_relleno(df, estado, categoricas)
+        resultado[categoricas] = np.where(faltantes[:, n:], relleno, bloque)
+
+    if estado["indicadores"]:
+        indicadores = pd.DataFrame(
+            faltantes,
+            columns=[f"{c}{SUFIJO_INDICADOR}" for c in columnas],
+            index=df.index,
+        )
+        resultado = pd.concat([resultado, indicadores], axis=1)
+
+    return resultado
+
+
+def guardar_imputador(estado: Dict[str, Any], ruta: str) -> None:
+    """
+    Guarda el estado del imputador en un archivo JSON.
+
+    Args:
+        estado (Dict[str, Any]): Resultado de `ajustar_imputador`.
+        ruta (str): Ruta del archivo JSON.
+    """
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(estado, f, ensure_ascii=False, indent=2)
+
+
+def cargar_imputador(ruta: str) -> Dict[str, Any]:
+    """
+    Carga el estado del imputador desde un archivo JSON.
+
+    Args:
+        ruta (str): Ruta del archivo JSON.
+
+    Returns:
+        Dict[str, Any]: Estado del imputador.
+    """
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
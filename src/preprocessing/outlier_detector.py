@@ -1,6 +1,20 @@
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import IsolationForest
 
+from src.preprocessing.config import RANGOS_PLAUSIBLES
+
+# Métodos de filtrado vectorizados disponibles en screen_outliers.
+METODOS = ('zscore', 'iqr', 'mad', 'rango')
+
+# Umbrales por defecto de cada método.
+UMBRAL_ZSCORE = 3.0
+FACTOR_IQR = 1.5
+UMBRAL_MAD = 3.5
+
+# Clave de df.attrs con las columnas que agregó detect_outliers.
+ATTR_COLUMNAS_OUTLIERS = 'columnas_outliers'
+
 def detect_outliers_isolation_forest(df, features, contamination=0.01, random_state=42):
     """
     Aplica Isolation Forest para detectar outliers en columnas numéricas.
@@ -18,5 +32,211 @@ def detect_outliers_isolation_forest(df, features, contamination=0.01, random_st
 def remove_outliers(df):
     """
    Elimina los registros detectados como outliers.
+
+   También elimina 'is_outlier' y las columnas que agregó detect_outliers
+   (registradas en df.attrs); las columnas propias de df se conservan aunque
+   se llamen 'outlier_<método>'. Las filas y columnas se seleccionan con
+   row_filter.SeleccionFilas, en una sola copia.
+
+   Para no copiar df al detectar, es mejor usar directamente
+   SeleccionFilas(df).sin_outliers(...) u outlier_mask.
+    """
+    # Import local: row_filter importa este módulo
+    from src.preprocessing.row_filter import SeleccionFilas
+
+    agregadas = {'is_outlier', *df.attrs.get(ATTR_COLUMNAS_OUTLIERS, [])}
+    columnas = [col for col in df.columns if col not in agregadas]
+    seleccion = SeleccionFilas(df).filtrar(df['is_outlier'].to_numpy() != 0,
+                                           'outliers')
+    df_result = seleccion.materializar(columnas)
+    df_result.attrs = {clave: valor for clave, valor in df_result.attrs.items()
+                       if clave != ATTR_COLUMNAS_OUTLIERS}
+    return df_result
+
+def _codigos_grupo(df, group):
+    """
+    Código de grupo de cada fila (0 si no hay grupo).
+
+    Las filas con grupo faltante usan un grupo propio.
+    """
+    if group is None:
+        return np.zeros(len(df), dtype=np.int64)
+    codigos, _ = pd.factorize(df[group], use_na_sentinel=False)
+    return codigos
+
+def _estadisticos(valores, codigos):
+    """
+    Media, desviación, cuartiles y MAD de cada columna en cada grupo.
+
+    Cada estadístico se calcula una sola vez para todas las columnas y se
+    retorna alineado con las filas (forma filas × columnas).
+    """
+    bloque = pd.DataFrame(valores)
+    grupos = bloque.groupby(codigos, sort=True)
+    cuartiles = grupos.quantile([0.25, 0.5, 0.75])
+    q1 = cuartiles.xs(0.25, level=1).to_numpy()[codigos]
+    mediana = cuartiles.xs(0.5, level=1).to_numpy()[codigos]
+    q3 = cuartiles.xs(0.75, level=1).to_numpy()[codigos]
+    desviaciones = pd.DataFrame(np.abs(valores - mediana))
+    mad = desviaciones.groupby(codigos, sort=True).median().to_numpy()[codigos]
+    return {
+        'media': grupos.mean().to_numpy()[codigos],
+        'std': grupos.std(ddof=0).to_numpy()[codigos],
+        'q1': q1,
+        'mediana': mediana,
+        'q3': q3,
+        'mad': mad,
+    }
+
+def screen_outliers(df, features, methods=('iqr', 'mad'), group=None, rangos=None,
+                    umbral_zscore=UMBRAL_ZSCORE, factor_iqr=FACTOR_IQR,
+                    umbral_mad=UMBRAL_MAD):
+    """
+    Marca outliers con filtros vectorizados sobre todas las columnas a la vez.
+
+    Métodos:
+    - 'zscore': |x - media| / desviación > umbral_zscore.
+    - 'iqr': x fuera de [Q1 - factor_iqr * IQR, Q3 + factor_iqr * IQR].
+    - 'mad': z-score robusto 0.6745 * |x - mediana| / MAD > umbral_mad.
+    - 'rango': x fuera de los límites de `rangos` ({columna: [mín, máx]},
+      None si no hay límite), por ejemplo edades negativas. Por defecto,
+      config.RANGOS_PLAUSIBLES.
+
+    Con `group` (por ejemplo 'Department') los estadísticos se calculan por
+    grupo. Las columnas con dispersión cero en un grupo no se marcan con
+    'zscore', 'iqr' ni 'mad'. Los valores faltantes nunca se marcan.
+
+    Parámetros:
+    ----------
+      df (pd.DataFrame): Datos.
+      features (list): Columnas numéricas a revisar.
+      methods (tuple): Métodos a aplicar, en cualquier combinación.
+      group (str): Columna de agrupación opcional.
+      rangos (dict): Límites plausibles por columna para el método 'rango'.
+
+    Retorna:
+    -------
+      pd.DataFrame: Una columna booleana 'outlier_<método>' por método, con
+      el mismo índice que df.
+    """
+    desconocidos = [m for m in methods if m not in METODOS]
+    if desconocidos:
+        raise ValueError(f"Métodos no soportados: {desconocidos}")
+    columnas = list(features) + ([group] if group is not None else [])
+    missing_cols = [col for col in columnas if col not in df.columns]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}")
+
+    valores = df[list(features)].to_numpy(dtype=np.float64, na_value=np.nan)
+    flags = pd.DataFrame(index=df.index)
+    estadisticos = None
+    if any(m in methods for m in ('zscore', 'iqr', 'mad')):
+        estadisticos = _estadisticos(valores, _codigos_grupo(df, group))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if 'zscore' in methods:
+            z = np.abs(valores - estadisticos['media']) / estadisticos['std']
+            fuera = (z > umbral_zscore) & (estadisticos['std'] > 0)
+            flags['outlier_zscore'] = fuera.any(axis=1)
+        if 'iqr' in methods:
+            iqr = estadisticos['q3'] - estadisticos['q1']
+            fuera = (valores < estadisticos['q1'] - factor_iqr * iqr) | (
+                valores > estadisticos['q3'] + factor_iqr * iqr)
+            flags['outlier_iqr'] = (fuera & (iqr > 0)).any(axis=1)
+        if 'mad' in methods:
+            desviacion = np.abs(valores - estadisticos['mediana'])
+            z = 0.6745 * desviacion / estadisticos['mad']
+            fuera = (z > umbral_mad) & (estadisticos['mad'] > 0)
+            flags['outlier_mad'] = fuera.any(axis=1)
+    if 'rango' in methods:
+        rangos = RANGOS_PLAUSIBLES if rangos is None else rangos
+        limites = np.array([rangos.get(c) or [None, None] for c in features],
+                           dtype=float).reshape(-1, 2)
+        # None (sin límite) se convierte en -inf o inf
+        minimos = np.nan_to_num(limites[:, 0], nan=-np.inf)
+        maximos = np.nan_to_num(limites[:, 1], nan=np.inf)
+        fuera = (valores < minimos) | (valores > maximos)
+        flags['outlier_rango'] = fuera.any(axis=1)
+    return flags
+
+def _flags_outliers(df, features, methods, group, rangos, isolation,
+                    contamination, random_state, **umbrales):
+    """
+    Columnas 'outlier_<método>' de detect_outliers, sin copiar df.
+    """
+    flags = screen_outliers(df, features, methods, group, rangos, **umbrales)
+    sospechosas = flags.any(axis=1)
+
+    if isolation:
+        restantes = df.loc[~sospechosas, list(features)].dropna()
+        flags['outlier_isolation'] = False
+        if len(restantes):
+            model = IsolationForest(contamination=contamination,
+                                    random_state=random_state)
+            preds = model.fit_predict(restantes)
+            flags.loc[restantes.index, 'outlier_isolation'] = preds == -1
+    return flags
+
+def detect_outliers(df, features, methods=('iqr', 'mad'), group=None, rangos=None,
+                    isolation=True, contamination=0.01, random_state=42, **umbrales):
+    """
+    Detecta outliers con filtros baratos y luego Isolation Forest.
+
+    Primero se aplican los filtros de `screen_outliers`, que marcan los
+    errores groseros en una sola pasada. Isolation Forest se ajusta y aplica
+    solo sobre las filas que pasaron los filtros (y sin valores faltantes),
+    para buscar outliers multivariados que los filtros por columna no ven.
+
+    Parámetros:
+    ----------
+      df (pd.DataFrame): Datos.
+      features (list): Columnas numéricas a revisar.
+      methods (tuple): Métodos de `screen_outliers`.
+      group (str): Columna de agrupación opcional, por ejemplo 'Department'.
+      rangos (dict): Límites plausibles por columna para el método 'rango'.
+      isolation (bool): Si es False, solo se aplican los filtros.
+      contamination (float): Proporción esperada de outliers en las filas
+        que pasan los filtros.
+      **umbrales: umbral_zscore, factor_iqr o umbral_mad.
+
+    Retorna:
+    -------
+      pd.DataFrame: Copia de df con una columna 'outlier_<método>' por
+      método, 'outlier_isolation' (si aplica) e 'is_outlier' (0/1), que vale
+      1 si algún método marcó la fila. Las columnas agregadas quedan en
+      df_result.attrs['columnas_outliers'], para que remove_outliers
+      descarte solo esas.
+
+    La copia de df es inevitable porque se le agregan columnas; si solo se
+    necesita filtrar, outlier_mask o row_filter.SeleccionFilas.sin_outliers
+    no copian df.
+    """
+    flags = _flags_outliers(df, features, methods, group, rangos, isolation,
+                            contamination, random_state, **umbrales)
+    df_result = pd.concat([df, flags], axis=1)
+    df_result['is_outlier'] = flags.any(axis=1).astype(int)
+    df_result.attrs[ATTR_COLUMNAS_OUTLIERS] = list(flags.columns) + ['is_outlier']
+    return df_result
+
+def outlier_mask(df, features, methods=('iqr', 'mad'), group=None, rangos=None,
+                 isolation=True, contamination=0.01, random_state=42,
+                 **umbrales):
+    """
+    Máscara de outliers con los mismos criterios que detect_outliers.
+
+    A diferencia de detect_outliers, no copia df ni le agrega columnas: solo
+    retorna la máscara, para combinarla con otros filtros antes de
+    materializar el resultado (ver row_filter.SeleccionFilas).
+
+    Parámetros:
+    ----------
+      Los mismos que detect_outliers.
+
+    Retorna:
+    -------
+      np.ndarray: Arreglo booleano, True en las filas marcadas como outlier.
     """
-    return df[df['is_outlier'] == 0].drop(columns=['is_outlier'])
+    flags = _flags_outliers(df, features, methods, group, rangos, isolation,
+                            contamination, random_state, **umbrales)
+    return flags.any(axis=1).to_numpy()
@@ -0,0 +1,71 @@
+"""Este módulo contiene un método para leer varios archivos CSV en paralelo.
+
+El parser de pandas libera el GIL durante gran parte de la lectura, por lo que
+un pool de hilos permite que el tiempo total de carga se acerque al del archivo
+más lento en lugar de la suma de todos.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from src.preprocessing.read_employee_files import read_file
+
+
+def read_files_parallel(
+    rutas: Dict[str, str],
+    dtypes: Optional[Dict[str, Dict[str, str]]] = None,
+    columnas: Optional[Dict[str, List[str]]] = None,
+    esquemas: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Lee en paralelo un conjunto de archivos CSV.
+
+    Parámetros:
+    ----------
+    rutas : dict
+        Diccionario con el nombre lógico de cada fuente y la ruta del archivo.
+    dtypes : dict, opcional
+        Tipos de datos por fuente, con el mismo nombre lógico que `rutas`.
+    columnas : dict, opcional
+        Columnas a leer por fuente. Las fuentes no indicadas se leen completas.
+    esquemas : dict, opcional
+        Esquema por fuente (ver `schema`). Las fuentes no indicadas no se validan.
+    max_workers : int, opcional
+        Número máximo de hilos. Por defecto, uno por archivo.
+
+    Retorna:
+    -------
+    dict
+        Diccionario con el nombre lógico de cada fuente y su DataFrame.
+
+    Excepciones:
+    -----------
+    Si la lectura de algún archivo falla, se propaga la excepción original de
+    ese archivo (por ejemplo, `FileNotFoundError`) una vez terminadas todas
+    las lecturas. Se respeta el orden de `rutas` para elegir qué error lanzar.
+    """
+    if not rutas:
+        raise ValueError("El diccionario de rutas no debe estar vacío.")
+
+    dtypes = dtypes or {}
+    columnas = columnas or {}
+    esquemas = esquemas or {}
+    max_workers = max_workers or len(rutas)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            nombre: executor.submit(
+                read_file,
+                ruta,
+                dtypes.get(nombre),
+                columnas.get(nombre),
+                schema=esquemas.get(nombre),
+            )
+            for nombre, ruta in rutas.items()
+        }
+
+    # future.result() vuelve a lanzar la excepción del archivo que falló
+    return {nombre: future.result() for nombre, future in futures.items()}
@@ -0,0 +1,182 @@
+"""
+Módulo con un índice de llave primaria sobre un archivo CSV.
+
+`construir_indice` recorre el CSV y guarda en un archivo `.npy`
+una matriz (n × 3) ordenada por llave con la llave, el byte de inicio y el
+byte de fin de cada fila. `IndicePK` abre ese archivo con `mmap_mode="r"` y
+busca llaves con `np.searchsorted` (O(log n)); luego lee del CSV solo los
+bytes de las filas pedidas, sin cargar el archivo completo.
+
+Supone que ningún campo contiene saltos de línea entre comillas, como ocurre
+con los CSV que escribe `DataFrame.to_csv` para estos datos.
+"""
+
+import io
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Columnas de la matriz del índice.
+LLAVE, INICIO, FIN = 0, 1, 2
+
+
+def _ruta_indice(ruta_csv: str) -> str:
+    """Ruta por defecto del índice: junto al CSV, con sufijo `_pk.npy`."""
+    ruta = Path(ruta_csv)
+    return str(ruta.with_name(f"{ruta.stem}_pk.npy"))
+
+
+def construir_indice(
+    ruta_csv: str, column_key: str = "EmployeeID", ruta_indice: Optional[str] = None
+) -> str:
+    """
+    Construye el índice de llave primaria de un CSV.
+
+    Args:
+        ruta_csv (str): Archivo CSV con encabezado.
+        column_key (str, optional): Columna llave; debe ser entera y única.
+        ruta_indice (Optional[str], optional): Archivo `.npy` de salida. Por
+            defecto, `<nombre>_pk.npy` junto al CSV.
+
+    Returns:
+        str: Ruta del índice guardado.
+
+    Raises:
+        KeyError: Si la columna llave no está en el archivo.
+        ValueError: Si la llave no es entera, tiene nulos o valores repetidos.
+    """
+    ruta_indice = ruta_indice or _ruta_indice(ruta_csv)
+    contenido = np.fromfile(ruta_csv, dtype=np.uint8)
+    saltos = np.flatnonzero(contenido == ord("\n"))
+    # Cada fila empieza después de un salto de línea; la primera es el encabezado
+    inicios = saltos + 1
+    inicios = inicios[inicios < len(contenido)]
+    fines = np.append(saltos[1:], len(contenido))[: len(inicios)]
+
+    encabezado = pd.read_csv(ruta_csv, nrows=0).columns
+    if column_key not in encabezado:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {[column_key]}"
+        )
+    llaves = pd.read_csv(ruta_csv, usecols=[column_key])[column_key]
+    if not pd.api.types.is_integer_dtype(llaves):
+        raise ValueError(f"La columna '{column_key}' debe ser entera y sin nulos.")
+    if llaves.duplicated().any():
+        raise ValueError(f"La columna '{column_key}' tiene valores repetidos.")
+    if len(llaves) != len(inicios):
+        raise ValueError(
+            f"El archivo {ruta_csv} tiene {len(inicios)} líneas y {len(llaves)} filas."
+        )
+
+    indice = np.column_stack([llaves.to_numpy(np.int64), inicios, fines])
+    np.save(ruta_indice, indice[np.argsort(indice[:, LLAVE], kind="stable")])
+    return ruta_indice
+
+
+class IndicePK:
+    """
+    Búsqueda de filas por llave primaria sin cargar el CSV.
+
+    Ejemplo:
+    ```python
+    indice = IndicePK(RUTA_ENCODED_DATA)
+    fila = indice.buscar(1)
+    lote = indice.buscar_lote([10, 3, 4410])
+    ```
+    """
+
+    def __init__(
+        self,
+        ruta_csv: str,
+        ruta_indice: Optional[str] = None,
+        dtype: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Abre el índice memory-mapped.
+
+        Args:
+            ruta_csv (str): Archivo CSV indexado.
+            ruta_indice (Optional[str], optional): Archivo `.npy` del índice.
+            dtype (Optional[Dict[str, str]], optional): Tipos por columna al
+                parsear las filas leídas.
+
+        Raises:
+            ValueError: Si el CSV cambió desde que se construyó el índice.
+        """
+        self.ruta_csv = ruta_csv
+        self.dtype = dtype
+        self.indice = np.load(ruta_indice or _ruta_indice(ruta_csv), mmap_mode="r")
+        tamano = Path(ruta_csv).stat().st_size
+        if len(self.indice) and self.indice[:, FIN].max() > tamano:
+            raise ValueError(
+                f"El índice no corresponde al archivo {ruta_csv}; vuelva a construirlo."
+            )
+        with open(ruta_csv, "rb") as f:
+            self.encabezado = f.readline()
+
+    def __len__(self) -> int:
+        """Número de filas indexadas."""
+        return len(self.indice)
+
+    def posiciones(self, claves: Iterable[int]) -> np.ndarray:
+        """
+        Posición en el índice de cada llave (-1 si no existe).
+
+        Args:
+            claves (Iterable[int]): Llaves a buscar.
+
+        Returns:
+            np.ndarray: Posiciones en el índice.
+        """
+        claves = np.asarray(list(claves), dtype=np.int64)
+        llaves = self.indice[:, LLAVE]
+        if not len(llaves):
+            return np.full(len(claves), -1)
+        posiciones = np.minimum(np.searchsorted(llaves, claves), len(llaves) - 1)
+        return np.where(llaves[posiciones] == claves, posiciones, -1)
+
+    def buscar_lote(self, claves: Iterable[int]) -> pd.DataFrame:
+        """
+        Lee las filas de varias llaves, en el orden pedido.
+
+        Args:
+            claves (Iterable[int]): Llaves a buscar.
+
+        Returns:
+            pd.DataFrame: Filas encontradas, con las columnas del CSV.
+
+        Raises:
+            KeyError: Si alguna llave no está en el índice.
+        """
+        claves = list(claves)
+        posiciones = self.posiciones(claves)
+        faltantes = [c for c, p in zip(claves, posiciones) if p < 0]
+        if faltantes:
+            raise KeyError(f"Las siguientes llaves no están en el índice: {faltantes}")
+
+        # Se leen los bytes en orden de archivo y luego se reordena
+        orden = np.argsort(self.indice[posiciones, INICIO], kind="stable")
+        lineas = [self.encabezado]
+        with open(self.ruta_csv, "rb") as f:
+            for inicio, fin in self.indice[posiciones[orden]][:, [INICIO, FIN]]:
+                f.seek(int(inicio))
+                lineas.append(f.read(int(fin - inicio)).rstrip(b"\r\n") + b"\n")
+        filas = pd.read_csv(io.BytesIO(b"".join(lineas)), dtype=self.dtype)
+        return filas.iloc[np.argsort(orden)].reset_index(drop=True)
+
+    def buscar(self, clave: Union[int, np.integer]) -> pd.Series:
+        """
+        Lee la fila de una llave.
+
+        Args:
+            clave (int): Llave a buscar.
+
+        Returns:
+            pd.Series: Fila encontrada.
+
+        Raises:
+            KeyError: Si la llave no está en el índice.
+        """
+        return self.buscar_lote([clave]).iloc[0]
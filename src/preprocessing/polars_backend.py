@@ -0,0 +1,332 @@
+"""
+Backend de ejecución basado en Polars para el preprocesamiento.
+
+Implementa con `LazyFrame` de Polars las mismas transformaciones que
+`read_employee_files`, `read_feedback_files`, `encoding` y `cleaner`. Las
+funciones reciben y retornan `LazyFrame`, de modo que Polars puede optimizar
+el plan completo (proyección y filtros aplicados al leer), ejecutarlo en
+varios hilos y en modo streaming. El resultado se obtiene con `collect()` o,
+para comparar con pandas, con `to_pandas`.
+
+Solo las codificaciones necesitan recorrer los datos antes de terminar el
+plan, para conocer las categorías de cada columna.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Equivalencia entre los tipos de pandas usados en config.DTYPES_FUENTES y los
+# tipos de Polars.
+_TIPOS_POLARS = {
+    "int8": "Int8",
+    "int16": "Int16",
+    "int32": "Int32",
+    "int64": "Int64",
+    "float32": "Float32",
+    "float64": "Float64",
+    "bool": "Boolean",
+}
+
+# Columnas temporales con la posición de las filas de cada lado de una unión.
+_COLUMNAS_ORDEN = ("__fila_izquierda__", "__fila_derecha__")
+
+
+def import_polars():
+    """Importa Polars solo cuando se usa este backend."""
+    import polars as pl
+
+    return pl
+
+
+def to_lazy(df):
+    """Convierte un DataFrame de Polars o pandas en `LazyFrame`."""
+    pl = import_polars()
+    if isinstance(df, pl.LazyFrame):
+        return df
+    if isinstance(df, pd.DataFrame):
+        return pl.from_pandas(df).lazy()
+    return df.lazy()
+
+
+def get_columns(lf) -> List[str]:
+    """Retorna los nombres de columnas de un `LazyFrame` sin ejecutarlo."""
+    return lf.collect_schema().names()
+
+
+def _filter_expression(filters: List[Tuple[str, str, Any]]):
+    """Traduce los filtros de `read_employee_files.read_file` a Polars."""
+    pl = import_polars()
+    expresiones = []
+    for column, op, value in filters:
+        col = pl.col(column)
+        if op == "in":
+            expresion = col.is_in(list(value))
+        elif op == "between":
+            expresion = col.is_between(value[0], value[1], closed="both")
+        elif op == "==":
+            expresion = col == value
+        elif op == "!=":
+            expresion = col != value
+        elif op == "<":
+            expresion = col < value
+        elif op == "<=":
+            expresion = col <= value
+        elif op == ">":
+            expresion = col > value
+        elif op == ">=":
+            expresion = col >= value
+        else:
+            raise ValueError(f"Operador de filtro no soportado: '{op}'.")
+        expresiones.append(expresion.fill_null(False))
+    return pl.all_horizontal(expresiones)
+
+
+def read_file(
+    file: str,
+    dtype: Optional[Dict[str, str]] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+):
+    """
+    Prepara la lectura perezosa de un archivo CSV.
+
+    Parámetros:
+    ----------
+    file : str
+        Ruta al archivo CSV.
+    dtype : dict, opcional
+        Tipos de datos de pandas por columna (por ejemplo, "int64").
+    columns : list, opcional
+        Columnas a retornar, en ese orden. Por defecto, todas.
+    filters : list, opcional
+        Filtros de filas como tuplas (columna, operador, valor), con los
+        mismos operadores que `read_employee_files.read_file`.
+
+    Retorna:
+    -------
+    pl.LazyFrame
+        Plan de lectura; el archivo se lee al ejecutar `collect()`.
+    """
+    if not Path(file).exists():
+        raise FileNotFoundError(f"El archivo {file} no existe.")
+
+    pl = import_polars()
+    overrides = {
+        col: getattr(pl, _TIPOS_POLARS[tipo]) for col, tipo in (dtype or {}).items()
+    }
+    lf = pl.scan_csv(
+        file,
+        null_values=["NA"],
+        schema_overrides=overrides or None,
+        infer_schema_length=None,
+    )
+    if filters:
+        lf = lf.filter(_filter_expression(filters))
+    if columns is not None:
+        lf = lf.select(list(columns))
+    return lf
+
+
+def merge_dataframe(df1, df2, column_join: str):
+    """
+    Une dos dataframes en un único dataframe usando una columna común.
+
+    Parámetros:
+    ----------
+    df1 : pl.LazyFrame, pl.DataFrame o pd.DataFrame
+        Primer DataFrame.
+    df2 : pl.LazyFrame, pl.DataFrame o pd.DataFrame
+        Segundo DataFrame.
+    column_join : str
+        Nombre de la columna común para unir ambos DataFrames.
+
+    Retorna:
+    -------
+    pl.LazyFrame
+        Unión interna que conserva el orden de las filas de `df1`.
+    """
+    lf1, lf2 = to_lazy(df1), to_lazy(df2)
+    if column_join not in get_columns(lf1) or column_join not in get_columns(lf2):
+        raise KeyError(f"La columna '{column_join}' no se encuentra en ambos archivos.")
+
+    # El join de Polars no garantiza el orden de las filas; se recupera con
+    # la posición de cada fila en ambos lados, como en `pd.merge`
+    izquierda, derecha = _COLUMNAS_ORDEN
+    return (
+        lf1.with_row_index(izquierda)
+        .join(lf2.with_row_index(derecha), on=column_join, how="inner")
+        .sort([izquierda, derecha])
+        .drop([izquierda, derecha])
+    )
+
+
+def merge_files(file1: str, file2: str, column_join: str):
+    """
+    Une dos archivos CSV en un único `LazyFrame` usando una columna común.
+
+    Parámetros:
+    ----------
+    file1 : str
+        Ruta al primer archivo CSV.
+    file2 : str
+        Ruta al segundo archivo CSV.
+    column_join : str
+        Nombre de la columna común para unir ambos archivos.
+
+    Retorna:
+    -------
+    pl.LazyFrame
+        Plan de la unión.
+    """
+    return merge_dataframe(read_file(file1), read_file(file2), column_join)
+
+
+def mean_columns(df, columnaName: str, columns: list):
+    """
+    Calcula el promedio por fila de columnas específicas en una nueva columna.
+
+    Igual que en pandas, los valores faltantes se ignoran en el promedio.
+
+    Parámetros:
+    ----------
+    df : pl.LazyFrame, pl.DataFrame o pd.DataFrame
+        Datos de entrada.
+    columnaName : str
+        Nombre de la nueva columna que almacenará el promedio.
+    columns : list
+        Lista de nombres de columnas numéricas para calcular el promedio.
+
+    Retorna:
+    -------
+    pl.LazyFrame
+        Datos con la nueva columna agregada.
+    """
+    if not columns:
+        raise ValueError("La lista de columnas no debe estar vacía.")
+
+    lf = to_lazy(df)
+    missing_cols = [col for col in columns if col not in get_columns(lf)]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    pl = import_polars()
+    return lf.with_columns(
+        pl.mean_horizontal([pl.col(c).cast(pl.Float64) for c in columns]).alias(
+            columnaName
+        )
+    )
+
+
+def get_categories(lf, columns: List[str]) -> Dict[str, list]:
+    """Obtiene en una sola pasada las categorías ordenadas de cada columna."""
+    pl = import_polars()
+    unicos = lf.select(
+        [pl.col(c).drop_nulls().unique().sort().implode() for c in columns]
+    ).collect()
+    return {c: unicos[c][0].to_list() for c in columns}
+
+
+def apply_label_encoding(df, columns):
+    """
+    Aplica Label Encoding a columnas binarias.
+
+    Las categorías se ordenan igual que `sklearn.preprocessing.LabelEncoder`.
+
+    Parámetros:
+    ----------
+      df (pl.LazyFrame): Datos originales.
+      columns (list): Lista de nombres de columnas a codificar.
+
+    Retorna:
+    -------
+      lf_encoded (pl.LazyFrame): Datos con columnas codificadas.
+      encoders (dict): Diccionario con las categorías de cada columna.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+    encoders = get_categories(lf, columns)
+    lf_encoded = lf.with_columns(
+        [
+            pl.col(c).replace_strict(
+                encoders[c], list(range(len(encoders[c]))), return_dtype=pl.Int64
+            )
+            for c in columns
+        ]
+    )
+    return lf_encoded, encoders
+
+
+def apply_one_hot_encoding(df, columns):
+    """
+    Aplica One Hot Encoding con el mismo resultado que pandas.get_dummies.
+
+    Las columnas nuevas se agregan al final, con nombre `<columna>_<valor>`,
+    tipo booleano y categorías ordenadas; las columnas originales se eliminan.
+
+    Parámetros:
+    ----------
+      df (pl.LazyFrame): Datos originales.
+      columns (list): Lista de nombres de columnas a codificar.
+
+    Retorna:
+    -------
+      lf_encoded (pl.LazyFrame): Datos con columnas codificadas.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+    categorias = get_categories(lf, columns)
+    dummies = [
+        (pl.col(c) == valor).fill_null(False).alias(f"{c}_{valor}")
+        for c in columns
+        for valor in categorias[c]
+    ]
+    return lf.with_columns(dummies).drop(columns)
+
+
+def standardize_column_values(df, column: str, mapping: Dict):
+    """
+    Estandariza los valores en una columna de acuerdo a un mapeo.
+
+    Parameters
+    ----------
+    df : pl.LazyFrame, pl.DataFrame o pd.DataFrame
+        Datos con la columna a estandarizar.
+    column : str
+        Nombre de la columna a estandarizar.
+    mapping : Dict
+        Diccionario con el mapeo de valores.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Datos con valores estandarizados.
+    """
+    pl = import_polars()
+    lf = to_lazy(df)
+    if column in get_columns(lf) and mapping:
+        lf = lf.with_columns(pl.col(column).replace(mapping))
+    return lf
+
+
+def to_pandas(df) -> pd.DataFrame:
+    """
+    Ejecuta el plan y convierte el resultado en un DataFrame de pandas.
+
+    Parameters
+    ----------
+    df : pl.LazyFrame o pl.DataFrame
+        Plan o datos de Polars.
+
+    Returns
+    -------
+    pd.DataFrame
+        Resultado materializado.
+    """
+    pl = import_polars()
+    if isinstance(df, pl.LazyFrame):
+        df = df.collect()
+    return df.to_pandas()
@@ -1,29 +1,134 @@
+import operator
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-def read_file(file: str) -> pd.DataFrame:
+from src.preprocessing.fast_join import join_on_key
+from src.preprocessing.schema import ValidadorEsquema
+
+# Tamaño de bloque (en filas) usado al leer un archivo con filtros de filas.
+CHUNKSIZE = 100_000
+
+# Operadores de comparación admitidos en los filtros de filas.
+_OPERADORES = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _filter_mask(df: pd.DataFrame, filters: List[Tuple[str, str, Any]]) -> np.ndarray:
+    """
+    Construye una máscara booleana con la conjunción de todos los filtros.
+
+    Cada filtro es una tupla (columna, operador, valor). Además de los
+    operadores de comparación se admiten "in" (valor es una lista) y
+    "between" (valor es una tupla (mínimo, máximo), ambos incluidos).
+    Los valores faltantes nunca cumplen un filtro.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for column, op, value in filters:
+        serie = df[column]
+        if op == "in":
+            cumple = serie.isin(value)
+        elif op == "between":
+            cumple = serie.between(value[0], value[1])
+        elif op in _OPERADORES:
+            cumple = _OPERADORES[op](serie, value)
+        else:
+            raise ValueError(f"Operador de filtro no soportado: '{op}'.")
+        mask &= cumple.to_numpy(dtype=bool, na_value=False)
+    return mask
+
+
+def read_file(
+    file: str,
+    dtype: Optional[Dict[str, str]] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    chunksize: int = CHUNKSIZE,
+    schema: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> pd.DataFrame:
     """
     Lee un archivo CSV y retorna un DataFrame.
 
+    Las columnas no solicitadas no se llegan a parsear (`usecols`) y, si se
+    indican filtros, el archivo se lee por bloques y cada bloque se filtra
+    antes de acumularse, de modo que las filas descartadas nunca se
+    materializan en el resultado.
+
+    Si se indica un esquema, cada bloque se valida antes de filtrarse y la
+    lectura se detiene en el primer bloque con violaciones.
+
     Parámetros:
     ----------
     file : str
         Ruta al archivo CSV.
+    dtype : dict, opcional
+        Tipos de datos por columna. Las columnas no indicadas se infieren.
+    columns : list, opcional
+        Columnas a retornar, en ese orden. Por defecto, todas.
+    filters : list, opcional
+        Filtros de filas como tuplas (columna, operador, valor). Operadores:
+        "==", "!=", "<", "<=", ">", ">=", "in" y "between". Por ejemplo:
+        [("Department", "==", "Sales"), ("Age", "between", (30, 40))].
+    chunksize : int, opcional
+        Número de filas por bloque al aplicar filtros o validar el esquema.
+    schema : dict, opcional
+        Regla por columna (ver `schema`). Solo se validan las columnas leídas.
 
     Retorna:
     -------
     pd.DataFrame
         DataFrame con el contenido del archivo.
+
+    Excepciones:
+    -----------
+    SchemaValidationError
+        Si algún bloque no cumple el esquema.
     """
     if not Path(file).exists():
         raise FileNotFoundError(f"El archivo {file} no existe.")
-    return pd.read_csv(file)
+
+    usecols = None
+    if columns is not None:
+        filter_cols = [col for col, _, _ in filters or [] if col not in columns]
+        usecols = list(columns) + list(dict.fromkeys(filter_cols))
+
+    validador = None
+    if schema is not None:
+        validador = ValidadorEsquema(
+            {col: regla for col, regla in schema.items() if usecols is None or col in usecols}
+        )
+
+    if not filters and validador is None:
+        df = pd.read_csv(file, dtype=dtype, usecols=usecols)
+    else:
+        chunks = []
+        for chunk in pd.read_csv(file, dtype=dtype, usecols=usecols, chunksize=chunksize):
+            if validador is not None:
+                validador.validate(chunk)
+            if filters:
+                chunk = chunk[_filter_mask(chunk, filters)]
+            chunks.append(chunk)
+        df = pd.concat(chunks, ignore_index=True)
+
+    if columns is not None:
+        df = df[list(columns)]
+    return df
 
 
 def merge_files(file1: str, file2: str, column_join: str) -> pd.DataFrame:
     """
     Une dos archivos CSV en un único DataFrame usando una columna común.
 
+    Si las llaves son enteras y están ordenadas (o son consecutivas), la unión
+    se hace por posición sin tabla hash (ver `fast_join`).
+
     Parámetros:
     ----------
     file1 : str
@@ -44,7 +149,7 @@ def merge_files(file1: str, file2: str, column_join: str) -> pd.DataFrame:
     if column_join not in ds1.columns or column_join not in ds2.columns:
         raise KeyError(f"La columna '{column_join}' no se encuentra en ambos archivos.")
 
-    return pd.merge(ds1, ds2, on=column_join, how="inner")
+    return join_on_key(ds1, ds2, column_join)
 
 def mean_columns(df: pd.DataFrame, columnaName: str, columns: list) -> pd.DataFrame:
     """
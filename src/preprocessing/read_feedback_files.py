@@ -2,6 +2,8 @@
 
 import pandas as pd
 
+from src.preprocessing.fast_join import join_on_key
+
 
 def merge_dataframe(
     df1: pd.DataFrame, df2: pd.DataFrame, column_join: str
@@ -9,6 +11,9 @@ def merge_dataframe(
     """
     Une dos dataframes en un único dataframe usando una columna común.
 
+    Si las llaves son enteras y están ordenadas (o son consecutivas), la unión
+    se hace por posición sin tabla hash (ver `fast_join`).
+
     Parámetros:
     ----------
     df1 : pd.DataFrame
@@ -26,4 +31,4 @@ def merge_dataframe(
     if column_join not in df1.columns or column_join not in df2.columns:
         raise KeyError(f"La columna '{column_join}' no se encuentra en ambos archivos.")
 
-    return pd.merge(df1, df2, on=column_join, how="inner")
+    return join_on_key(df1, df2, column_join)
@@ -0,0 +1,193 @@
+"""
+Módulo para encadenar filtros de filas sin copiar el DataFrame en cada paso.
+
+Cada filtro del preprocesamiento (outliers, duplicados, filas que no cumplen
+el esquema) solo actualiza una máscara booleana sobre el DataFrame original.
+El DataFrame filtrado se construye una sola vez, al final, con
+`materializar`.
+
+Ejemplo:
+```python
+seleccion = (
+    SeleccionFilas(df)
+    .sin_invalidas(ESQUEMAS["general"])
+    .sin_duplicados([EMPLOYEE_COLUMN_JOIN])
+    .sin_outliers(["Age", "MonthlyIncome"], methods=("iqr", "rango"))
+)
+df_limpio = seleccion.materializar()
+print(seleccion.resumen())
+```
+
+Los filtros se evalúan sobre las filas que siguen seleccionadas, en el orden
+en que se llaman: por ejemplo, los estadísticos de los outliers se calculan
+sin las filas ya descartadas por el esquema.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.outlier_detector import outlier_mask
+from src.preprocessing.schema import filas_invalidas
+
+
+class SeleccionFilas:
+    """
+    Máscara de filas seleccionadas de un DataFrame, con el motivo de cada
+    descarte.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Inicializa la selección con todas las filas.
+
+        Args:
+            df (pd.DataFrame): Datos. No se modifican ni se copian.
+        """
+        self.df = df
+        self.mascara = np.ones(len(df), dtype=bool)
+        # Filas descartadas por cada motivo, en el orden en que se aplicaron
+        self.descartes: Dict[str, int] = {}
+
+    @property
+    def filas(self) -> int:
+        """Número de filas seleccionadas."""
+        return int(self.mascara.sum())
+
+    def filtrar(self, descartar, motivo: str) -> "SeleccionFilas":
+        """
+        Descarta las filas marcadas.
+
+        Args:
+            descartar (array-like): Booleano con una posición por fila de
+                `df`; True en las filas a descartar.
+            motivo (str): Nombre del filtro en el resumen.
+
+        Returns:
+            SeleccionFilas: La misma selección, para encadenar filtros.
+
+        Raises:
+            ValueError: Si la máscara no tiene una posición por fila.
+        """
+        descartar = np.asarray(descartar, dtype=bool)
+        if descartar.shape != self.mascara.shape:
+            raise ValueError(
+                f"La máscara tiene {descartar.size} posiciones y el DataFrame "
+                f"{len(self.mascara)} filas."
+            )
+        nuevas = int((self.mascara & descartar).sum())
+        self.mascara &= ~descartar
+        self.descartes[motivo] = self.descartes.get(motivo, 0) + nuevas
+        return self
+
+    def _filtrar_seleccionadas(
+        self, columnas: List[str], funcion: Callable[[pd.DataFrame], Any], motivo: str
+    ) -> "SeleccionFilas":
+        """
+        Evalúa `funcion` solo sobre las columnas necesarias de las filas
+        seleccionadas y descarta las filas que marca.
+        """
+        missing_cols = [col for col in columnas if col not in self.df.columns]
+        if missing_cols:
+            raise KeyError(
+                f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+            )
+        if self.mascara.all():
+            vista = self.df[columnas]
+        else:
+            vista = self.df.loc[self.mascara, columnas]
+        descartar = np.zeros(len(self.mascara), dtype=bool)
+        descartar[np.flatnonzero(self.mascara)] = np.asarray(funcion(vista), dtype=bool)
+        return self.filtrar(descartar, motivo)
+
+    def sin_duplicados(
+        self,
+        subset: Optional[List[str]] = None,
+        keep: str = "first",
+        motivo: str = "duplicados",
+    ) -> "SeleccionFilas":
+        """
+        Descarta las filas repetidas, como `DataFrame.drop_duplicates`.
+
+        Args:
+            subset (Optional[List[str]], optional): Columnas que identifican
+                una fila. Por defecto, todas.
+            keep (str, optional): "first", "last" o False.
+            motivo (str, optional): Nombre del filtro en el resumen.
+        """
+        columnas = list(self.df.columns) if subset is None else list(subset)
+        return self._filtrar_seleccionadas(
+            columnas, lambda vista: vista.duplicated(keep=keep).to_numpy(), motivo
+        )
+
+    def sin_outliers(
+        self, features: List[str], motivo: str = "outliers", **kwargs
+    ) -> "SeleccionFilas":
+        """
+        Descarta los outliers de `outlier_detector.outlier_mask`.
+
+        Args:
+            features (List[str]): Columnas numéricas a revisar.
+            motivo (str, optional): Nombre del filtro en el resumen.
+            **kwargs: Argumentos de `outlier_mask` (methods, group, rangos,
+                isolation, contamination, ...).
+        """
+        group = kwargs.get("group")
+        columnas = list(features) + ([group] if group is not None else [])
+        return self._filtrar_seleccionadas(
+            columnas, lambda vista: outlier_mask(vista, features, **kwargs), motivo
+        )
+
+    def sin_invalidas(
+        self, schema: Dict[str, Dict[str, Any]], motivo: str = "esquema"
+    ) -> "SeleccionFilas":
+        """
+        Descarta las filas que violan el esquema (ver `schema.filas_invalidas`).
+
+        Args:
+            schema (Dict[str, Dict[str, Any]]): Regla de cada columna.
+            motivo (str, optional): Nombre del filtro en el resumen.
+        """
+        return self._filtrar_seleccionadas(
+            list(schema), lambda vista: filas_invalidas(vista, schema), motivo
+        )
+
+    def posiciones(self) -> np.ndarray:
+        """
+        Posiciones (no etiquetas del índice) de las filas seleccionadas.
+
+        Returns:
+            np.ndarray: Posiciones ordenadas, para `df.iloc` o `np.take`.
+        """
+        return np.flatnonzero(self.mascara)
+
+    def materializar(self, columnas: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Construye el DataFrame filtrado. Es la única copia de los datos.
+
+        Args:
+            columnas (Optional[List[str]], optional): Columnas a conservar.
+                Por defecto, todas.
+
+        Returns:
+            pd.DataFrame: Filas seleccionadas, con su índice original.
+        """
+        if columnas is None:
+            return self.df.loc[self.mascara]
+        return self.df.loc[self.mascara, columnas]
+
+    def resumen(self) -> Dict[str, Any]:
+        """
+        Resume los filtros aplicados.
+
+        Returns:
+            Dict[str, Any]: "filas_iniciales", "filas_finales" y "descartes"
+            (filas descartadas por cada motivo). Una fila se cuenta solo en el
+            primer filtro que la descarta.
+        """
+        return {
+            "filas_iniciales": len(self.mascara),
+            "filas_finales": self.filas,
+            "descartes": dict(self.descartes),
+        }
@@ -0,0 +1,364 @@
+"""
+Módulo para validar los datos contra un esquema declarativo.
+
+Un esquema es un diccionario con una regla por columna:
+
+```python
+{
+    "EmployeeID": {"tipo": "int", "nullable": False, "unico": True},
+    "Age": {"tipo": "int", "rango": [18, 100]},
+    "Over18": {"tipo": "str", "valores": ["Y"]},
+    "NumCompaniesWorked": {"tipo": "float", "nullable": True, "rango": [0, None]},
+}
+```
+
+Claves de cada regla (todas opcionales):
+
+- "tipo": "int", "float" o "str".
+- "nullable": si se permiten valores faltantes (por defecto False).
+- "rango": mínimo y máximo permitidos, ambos incluidos; None si no hay límite.
+- "valores": lista de categorías permitidas.
+- "unico": si los valores no pueden repetirse en todo el archivo.
+
+`ValidadorEsquema` revisa cada bloque con operaciones vectorizadas y recuerda
+los valores de las columnas únicas para detectar repetidos entre bloques.
+`read_employee_files.read_file(..., schema=...)` lo aplica a cada bloque
+leído y se detiene en el primer bloque con violaciones.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Tipos admitidos y la verificación de tipo de pandas correspondiente.
+TIPOS = {
+    "int": pd.api.types.is_integer_dtype,
+    "float": pd.api.types.is_numeric_dtype,
+    "str": lambda dtype: pd.api.types.is_object_dtype(dtype)
+    or pd.api.types.is_string_dtype(dtype)
+    or isinstance(dtype, pd.CategoricalDtype),
+}
+
+# Número máximo de ejemplos de valores inválidos por violación.
+MAX_EJEMPLOS = 5
+
+
+class SchemaValidationError(ValueError):
+    """Error con el resumen de las violaciones del esquema."""
+
+    def __init__(self, violaciones: List[Dict[str, Any]]):
+        """
+        Inicializa el error.
+
+        Args:
+            violaciones (List[Dict[str, Any]]): Violaciones encontradas, con
+                las claves "columna", "regla", "filas" y "ejemplos".
+        """
+        self.violaciones = violaciones
+        detalle = "\n- ".join(
+            f"{v['columna']}: {v['regla']} "
+            f"({v['filas']} filas, ejemplos: {v['ejemplos']})"
+            for v in violaciones
+        )
+        super().__init__(f"Los datos no cumplen el esquema:\n- {detalle}")
+
+
+def _ejemplos(valores: pd.Series) -> list:
+    """Primeros valores distintos de una serie, como tipos de Python."""
+    return [
+        v.item() if hasattr(v, "item") else v
+        for v in pd.unique(valores.to_numpy())[:MAX_EJEMPLOS]
+    ]
+
+
+def _claves(valores: pd.Series) -> np.ndarray:
+    """
+    Valores de una columna única como arreglo de NumPy ordenable.
+
+    Los enteros se comparan como int64, los demás números como float64 y el
+    resto por su texto.
+    """
+    if pd.api.types.is_integer_dtype(valores.dtype):
+        return valores.to_numpy(dtype=np.int64)
+    if pd.api.types.is_numeric_dtype(valores.dtype):
+        return valores.to_numpy(dtype=np.float64)
+    return valores.astype(str).to_numpy(dtype=str)
+
+
+def _compatibles(
+    vistos: np.ndarray, claves: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lleva las claves de dos bloques a un tipo común (texto si uno tiene
+    números y el otro textos).
+    """
+    if (vistos.dtype.kind == "U") != (claves.dtype.kind == "U"):
+        return vistos.astype(str), claves.astype(str)
+    tipo = np.result_type(vistos, claves)
+    return vistos.astype(tipo, copy=False), claves.astype(tipo, copy=False)
+
+
+def _unicidad(vistos: np.ndarray, claves: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Marca las claves repetidas en el bloque o ya vistas en bloques anteriores.
+
+    El bloque se ordena una vez; con eso se encuentran sus repetidos
+    (vecinos iguales) y se buscan todas sus claves en `vistos` con búsqueda
+    binaria. Las claves nuevas se intercalan en su posición, sin volver a
+    ordenar las de los bloques anteriores.
+
+    Args:
+        vistos (np.ndarray): Claves de los bloques anteriores, ordenadas y
+            sin repetir.
+        claves (np.ndarray): Claves del bloque.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Máscara de repetidos en el orden del
+        bloque y las claves vistas actualizadas.
+    """
+    orden = np.argsort(claves)
+    ordenadas = claves[orden]
+    primera = np.ones(len(ordenadas), dtype=bool)
+    primera[1:] = ordenadas[1:] != ordenadas[:-1]
+    ultima = np.ones(len(ordenadas), dtype=bool)
+    ultima[:-1] = primera[1:]
+
+    posiciones = np.searchsorted(vistos, ordenadas)
+    en_vistos = np.zeros(len(ordenadas), dtype=bool)
+    if len(vistos):
+        en_vistos = vistos[np.minimum(posiciones, len(vistos) - 1)] == ordenadas
+
+    repetidos = np.empty(len(claves), dtype=bool)
+    repetidos[orden] = en_vistos | ~(primera & ultima)
+    # Mezcla de dos arreglos ordenados: cada clave nueva se desplaza por las
+    # nuevas que la preceden (np.insert volvería a ordenar las posiciones)
+    nuevas = primera & ~en_vistos
+    destino = posiciones[nuevas] + np.arange(nuevas.sum())
+    union = np.empty(len(vistos) + len(destino), dtype=vistos.dtype)
+    es_nueva = np.zeros(len(union), dtype=bool)
+    es_nueva[destino] = True
+    union[destino] = ordenadas[nuevas]
+    union[~es_nueva] = vistos
+    return repetidos, union
+
+
+def validar_esquema(schema: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Verifica que el esquema esté bien definido.
+
+    Raises:
+        ValueError: Si alguna regla tiene claves o tipos no soportados.
+    """
+    claves = {"tipo", "nullable", "rango", "valores", "unico"}
+    for columna, regla in schema.items():
+        desconocidas = set(regla) - claves
+        if desconocidas:
+            raise ValueError(
+                f"Claves no soportadas en la regla de '{columna}': "
+                f"{sorted(desconocidas)}"
+            )
+        if "tipo" in regla and regla["tipo"] not in TIPOS:
+            raise ValueError(f"Tipo no soportado en '{columna}': '{regla['tipo']}'.")
+
+
+class ValidadorEsquema:
+    """
+    Valida bloques de un mismo archivo contra un esquema.
+
+    Ejemplo:
+    ```python
+    validador = ValidadorEsquema(ESQUEMAS["general"])
+    for chunk in pd.read_csv(RUTA_GENERAL, chunksize=100_000):
+        validador.validate(chunk)
+    ```
+    """
+
+    def __init__(self, schema: Dict[str, Dict[str, Any]]):
+        """
+        Inicializa el validador.
+
+        Args:
+            schema (Dict[str, Dict[str, Any]]): Regla de cada columna.
+        """
+        validar_esquema(schema)
+        self.schema = schema
+        self.filas = 0
+        # Valores ya vistos de cada columna única, ordenados y sin repetir
+        self._vistos: Dict[str, np.ndarray] = {}
+
+    def check(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Revisa un bloque y retorna sus violaciones sin lanzar errores.
+
+        Args:
+            df (pd.DataFrame): Bloque a validar.
+
+        Returns:
+            List[Dict[str, Any]]: Violaciones encontradas en el bloque.
+        """
+        violaciones = []
+
+        def agregar(columna, regla, invalidos):
+            if len(invalidos):
+                violaciones.append(
+                    {
+                        "columna": columna,
+                        "regla": regla,
+                        "filas": int(len(invalidos)),
+                        "ejemplos": _ejemplos(invalidos),
+                    }
+                )
+
+        missing_cols = [col for col in self.schema if col not in df.columns]
+        for col in missing_cols:
+            violaciones.append(
+                {
+                    "columna": col,
+                    "regla": "columna faltante",
+                    "filas": 0,
+                    "ejemplos": [],
+                }
+            )
+
+        for col, regla in self.schema.items():
+            if col in missing_cols:
+                continue
+            serie = df[col]
+            nulos = serie.isna().to_numpy()
+            if not regla.get("nullable", False) and nulos.any():
+                violaciones.append(
+                    {
+                        "columna": col,
+                        "regla": "valores nulos",
+                        "filas": int(nulos.sum()),
+                        "ejemplos": [],
+                    }
+                )
+            presentes = serie[~nulos]
+
+            numeros = None
+            tipo = regla.get("tipo")
+            if tipo in ("int", "float") or "rango" in regla:
+                numeros = pd.to_numeric(presentes, errors="coerce")
+                agregar(
+                    col, "valores no numéricos", presentes[numeros.isna().to_numpy()]
+                )
+            if tipo == "int" and not TIPOS["int"](serie.dtype):
+                # Una columna entera con nulos se lee como float
+                no_enteros = numeros.notna().to_numpy() & (
+                    numeros.to_numpy(dtype=float, na_value=np.nan) % 1 != 0
+                )
+                agregar(col, "valores no enteros", presentes[no_enteros])
+            if tipo == "str" and not TIPOS["str"](serie.dtype):
+                agregar(col, "valores no texto", presentes)
+
+            if "rango" in regla:
+                minimo, maximo = regla["rango"]
+                valores = numeros.to_numpy(dtype=float, na_value=np.nan)
+                fuera = np.zeros(len(valores), dtype=bool)
+                if minimo is not None:
+                    fuera |= valores < minimo
+                if maximo is not None:
+                    fuera |= valores > maximo
+                agregar(col, f"fuera de rango {regla['rango']}", presentes[fuera])
+
+            if "valores" in regla:
+                no_permitidos = ~presentes.isin(regla["valores"]).to_numpy()
+                agregar(col, "categoría no permitida", presentes[no_permitidos])
+
+            if regla.get("unico"):
+                claves = _claves(presentes)
+                vistos, claves = _compatibles(self._vistos.get(col, claves[:0]), claves)
+                repetidos, self._vistos[col] = _unicidad(vistos, claves)
+                agregar(col, "valores repetidos", presentes[repetidos])
+
+        self.filas += len(df)
+        return violaciones
+
+    def validate(self, df: pd.DataFrame) -> None:
+        """
+        Revisa un bloque y lanza un error si tiene violaciones.
+
+        Args:
+            df (pd.DataFrame): Bloque a validar.
+
+        Raises:
+            SchemaValidationError: Con el resumen de las violaciones.
+        """
+        violaciones = self.check(df)
+        if violaciones:
+            raise SchemaValidationError(violaciones)
+
+
+def validate_dataframe(df: pd.DataFrame, schema: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Valida un DataFrame completo contra un esquema.
+
+    Args:
+        df (pd.DataFrame): Datos a validar.
+        schema (Dict[str, Dict[str, Any]]): Regla de cada columna.
+
+    Raises:
+        SchemaValidationError: Con el resumen de las violaciones.
+    """
+    ValidadorEsquema(schema).validate(df)
+
+
+def filas_invalidas(df: pd.DataFrame, schema: Dict[str, Dict[str, Any]]) -> np.ndarray:
+    """
+    Marca las filas que violan alguna regla del esquema.
+
+    A diferencia de `ValidadorEsquema.check`, que resume las violaciones, aquí
+    se obtiene una máscara por fila para descartar solo las filas inválidas.
+    En las columnas "unico" se conserva la primera aparición de cada valor.
+
+    Args:
+        df (pd.DataFrame): Datos a revisar.
+        schema (Dict[str, Dict[str, Any]]): Regla de cada columna.
+
+    Returns:
+        np.ndarray: Arreglo booleano, True en las filas inválidas.
+
+    Raises:
+        KeyError: Si alguna columna del esquema no está en el DataFrame.
+    """
+    validar_esquema(schema)
+    missing_cols = [col for col in schema if col not in df.columns]
+    if missing_cols:
+        raise KeyError(
+            f"Las siguientes columnas no están en el DataFrame: {missing_cols}"
+        )
+
+    invalidas = np.zeros(len(df), dtype=bool)
+    for col, regla in schema.items():
+        serie = df[col]
+        nulos = serie.isna().to_numpy()
+        if not regla.get("nullable", False):
+            invalidas |= nulos
+
+        tipo = regla.get("tipo")
+        if tipo in ("int", "float") or "rango" in regla:
+            valores = pd.to_numeric(serie, errors="coerce").to_numpy(
+                dtype=float, na_value=np.nan
+            )
+            invalidas |= np.isnan(valores) & ~nulos
+            with np.errstate(invalid="ignore"):
+                if tipo == "int":
+                    invalidas |= ~np.isnan(valores) & (valores % 1 != 0)
+                if "rango" in regla:
+                    minimo, maximo = regla["rango"]
+                    if minimo is not None:
+                        invalidas |= valores < minimo
+                    if maximo is not None:
+                        invalidas |= valores > maximo
+
+        if tipo == "str" and not TIPOS["str"](serie.dtype):
+            invalidas |= ~nulos
+
+        if "valores" in regla:
+            invalidas |= ~serie.isin(regla["valores"]).to_numpy() & ~nulos
+
+        if regla.get("unico"):
+            invalidas |= serie.duplicated(keep="first").to_numpy() & ~nulos
+    return invalidas
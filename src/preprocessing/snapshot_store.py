@@ -0,0 +1,437 @@
+"""
+Módulo para guardar el historial de extractos mensuales de empleados.
+
+Cada extracto (por ejemplo, `general_data.csv` de un mes) se guarda como una
+partición Parquet por fecha de snapshot que solo contiene las diferencias con
+el snapshot anterior:
+
+```
+<raiz>/
+    manifest.json
+    snapshot_date=2024-01-31/cambios.parquet   # altas y filas modificadas
+    snapshot_date=2024-02-29/cambios.parquet
+    snapshot_date=2024-02-29/bajas.parquet     # EmployeeID que desaparecen
+```
+
+Un empleado sin cambios no se vuelve a escribir, por lo que el historial
+crece con los cambios y no con el número de empleados por mes. A partir de
+estas particiones se reconstruye el estado a cualquier fecha, los cambios
+entre dos snapshots y variables longitudinales, sin volver a leer los CSV.
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.config import EMPLOYEE_COLUMN_JOIN
+from src.preprocessing.read_employee_files import read_file
+
+# Columnas internas agregadas a los cambios leídos de las particiones.
+_COLUMNA_SNAPSHOT = "__snapshot"
+_COLUMNA_BAJA = "__baja"
+_COLUMNA_FILA = "__fila"
+
+
+def _normalizar_fecha(fecha: Union[str, date, pd.Timestamp]) -> str:
+    """Convierte una fecha en texto ISO (AAAA-MM-DD)."""
+    return pd.Timestamp(fecha).date().isoformat()
+
+
+def _diferencias(anterior: pd.DataFrame, actual: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compara dos DataFrames indexados por la misma clave.
+
+    Retorna un DataFrame booleano (clave × columna de `actual`) que indica
+    qué valores cambiaron. Dos valores faltantes se consideran iguales y una
+    columna que no existía antes cuenta como cambio.
+    """
+    anterior = anterior.reindex(index=actual.index, columns=actual.columns)
+    distinto = actual.ne(anterior) & ~(actual.isna() & anterior.isna())
+    return distinto.fillna(True).astype(bool)
+
+
+class SnapshotStore:
+    """
+    Historial de snapshots de un dataset de empleados.
+
+    Ejemplo:
+    ```python
+    store = SnapshotStore(RUTA_SNAPSHOTS)
+    store.ingest(RUTA_GENERAL, "2024-01-31")
+    store.ingest(df_febrero, "2024-02-29")
+
+    df_enero = store.as_of("2024-01-31")
+    cambios = store.changes("2024-01-31", "2024-02-29")
+    features = store.caracteristicas_longitudinales()
+    ```
+    """
+
+    def __init__(self, raiz: str, column_key: str = EMPLOYEE_COLUMN_JOIN):
+        """
+        Abre (o crea) un historial en un directorio.
+
+        Args:
+            raiz (str): Directorio del historial.
+            column_key (str, optional): Columna que identifica a cada empleado.
+        """
+        self.raiz = Path(raiz)
+        self.column_key = column_key
+        self._ruta_manifest = self.raiz / "manifest.json"
+        if self._ruta_manifest.exists():
+            self.manifest = json.loads(self._ruta_manifest.read_text(encoding="utf-8"))
+            if self.manifest["column_key"] != column_key:
+                raise ValueError(
+                    f"El historial usa la clave '{self.manifest['column_key']}', "
+                    f"no '{column_key}'."
+                )
+        else:
+            self.manifest = {"column_key": column_key, "snapshots": []}
+
+    @property
+    def snapshots(self) -> List[str]:
+        """Fechas de los snapshots guardados, en orden cronológico."""
+        return [s["fecha"] for s in self.manifest["snapshots"]]
+
+    def _particion(self, fecha: str) -> Path:
+        """Directorio de la partición de una fecha."""
+        return self.raiz / f"snapshot_date={fecha}"
+
+    def _guardar_manifest(self) -> None:
+        """Escribe el manifiesto del historial."""
+        self.raiz.mkdir(parents=True, exist_ok=True)
+        self._ruta_manifest.write_text(
+            json.dumps(self.manifest, indent=2), encoding="utf-8"
+        )
+
+    def ingest(
+        self, datos: Union[str, pd.DataFrame], fecha: Union[str, date]
+    ) -> Dict[str, int]:
+        """
+        Agrega un extracto al historial.
+
+        Solo se escriben las altas, las filas modificadas y las bajas respecto
+        del último snapshot. Los snapshots deben agregarse en orden
+        cronológico.
+
+        Args:
+            datos (Union[str, pd.DataFrame]): Ruta al CSV del extracto o
+                DataFrame ya cargado.
+            fecha (Union[str, date]): Fecha del snapshot.
+
+        Returns:
+            Dict[str, int]: Número de altas, modificaciones, bajas y filas
+            sin cambios.
+
+        Raises:
+            KeyError: Si el extracto no tiene la columna clave.
+            ValueError: Si la fecha no es posterior al último snapshot o la
+                clave tiene valores repetidos.
+        """
+        fecha = _normalizar_fecha(fecha)
+        if self.snapshots and fecha <= self.snapshots[-1]:
+            raise ValueError(
+                f"La fecha {fecha} debe ser posterior al último snapshot "
+                f"({self.snapshots[-1]})."
+            )
+
+        df = read_file(datos) if isinstance(datos, str) else datos
+        if self.column_key not in df.columns:
+            raise KeyError(f"La columna '{self.column_key}' no está en el DataFrame.")
+        if df[self.column_key].duplicated().any():
+            raise ValueError(f"La columna '{self.column_key}' tiene valores repetidos.")
+
+        actual = df.set_index(self.column_key)
+        anterior = (
+            self.as_of(self.snapshots[-1]).set_index(self.column_key)
+            if self.snapshots
+            else actual.iloc[:0]
+        )
+
+        nuevas = ~actual.index.isin(anterior.index)
+        modificadas = ~nuevas & _diferencias(anterior, actual).any(axis=1).to_numpy()
+        bajas = anterior.index[~anterior.index.isin(actual.index)]
+
+        particion = self._particion(fecha)
+        particion.mkdir(parents=True, exist_ok=True)
+        # Se conserva el orden original de las columnas del extracto
+        cambios = df[nuevas | modificadas]
+        if len(cambios):
+            cambios.to_parquet(particion / "cambios.parquet", index=False)
+        if len(bajas):
+            pd.DataFrame({self.column_key: bajas}).to_parquet(
+                particion / "bajas.parquet", index=False
+            )
+
+        resumen = {
+            "altas": int(nuevas.sum()),
+            "modificaciones": int(modificadas.sum()),
+            "bajas": int(len(bajas)),
+            "sin_cambios": int(len(actual) - nuevas.sum() - modificadas.sum()),
+        }
+        self.manifest["snapshots"].append({"fecha": fecha, **resumen})
+        self._guardar_manifest()
+        return resumen
+
+    @staticmethod
+    def _leer_cambios(ruta: Path, columns: Optional[List[str]]) -> pd.DataFrame:
+        """
+        Lee los cambios de una partición.
+
+        Los extractos pueden agregar o quitar columnas entre meses: solo se
+        leen las columnas que existen en el esquema de la partición y las
+        demás se completan con valores faltantes.
+        """
+        if columns is None:
+            return pd.read_parquet(ruta)
+        import pyarrow.parquet as pq
+
+        presentes = set(pq.read_schema(ruta).names)
+        df = pd.read_parquet(ruta, columns=[c for c in columns if c in presentes])
+        return df.reindex(columns=columns)
+
+    def _leer_eventos(
+        self, hasta: Optional[str] = None, columns: Optional[List[str]] = None
+    ):
+        """
+        Lee las particiones hasta una fecha.
+
+        Retorna los cambios (con el índice del snapshot en `__snapshot`) y
+        los eventos de todos los empleados, ordenados por clave y snapshot.
+        Cada evento indica si es una baja y, si es un cambio, su fila en los
+        cambios (`__fila`).
+        """
+        fechas = [f for f in self.snapshots if hasta is None or f <= hasta]
+        if columns is not None:
+            columns = [self.column_key] + [
+                col for col in columns if col != self.column_key
+            ]
+
+        cambios, bajas = [], []
+        for i, fecha in enumerate(fechas):
+            particion = self._particion(fecha)
+            if (particion / "cambios.parquet").exists():
+                df = self._leer_cambios(particion / "cambios.parquet", columns)
+                cambios.append(df.assign(**{_COLUMNA_SNAPSHOT: i}))
+            if (particion / "bajas.parquet").exists():
+                df = pd.read_parquet(particion / "bajas.parquet")
+                bajas.append(df.assign(**{_COLUMNA_SNAPSHOT: i}))
+
+        if not cambios:
+            raise ValueError("No hay snapshots guardados hasta la fecha indicada.")
+        cambios = pd.concat(cambios, ignore_index=True)
+
+        eventos = [
+            cambios[[self.column_key, _COLUMNA_SNAPSHOT]].assign(
+                **{_COLUMNA_BAJA: False, _COLUMNA_FILA: np.arange(len(cambios))}
+            )
+        ]
+        eventos += [
+            df.assign(**{_COLUMNA_BAJA: True, _COLUMNA_FILA: -1}) for df in bajas
+        ]
+        eventos = pd.concat(eventos, ignore_index=True).sort_values(
+            [self.column_key, _COLUMNA_SNAPSHOT], kind="stable", ignore_index=True
+        )
+        return fechas, cambios, eventos
+
+    def as_of(
+        self, fecha: Union[str, date], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Reconstruye el dataset tal como estaba en una fecha.
+
+        Args:
+            fecha (Union[str, date]): Fecha de consulta. Se usa el último
+                snapshot con fecha menor o igual.
+            columns (Optional[List[str]], optional): Columnas a leer. La clave
+                siempre se incluye.
+
+        Returns:
+            pd.DataFrame: Empleados activos en esa fecha, ordenados por clave.
+        """
+        _, cambios, eventos = self._leer_eventos(_normalizar_fecha(fecha), columns)
+
+        ultimos = eventos.drop_duplicates(self.column_key, keep="last")
+        activos = ultimos.loc[~ultimos[_COLUMNA_BAJA], self.column_key]
+
+        estado = cambios.sort_values(_COLUMNA_SNAPSHOT, kind="stable").drop_duplicates(
+            self.column_key, keep="last"
+        )
+        estado = estado[estado[self.column_key].isin(activos)]
+        return (
+            estado.drop(columns=_COLUMNA_SNAPSHOT)
+            .sort_values(self.column_key)
+            .reset_index(drop=True)
+        )
+
+    def changes(
+        self, fecha_inicio: Union[str, date], fecha_fin: Union[str, date]
+    ) -> pd.DataFrame:
+        """
+        Lista los empleados que cambiaron entre dos snapshots.
+
+        Args:
+            fecha_inicio (Union[str, date]): Fecha del primer snapshot.
+            fecha_fin (Union[str, date]): Fecha del segundo snapshot.
+
+        Returns:
+            pd.DataFrame: Columnas clave, `tipo_cambio` ("alta", "baja" o
+            "modificacion") y `columnas_modificadas`.
+        """
+        inicio = self.as_of(fecha_inicio).set_index(self.column_key)
+        fin = self.as_of(fecha_fin).set_index(self.column_key)
+
+        comunes = fin.index.intersection(inicio.index)
+        distinto = _diferencias(inicio.loc[comunes], fin.loc[comunes])
+        modificadas = distinto[distinto.any(axis=1)]
+        columnas = np.array(distinto.columns, dtype=object)
+
+        partes = [
+            pd.DataFrame(
+                {
+                    self.column_key: fin.index.difference(inicio.index),
+                    "tipo_cambio": "alta",
+                }
+            ),
+            pd.DataFrame(
+                {
+                    self.column_key: inicio.index.difference(fin.index),
+                    "tipo_cambio": "baja",
+                }
+            ),
+            pd.DataFrame(
+                {
+                    self.column_key: modificadas.index,
+                    "tipo_cambio": "modificacion",
+                    "columnas_modificadas": [
+                        list(columnas[fila]) for fila in modificadas.to_numpy()
+                    ],
+                }
+            ),
+        ]
+        resultado = pd.concat(partes, ignore_index=True)
+        resultado["columnas_modificadas"] = [
+            valor if isinstance(valor, list) else []
+            for valor in resultado["columnas_modificadas"]
+        ]
+        return resultado.sort_values(self.column_key, ignore_index=True)
+
+    def historia(
+        self,
+        columns: Optional[List[str]] = None,
+        hasta: Optional[Union[str, date]] = None,
+    ) -> pd.DataFrame:
+        """
+        Construye el panel completo (empleado × snapshot) a partir de los cambios.
+
+        Cada cambio se repite en todos los snapshots siguientes hasta el
+        próximo cambio o baja del mismo empleado, sin recorrer los empleados
+        uno por uno.
+
+        Args:
+            columns (Optional[List[str]], optional): Columnas a leer.
+            hasta (Optional[Union[str, date]], optional): Última fecha a incluir.
+
+        Returns:
+            pd.DataFrame: Una fila por empleado activo y snapshot, con la
+            columna `snapshot_date`, ordenada por clave y fecha.
+        """
+        hasta = None if hasta is None else _normalizar_fecha(hasta)
+        fechas, cambios, eventos = self._leer_eventos(hasta, columns)
+
+        # Un evento es válido hasta el siguiente evento del mismo empleado
+        claves = eventos[self.column_key].to_numpy()
+        inicio = eventos[_COLUMNA_SNAPSHOT].to_numpy()
+        fin = np.append(inicio[1:], len(fechas))
+        ultimo_de_clave = np.append(claves[1:] != claves[:-1], True)
+        fin = np.where(ultimo_de_clave, len(fechas), fin)
+
+        es_cambio = ~eventos[_COLUMNA_BAJA].to_numpy()
+        inicio, fin = inicio[es_cambio], fin[es_cambio]
+        repeticiones = fin - inicio
+
+        filas = np.repeat(eventos[_COLUMNA_FILA].to_numpy()[es_cambio], repeticiones)
+        desplazamiento = np.arange(repeticiones.sum()) - np.repeat(
+            np.cumsum(repeticiones) - repeticiones, repeticiones
+        )
+        snapshot = np.repeat(inicio, repeticiones) + desplazamiento
+
+        panel = cambios.iloc[filas].drop(columns=_COLUMNA_SNAPSHOT)
+        panel.insert(1, "snapshot_date", pd.to_datetime(np.asarray(fechas)[snapshot]))
+        return panel.sort_values([self.column_key, "snapshot_date"], ignore_index=True)
+
+    def caracteristicas_longitudinales(
+        self,
+        columna_salario: str = "MonthlyIncome",
+        columna_satisfaccion: Optional[str] = None,
+        hasta: Optional[Union[str, date]] = None,
+    ) -> pd.DataFrame:
+        """
+        Calcula variables longitudinales por empleado a partir del historial.
+
+        - `crecimiento_salario`: variación relativa entre el primer y el
+          último salario observado.
+        - `tendencia_satisfaccion`: pendiente (por mes) de la recta de mínimos
+          cuadrados de la satisfacción en el tiempo. Solo si se indica
+          `columna_satisfaccion`: los extractos de general_data.csv no la
+          tienen; se agrega al unir la encuesta de empleados (por ejemplo,
+          COLUMN_AVERAGE_EMPLOYEE_SATISFACTION).
+
+        Solo se leen las columnas necesarias de las particiones.
+
+        Args:
+            columna_salario (str, optional): Columna de salario.
+            columna_satisfaccion (Optional[str], optional): Columna de
+                satisfacción.
+            hasta (Optional[Union[str, date]], optional): Última fecha a incluir.
+
+        Returns:
+            pd.DataFrame: Una fila por empleado con `n_snapshots`,
+            `crecimiento_salario` y, si se indica la columna de satisfacción,
+            `tendencia_satisfaccion`.
+        """
+        columnas = [columna_salario]
+        if columna_satisfaccion is not None:
+            columnas.append(columna_satisfaccion)
+        panel = self.historia(columnas, hasta)
+        grupos = panel.groupby(self.column_key, sort=True)
+
+        salario = grupos[columna_salario]
+        primero, ultimo = salario.first(), salario.last()
+        resultado = pd.DataFrame(
+            {
+                "n_snapshots": grupos.size(),
+                "crecimiento_salario": ultimo / primero - 1,
+            }
+        )
+        if columna_satisfaccion is None:
+            return resultado.reset_index()
+
+        # Pendiente con sumas por grupo: (nΣxy - ΣxΣy) / (nΣx² - (Σx)²)
+        fechas = panel["snapshot_date"].dt
+        datos = pd.DataFrame(
+            {
+                self.column_key: panel[self.column_key],
+                "x": (fechas.year * 12 + fechas.month).astype(float),
+                "y": panel[columna_satisfaccion].astype(float),
+            }
+        ).dropna()
+        datos["xy"] = datos["x"] * datos["y"]
+        datos["xx"] = datos["x"] ** 2
+        sumas = datos.groupby(self.column_key, sort=True).agg(
+            n=("x", "size"),
+            x=("x", "sum"),
+            y=("y", "sum"),
+            xy=("xy", "sum"),
+            xx=("xx", "sum"),
+        )
+        denominador = sumas["n"] * sumas["xx"] - sumas["x"] ** 2
+        pendiente = (sumas["n"] * sumas["xy"] - sumas["x"] * sumas["y"]) / (
+            denominador.where(denominador != 0)
+        )
+
+        resultado["tendencia_satisfaccion"] = pendiente.reindex(primero.index)
+        return resultado.reset_index()
@@ -4,6 +4,7 @@ import tempfile
 import os
 
 from src.preprocessing.read_employee_files import read_file, merge_files, mean_columns
+from src.preprocessing.schema import SchemaValidationError
 
 @pytest.fixture
 def sample_files():
@@ -70,4 +71,81 @@ def test_mean_columns_empty_list():
         "A": [1, 2]
     })
     with pytest.raises(ValueError):
-        mean_columns(df, "prom", [])
\ No newline at end of file
+        mean_columns(df, "prom", [])
+
+@pytest.fixture
+def departments_file():
+    """Crea un archivo temporal con departamentos y edades para probar filtros."""
+    file = tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".csv")
+    file.write(
+        "EmployeeID,Department,Age,Name\n"
+        "1,Sales,41,Ana\n"
+        "2,Research & Development,49,Juan\n"
+        "3,Sales,37,Luis\n"
+        "4,Human Resources,33,Rosa\n"
+        "5,Sales,,Eva\n"
+    )
+    file.close()
+
+    yield file.name
+
+    os.unlink(file.name)
+
+def test_read_file_columns(departments_file):
+    """Verifica que read_file retorna solo las columnas solicitadas y en ese orden."""
+    df = read_file(departments_file, columns=["Name", "EmployeeID"])
+    assert list(df.columns) == ["Name", "EmployeeID"]
+    assert len(df) == 5
+
+def test_read_file_filtro_igualdad(departments_file):
+    """Verifica que read_file filtra filas por igualdad sin retornar la columna del filtro."""
+    df = read_file(
+        departments_file,
+        columns=["EmployeeID"],
+        filters=[("Department", "==", "Sales")],
+        chunksize=2,
+    )
+    assert list(df.columns) == ["EmployeeID"]
+    assert df["EmployeeID"].tolist() == [1, 3, 5]
+    assert df.index.tolist() == [0, 1, 2]
+
+def test_read_file_filtro_rango(departments_file):
+    """Verifica que read_file combina filtros de rango e ignora valores faltantes."""
+    df = read_file(
+        departments_file,
+        filters=[("Age", "between", (35, 45)), ("Department", "in", ["Sales"])],
+    )
+    assert df["EmployeeID"].tolist() == [1, 3]
+    assert list(df.columns) == ["EmployeeID", "Department", "Age", "Name"]
+
+def test_read_file_filtro_sin_coincidencias(departments_file):
+    """Verifica que read_file retorna un DataFrame vacío si ninguna fila cumple el filtro."""
+    df = read_file(departments_file, filters=[("Age", ">", 100)])
+    assert df.empty
+    assert "Name" in df.columns
+
+def test_read_file_operador_invalido(departments_file):
+    """Verifica que read_file lanza un error con un operador no soportado."""
+    with pytest.raises(ValueError):
+        read_file(departments_file, filters=[("Age", "~", 1)])
+
+def test_read_file_con_esquema_valido(departments_file):
+    """Verifica que read_file valida el esquema por bloques y retorna los datos."""
+    schema = {
+        "EmployeeID": {"tipo": "int", "unico": True},
+        "Department": {
+            "tipo": "str",
+            "valores": ["Sales", "Research & Development", "Human Resources"],
+        },
+        "Age": {"tipo": "float", "nullable": True, "rango": [18, 100]},
+    }
+    df = read_file(departments_file, schema=schema, chunksize=2)
+    assert len(df) == 5
+
+def test_read_file_esquema_detiene_lectura(departments_file):
+    """Verifica que read_file falla con el resumen de las violaciones."""
+    schema = {"EmployeeID": {"tipo": "int", "rango": [1, 2]}}
+    with pytest.raises(SchemaValidationError) as error:
+        read_file(departments_file, schema=schema, chunksize=2)
+    # Se detiene en el segundo bloque, el primero con violaciones
+    assert error.value.violaciones[0]["ejemplos"] == [3, 4]
@@ -47,4 +47,11 @@ def test_columnas_base_estan_presentes():
     """Verifica que las columnas base requeridas para el promedio estén presentes en el DataFrame resultante."""
     df = procesar_encuesta_empleados()
     for col in MEAN_COLUMNS:
-        assert col in df.columns
\ No newline at end of file
+        assert col in df.columns
+
+def test_procesar_con_dataframes_precargados():
+    """Verifica que usar DataFrames ya cargados da el mismo resultado que leer los archivos."""
+    df_general = pd.read_csv(RUTA_GENERAL)
+    df_encuesta = pd.read_csv(RUTA_EMPLOYEE_SURVEY)
+    df = procesar_encuesta_empleados(df_general, df_encuesta)
+    pd.testing.assert_frame_equal(df, procesar_encuesta_empleados())
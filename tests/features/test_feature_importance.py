@@ -0,0 +1,91 @@
+"""Tests para el módulo feature_importance."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from src.features.feature_importance import (
+    importancia_permutacion,
+    ranking_caracteristicas,
+    seleccionar_por_importancia,
+)
+from src.preprocessing.config import RUTA_ENCODED_DATA
+
+
+@pytest.fixture(scope="module")
+def df_sintetico():
+    """El objetivo depende de la interacción de 'a' y 'b'; 'ruido' no aporta."""
+    rng = np.random.default_rng(0)
+    n = 2000
+    a = rng.integers(0, 2, n)
+    b = rng.integers(0, 2, n)
+    return pd.DataFrame(
+        {
+            "EmployeeID": np.arange(n),
+            "a": a,
+            "b": b,
+            "ruido": rng.normal(size=n),
+            "abandono": a ^ b,
+        }
+    )
+
+
+def test_ranking_detecta_interacciones(df_sintetico):
+    ranking = ranking_caracteristicas(df_sintetico, "abandono", n_jobs=2)
+
+    assert set(ranking["caracteristica"].head(2)) == {"a", "b"}
+    assert ranking["caracteristica"].iloc[-1] == "ruido"
+    assert "EmployeeID" not in set(ranking["caracteristica"])
+    assert list(ranking["ranking"]) == [1, 2, 3]
+    assert (
+        ranking.loc[ranking["caracteristica"] == "a", "importancia_permutacion"].iloc[0]
+        > 0.3
+    )
+    assert abs(ranking["importancia_permutacion"].iloc[-1]) < 0.05
+    np.testing.assert_allclose(ranking["importancia_modelo"].sum(), 1.0)
+
+
+def test_resultado_no_depende_del_numero_de_procesos(df_sintetico):
+    X = df_sintetico[["a", "b", "ruido"]].to_numpy(dtype=float)
+    y = df_sintetico["abandono"].to_numpy()
+    modelo = LogisticRegression().fit(X, y)
+
+    secuencial = importancia_permutacion(modelo, X, y, ["a", "b", "ruido"], n_jobs=1)
+    paralelo = importancia_permutacion(modelo, X, y, ["a", "b", "ruido"], n_jobs=3)
+
+    pd.testing.assert_frame_equal(secuencial, paralelo)
+
+
+def test_parada_temprana_y_muestra(df_sintetico):
+    ranking = ranking_caracteristicas(
+        df_sintetico,
+        "abandono",
+        n_repeticiones=20,
+        muestra=300,
+        tolerancia=0.01,
+        n_jobs=1,
+    )
+
+    assert (ranking["repeticiones"] >= 2).all()
+    assert (ranking["repeticiones"] < 20).any()
+
+
+def test_seleccionar_por_importancia(df_sintetico):
+    df = seleccionar_por_importancia(df_sintetico, "abandono", k=2, n_jobs=1)
+    assert set(df.columns) == {"a", "b", "abandono"}
+
+
+def test_errores(df_sintetico):
+    with pytest.raises(ValueError):
+        ranking_caracteristicas(df_sintetico, "Attrition")
+    with pytest.raises(ValueError):
+        ranking_caracteristicas(df_sintetico[["abandono"]], "abandono")
+
+
+def test_datos_codificados():
+    df = pd.read_csv(RUTA_ENCODED_DATA)
+    ranking = ranking_caracteristicas(df, n_repeticiones=2, muestra=500, n_jobs=2)
+
+    assert len(ranking) == df.shape[1] - 2
+    assert ranking["importancia_modelo"].notna().all()
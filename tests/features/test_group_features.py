@@ -0,0 +1,143 @@
+"""Tests para el módulo group_features."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feedback_jefes import procesar_feedback_jefes
+from src.features.group_features import (
+    AGREGADOS_GRUPO,
+    ajustar_agregados_grupo,
+    aplicar_agregados_grupo,
+    calcular_agregados_grupo,
+    cargar_agregados,
+    guardar_agregados,
+    nombre_columna,
+)
+
+
+@pytest.fixture
+def df_simple():
+    """DataFrame pequeño con dos departamentos y valores faltantes."""
+    return pd.DataFrame(
+        {
+            "Department": ["A", "A", "B", "B", "B", None],
+            "MonthlyIncome": [100.0, 300.0, 50.0, 50.0, np.nan, 10.0],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def df_hr():
+    """Salida real de procesar_feedback_jefes."""
+    return procesar_feedback_jefes()
+
+
+def test_nombre_columna():
+    esp = {"grupo": "JobRole", "columna": "MonthlyIncome", "funcion": "percentil"}
+    assert nombre_columna(esp) == "MonthlyIncome_percentil_por_JobRole"
+
+
+def test_agregados_simples(df_simple):
+    especificaciones = [
+        {"grupo": "Department", "columna": "MonthlyIncome", "funcion": "mean"},
+        {"grupo": "Department", "columna": "MonthlyIncome", "funcion": "count"},
+        {"grupo": "Department", "columna": "MonthlyIncome", "funcion": "percentil"},
+    ]
+    resultado, _ = calcular_agregados_grupo(df_simple, especificaciones)
+
+    np.testing.assert_allclose(
+        resultado["MonthlyIncome_mean_por_Department"],
+        [200.0, 200.0, 50.0, 50.0, 50.0, np.nan],
+    )
+    np.testing.assert_allclose(
+        resultado["MonthlyIncome_count_por_Department"],
+        [2, 2, 2, 2, 2, np.nan],
+    )
+    # Fracción de valores del grupo menores o iguales; NaN sin valor o sin grupo
+    np.testing.assert_allclose(
+        resultado["MonthlyIncome_percentil_por_Department"],
+        [0.5, 1.0, 1.0, 1.0, np.nan, np.nan],
+    )
+    # No modifica el DataFrame original
+    assert list(df_simple.columns) == ["Department", "MonthlyIncome"]
+
+
+def test_coincide_con_groupby_transform(df_hr):
+    resultado, _ = calcular_agregados_grupo(df_hr)
+
+    pd.testing.assert_series_equal(
+        resultado["MonthlyIncome_mean_por_Department"],
+        df_hr.groupby("Department")["MonthlyIncome"].transform("mean"),
+        check_names=False,
+        check_dtype=False,
+    )
+    pd.testing.assert_series_equal(
+        resultado["average_employee_satisfaction_mean_por_Department"],
+        df_hr.groupby("Department")["average_employee_satisfaction"].transform("mean"),
+        check_names=False,
+        check_dtype=False,
+    )
+    pd.testing.assert_series_equal(
+        resultado["MonthlyIncome_percentil_por_JobRole"],
+        df_hr.groupby("JobRole")["MonthlyIncome"].rank(method="max", pct=True),
+        check_names=False,
+        check_dtype=False,
+    )
+
+
+def test_aplicar_a_empleados_nuevos(df_simple):
+    especificaciones = [
+        {"grupo": "Department", "columna": "MonthlyIncome", "funcion": "max"},
+        {"grupo": "Department", "columna": "MonthlyIncome", "funcion": "percentil"},
+    ]
+    estadisticas = ajustar_agregados_grupo(df_simple, especificaciones)
+    nuevos = pd.DataFrame(
+        {"Department": ["A", "B", "C"], "MonthlyIncome": [200.0, 10.0, 100.0]}
+    )
+
+    resultado = aplicar_agregados_grupo(nuevos, estadisticas)
+
+    np.testing.assert_allclose(
+        resultado["MonthlyIncome_max_por_Department"], [300.0, 50.0, np.nan]
+    )
+    np.testing.assert_allclose(
+        resultado["MonthlyIncome_percentil_por_Department"], [0.5, 0.0, np.nan]
+    )
+
+
+def test_guardar_y_cargar(df_hr, tmp_path):
+    estadisticas = ajustar_agregados_grupo(df_hr)
+    ruta = tmp_path / "agregados.json"
+
+    guardar_agregados(estadisticas, str(ruta))
+    cargadas = cargar_agregados(str(ruta))
+
+    muestra = df_hr.sample(50, random_state=0)
+    pd.testing.assert_frame_equal(
+        aplicar_agregados_grupo(muestra, cargadas),
+        aplicar_agregados_grupo(muestra, estadisticas),
+    )
+
+
+def test_especificaciones_por_defecto(df_hr):
+    resultado, estadisticas = calcular_agregados_grupo(df_hr)
+    for esp in AGREGADOS_GRUPO:
+        assert nombre_columna(esp) in resultado.columns
+    assert set(estadisticas["grupos"]) == {"Department", "JobRole"}
+
+
+def test_columna_inexistente(df_simple):
+    with pytest.raises(KeyError):
+        ajustar_agregados_grupo(
+            df_simple,
+            [{"grupo": "JobRole", "columna": "MonthlyIncome", "funcion": "mean"}],
+        )
+
+
+def test_funcion_no_soportada(df_simple):
+    with pytest.raises(ValueError):
+        ajustar_agregados_grupo(
+            df_simple,
+            [{"grupo": "Department", "columna": "MonthlyIncome", "funcion": "moda"}],
+        )
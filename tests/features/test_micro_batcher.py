@@ -0,0 +1,139 @@
+"""Tests para el módulo micro_batcher."""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from src.features.feature_builder import crear_flags_riesgo, get_sample_data
+from src.features.micro_batcher import MicroBatcher
+
+
+def _run(coro):
+    """Ejecuta una corrutina en un event loop nuevo."""
+    return asyncio.run(coro)
+
+
+def test_resultados_igual_a_lote_completo():
+    """Verifica que cada consulta recibe la misma fila que el lote completo."""
+    df = get_sample_data()
+    expected = crear_flags_riesgo(df).to_dict("records")
+
+    async def main():
+        async with MicroBatcher(crear_flags_riesgo, max_batch_size=16) as batcher:
+            resultados = await asyncio.gather(
+                *(batcher.submit(r) for r in df.to_dict("records"))
+            )
+        return resultados, batcher.batch_sizes
+
+    resultados, batch_sizes = _run(main())
+
+    assert resultados == expected
+    assert sum(batch_sizes) == len(df)
+    assert max(batch_sizes) == 16
+
+
+def test_lote_se_cierra_por_tiempo():
+    """Verifica que un registro solitario se procesa tras max_wait_ms."""
+
+    async def main():
+        async with MicroBatcher(
+            crear_flags_riesgo, max_batch_size=100, max_wait_ms=1
+        ) as batcher:
+            resultado = await asyncio.wait_for(
+                batcher.submit({"salario": 1000}), timeout=1
+            )
+        return resultado, batcher.batch_sizes
+
+    resultado, batch_sizes = _run(main())
+
+    assert resultado["flag_salario_bajo"] == 1
+    assert batch_sizes == [1]
+
+
+def test_no_se_pierden_registros_al_vencer_el_plazo():
+    """Verifica que ningún registro se pierde si llega al vencer el plazo."""
+    registros = get_sample_data().to_dict("records") * 20
+
+    async def enviar(batcher, i, registro):
+        await asyncio.sleep((i % 7) / 10_000)
+        return await batcher.submit(registro)
+
+    async def main():
+        async with MicroBatcher(
+            crear_flags_riesgo, max_batch_size=8, max_wait_ms=0.1
+        ) as batcher:
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    *(enviar(batcher, i, r) for i, r in enumerate(registros))
+                ),
+                timeout=30,
+            )
+
+    assert len(_run(main())) == len(registros)
+
+
+def test_transformacion_en_hilo():
+    """Verifica que la transformación puede ejecutarse en un hilo."""
+
+    async def main():
+        async with MicroBatcher(
+            crear_flags_riesgo, max_batch_size=4, run_in_thread=True
+        ) as batcher:
+            return await asyncio.gather(
+                *(batcher.submit({"antiguedad": a}) for a in [0, 3])
+            )
+
+    resultados = _run(main())
+
+    assert [r["flag_empleado_nuevo"] for r in resultados] == [1, 0]
+
+
+def test_error_se_propaga_a_cada_consulta():
+    """Verifica que un error de la transformación llega a cada consulta del lote."""
+
+    def falla(df: pd.DataFrame) -> pd.DataFrame:
+        raise KeyError("columna")
+
+    async def main():
+        async with MicroBatcher(falla, max_batch_size=2) as batcher:
+            return await asyncio.gather(
+                batcher.submit({"a": 1}),
+                batcher.submit({"a": 2}),
+                return_exceptions=True,
+            )
+
+    resultados = _run(main())
+
+    assert all(isinstance(r, KeyError) for r in resultados)
+
+
+def test_transformacion_cambia_numero_de_filas():
+    """Verifica que se rechaza una transformación sin una fila por registro."""
+
+    async def main():
+        async with MicroBatcher(lambda df: df.head(1), max_batch_size=2) as batcher:
+            return await asyncio.gather(
+                batcher.submit({"a": 1}),
+                batcher.submit({"a": 2}),
+                return_exceptions=True,
+            )
+
+    resultados = _run(main())
+
+    assert all(isinstance(r, ValueError) for r in resultados)
+
+
+def test_submit_sin_iniciar():
+    """Verifica que no se pueden enviar registros sin iniciar el agrupador."""
+    batcher = MicroBatcher(crear_flags_riesgo)
+    with pytest.raises(RuntimeError):
+        _run(batcher.submit({"salario": 1000}))
+
+
+def test_parametros_invalidos():
+    """Verifica la validación de los parámetros."""
+    with pytest.raises(ValueError):
+        MicroBatcher(crear_flags_riesgo, max_batch_size=0)
+    with pytest.raises(ValueError):
+        MicroBatcher(crear_flags_riesgo, max_wait_ms=-1)
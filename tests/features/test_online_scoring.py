@@ -0,0 +1,167 @@
+"""Tests para el módulo online_scoring."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features import feature_builder as fb
+from src.features.feedback_jefes import procesar_feedback_jefes
+from src.features.online_scoring import (
+    OnlineScorer,
+    ajustar_estado,
+    cargar_estado,
+    guardar_estado,
+    transformar_empleado,
+    vectorizar,
+)
+from src.features.training_data import construir_matriz
+from src.preprocessing.column_pruning import aplicar_poda, detectar_columnas_redundantes
+from src.preprocessing.config import COLUMNAS_BINARIAS, COLUMNAS_NOMINALES
+from src.preprocessing.encoding import apply_label_encoding, apply_one_hot_encoding
+
+
+@pytest.fixture(scope="module")
+def df_hr():
+    """Salida real de procesar_feedback_jefes."""
+    return procesar_feedback_jefes()
+
+
+@pytest.fixture(scope="module")
+def df_batch(df_hr):
+    """Salida del pipeline por lotes de encoding_variables."""
+    df_encoded, _ = apply_label_encoding(df_hr, COLUMNAS_BINARIAS)
+    return apply_one_hot_encoding(df_encoded, COLUMNAS_NOMINALES)
+
+
+def _registro_crudo(df_hr, i):
+    """Registro crudo de un empleado, sin los promedios del pipeline."""
+    registro = df_hr.iloc[i].to_dict()
+    registro.pop("average_employee_satisfaction")
+    registro.pop("average_manager_feedback")
+    return registro
+
+
+def _iguales(a, b):
+    """Compara dos valores considerando NaN igual a NaN."""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
+
+
+def test_transformar_empleado_igual_a_lote(df_hr, df_batch):
+    """Verifica registro a registro que la ruta en línea reproduce el lote."""
+    estado = ajustar_estado(df_hr)
+
+    for i in range(len(df_hr)):
+        result = transformar_empleado(_registro_crudo(df_hr, i), estado)
+        expected = df_batch.iloc[i].to_dict()
+
+        assert list(result.keys()) == list(expected.keys())
+        for col in expected:
+            assert _iguales(result[col], expected[col]), col
+
+
+def test_transformar_empleado_categoria_no_vista(df_hr):
+    """Verifica que se lanza un error con una categoría binaria no vista."""
+    estado = ajustar_estado(df_hr)
+    registro = _registro_crudo(df_hr, 0)
+    registro["Gender"] = "Other"
+
+    with pytest.raises(ValueError):
+        transformar_empleado(registro, estado)
+
+
+def test_derivaciones_igual_a_feature_builder():
+    """Verifica que las derivaciones coinciden con las funciones de feature_builder."""
+    df = fb.get_sample_data()
+    df.loc[[2, 7], "satisfaccion_trabajo"] = np.nan
+
+    expected = fb.crear_flags_riesgo(
+        fb.crear_indice_satisfaccion(
+            fb.calcular_ratio_salario_edad(fb.crear_categorias_edad(df))
+        )
+    )
+    estado = ajustar_estado(
+        df,
+        binary_cols=[],
+        one_hot_cols=[],
+        derivaciones=[
+            "categorias_edad",
+            "ratio_salario_edad",
+            "indice_satisfaccion",
+            "flags_riesgo",
+        ],
+        target="abandono",
+    )
+
+    filas = [transformar_empleado(r, estado) for r in df.to_dict("records")]
+    result = pd.DataFrame(filas)
+
+    pd.testing.assert_frame_equal(
+        result, expected, check_dtype=False, check_categorical=False
+    )
+
+
+def test_ajustar_estado_derivacion_invalida(df_hr):
+    """Verifica que se rechazan derivaciones desconocidas."""
+    with pytest.raises(ValueError):
+        ajustar_estado(df_hr, derivaciones=["no_existe"])
+
+
+def test_online_scorer_igual_a_modelo_por_lotes(df_hr, df_batch):
+    """Verifica que el score en línea coincide con predict_proba sobre el lote."""
+    from sklearn.linear_model import LogisticRegression
+
+    estado = ajustar_estado(df_hr)
+    X = df_batch[estado["feature_columns"]].astype(float).fillna(0)
+    modelo = LogisticRegression(max_iter=200).fit(
+        X.iloc[:, :5].to_numpy(), df_batch["Attrition"]
+    )
+
+    # El scorer usa solo las columnas con las que se entrenó el modelo
+    estado["feature_columns"] = list(X.columns[:5])
+    scorer = OnlineScorer(estado, modelo)
+
+    for i in [0, 1, 100]:
+        expected = modelo.predict_proba(X.iloc[[i], :5].to_numpy())[0, 1]
+        assert scorer.score(_registro_crudo(df_hr, i)) == pytest.approx(expected)
+
+
+def test_online_scorer_sin_modelo(df_hr):
+    """Verifica que se lanza un error si se pide un score sin modelo."""
+    scorer = OnlineScorer(ajustar_estado(df_hr))
+    with pytest.raises(ValueError):
+        scorer.score(_registro_crudo(df_hr, 0))
+
+
+def test_vectorizar_forma(df_hr):
+    """Verifica que el vector tiene una fila y una columna por característica."""
+    estado = ajustar_estado(df_hr)
+    vector = vectorizar(transformar_empleado(_registro_crudo(df_hr, 0), estado), estado)
+    assert vector.shape == (1, len(estado["feature_columns"]))
+    assert "Attrition" not in estado["feature_columns"]
+
+
+def test_vectorizar_igual_a_matriz_podada(df_hr, df_batch):
+    """Verifica que el vector en línea tiene las columnas de la matriz podada."""
+    poda = detectar_columnas_redundantes(df_batch)
+    _, _, columnas = construir_matriz(aplicar_poda(df_batch, poda))
+    estado = ajustar_estado(df_hr, poda=poda)
+
+    vector = vectorizar(transformar_empleado(_registro_crudo(df_hr, 0), estado), estado)
+
+    assert poda["descartadas"]
+    assert estado["feature_columns"] == columnas
+    assert vector.shape == (1, len(columnas))
+
+
+def test_guardar_y_cargar_estado(df_hr, tmp_path):
+    """Verifica que el estado se puede guardar y recuperar en JSON."""
+    estado = ajustar_estado(df_hr)
+    ruta = str(tmp_path / "estado.json")
+
+    guardar_estado(estado, ruta)
+
+    assert cargar_estado(ruta) == estado
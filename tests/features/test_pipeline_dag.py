@@ -0,0 +1,187 @@
+"""Tests para el módulo pipeline_dag."""
+
+import importlib.util
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from src.features.feedback_jefes import procesar_feedback_jefes
+from src.features.pipeline_dag import PipelineDAG, construir_pipeline_codificacion
+from src.preprocessing import read_employee_files
+from src.preprocessing.config import COLUMNAS_BINARIAS, COLUMNAS_NOMINALES, ESQUEMAS
+from src.preprocessing.encoding import apply_label_encoding, apply_one_hot_encoding
+
+
+def _doble(x):
+    return x * 2
+
+
+def _sumar(a, b, extra=0):
+    return a + b + extra
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    ruta = tmp_path / "valor.txt"
+    ruta.write_text("3")
+    return ruta
+
+
+def _pipeline(cache_dir, archivo, extra=0):
+    pipeline = PipelineDAG(str(cache_dir))
+    pipeline.etapa(
+        "leer",
+        lambda ruta: int(open(ruta).read()),
+        archivos=[str(archivo)],
+        parametros={"ruta": str(archivo)},
+    )
+    pipeline.etapa("constante", lambda: 10)
+    pipeline.etapa("doble", _doble, entradas=["leer"])
+    pipeline.etapa(
+        "suma", _sumar, entradas=["doble", "constante"], parametros={"extra": extra}
+    )
+    return pipeline
+
+
+def test_ejecucion_y_cache(tmp_path, archivo):
+    pipeline = _pipeline(tmp_path / "cache", archivo)
+
+    assert pipeline.ejecutar() == {"suma": 16}
+    assert set(pipeline.estado.values()) == {"ejecutada"}
+
+    assert pipeline.ejecutar() == {"suma": 16}
+    # Solo se carga el objetivo; sus entradas no se necesitan
+    assert pipeline.estado == {"suma": "cache"}
+
+
+def test_cambio_de_parametro_recalcula_solo_esa_etapa(tmp_path, archivo):
+    _pipeline(tmp_path / "cache", archivo).ejecutar()
+    pipeline = _pipeline(tmp_path / "cache", archivo, extra=5)
+
+    assert pipeline.ejecutar() == {"suma": 21}
+    assert pipeline.estado == {
+        "suma": "ejecutada",
+        "doble": "cache",
+        "constante": "cache",
+    }
+
+
+def test_cambio_de_archivo_recalcula_dependientes(tmp_path, archivo):
+    _pipeline(tmp_path / "cache", archivo).ejecutar()
+    archivo.write_text("50")
+    pipeline = _pipeline(tmp_path / "cache", archivo)
+
+    assert pipeline.ejecutar() == {"suma": 110}
+    assert pipeline.estado["constante"] == "cache"
+    assert pipeline.estado["leer"] == "ejecutada"
+
+
+def _importar(ruta):
+    spec = importlib.util.spec_from_file_location("dependencia_etapa", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def _pipeline_con_dependencia(cache_dir, modulo):
+    pipeline = PipelineDAG(str(cache_dir))
+    pipeline.etapa("valor", lambda: modulo.valor(), dependencias=[modulo])
+    pipeline.etapa("doble", _doble, entradas=["valor"])
+    return pipeline
+
+
+def test_cambio_de_dependencia_recalcula_la_etapa(tmp_path):
+    ruta = tmp_path / "dependencia_etapa.py"
+    ruta.write_text("def valor():\n    return 1\n")
+    pipeline = _pipeline_con_dependencia(tmp_path / "cache", _importar(ruta))
+    assert pipeline.ejecutar() == {"doble": 2}
+    assert pipeline.ejecutar() == {"doble": 2}
+    assert pipeline.estado == {"doble": "cache"}
+
+    # Solo cambia el módulo que llama la etapa, no la función de la etapa
+    ruta.write_text("def valor():\n    return 5\n")
+    pipeline = _pipeline_con_dependencia(tmp_path / "cache", _importar(ruta))
+    assert pipeline.ejecutar() == {"doble": 10}
+    assert pipeline.estado == {"valor": "ejecutada", "doble": "ejecutada"}
+
+
+def test_pipeline_codificacion_declara_configuracion():
+    pipeline = construir_pipeline_codificacion(None)
+    general = pipeline.etapas["general"]
+    assert general["parametros"]["schema"] == ESQUEMAS["general"]
+    assert read_employee_files in general["dependencias"]
+    assert pipeline.etapas["codificacion"]["parametros"] == {
+        "nominales": COLUMNAS_NOMINALES
+    }
+
+
+def test_niveles_y_ramas_paralelas(tmp_path):
+    hilos = set()
+
+    def lento(valor):
+        hilos.add(threading.get_ident())
+        time.sleep(0.2)
+        return valor
+
+    pipeline = PipelineDAG(cache_dir=None, max_workers=3)
+    for nombre in ["a", "b", "c"]:
+        pipeline.etapa(nombre, lento, parametros={"valor": nombre})
+    pipeline.etapa("unir", lambda a, b, c: a + b + c, entradas=["a", "b", "c"])
+
+    inicio = time.perf_counter()
+    assert pipeline.ejecutar() == {"unir": "abc"}
+
+    assert pipeline.niveles() == [["a", "b", "c"], ["unir"]]
+    assert time.perf_counter() - inicio < 0.5
+    assert len(hilos) == 3
+
+
+def test_declaraciones_invalidas():
+    pipeline = PipelineDAG(cache_dir=None)
+    pipeline.etapa("a", lambda: 1)
+    with pytest.raises(ValueError):
+        pipeline.etapa("a", lambda: 2)
+    with pytest.raises(KeyError):
+        pipeline.etapa("b", _doble, entradas=["x"])
+    with pytest.raises(KeyError):
+        pipeline.ejecutar(["x"])
+
+
+def test_pipeline_codificacion_igual_al_secuencial(tmp_path):
+    df = procesar_feedback_jefes()
+    df_encoded, _ = apply_label_encoding(df, COLUMNAS_BINARIAS)
+    esperado = apply_one_hot_encoding(df_encoded, COLUMNAS_NOMINALES)
+
+    pipeline = construir_pipeline_codificacion(str(tmp_path))
+    resultado = pipeline.ejecutar(["codificacion"])["codificacion"]
+
+    pd.testing.assert_frame_equal(resultado, esperado)
+    assert pipeline.niveles()[0] == ["general", "encuesta_empleados", "encuesta_jefes"]
+
+    pipeline.ejecutar(["codificacion"])
+    assert pipeline.estado == {"codificacion": "cache"}
+
+
+def test_pipeline_codificacion_reduce_tipos(tmp_path):
+    pipeline = construir_pipeline_codificacion(str(tmp_path))
+    resultados = pipeline.ejecutar(["codificacion", "reduccion_tipos"])
+
+    reducido = resultados["reduccion_tipos"]
+    assert reducido["Attrition"].dtype == "int8"
+    assert (
+        reducido.memory_usage(deep=True).sum()
+        < resultados["codificacion"].memory_usage(deep=True).sum()
+    )
+
+
+def test_pipeline_codificacion_poda_columnas(tmp_path):
+    pipeline = construir_pipeline_codificacion(str(tmp_path))
+    resultados = pipeline.ejecutar(["reduccion_tipos", "poda_columnas"])
+
+    podado = resultados["poda_columnas"]
+    descartadas = set(resultados["reduccion_tipos"].columns) - set(podado.columns)
+    assert {"EmployeeCount", "StandardHours", "Over18"} <= descartadas
+    assert "Department_Human Resources" in descartadas
+    assert pipeline.niveles()[-1] == ["poda_columnas"]
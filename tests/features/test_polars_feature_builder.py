@@ -0,0 +1,73 @@
+"""Tests de conformidad entre polars_feature_builder y feature_builder."""
+
+import pandas as pd
+import pytest
+
+from src.features import feature_builder as fb
+from src.features import polars_feature_builder as pfb
+from src.preprocessing.polars_backend import to_pandas
+
+pytest.importorskip("polars")
+
+
+class TestPolarsFeatureBuilder:
+    """Cada función de Polars debe dar el mismo resultado que la de pandas."""
+
+    @pytest.fixture
+    def df_sample(self):
+        """Fixture con los datos de ejemplo y algunos valores faltantes."""
+        df = fb.get_sample_data()
+        df.loc[[3, 10], "satisfaccion_trabajo"] = None
+        df.loc[[5], "edad"] = None
+        return df
+
+    def test_crear_categorias_edad(self, df_sample):
+        """Prueba crear_categorias_edad."""
+        expected = fb.crear_categorias_edad(df_sample)
+        result = to_pandas(pfb.crear_categorias_edad(df_sample))
+        pd.testing.assert_frame_equal(
+            result, expected, check_dtype=False, check_categorical=False
+        )
+
+    def test_calcular_ratio_salario_edad(self, df_sample):
+        """Prueba calcular_ratio_salario_edad."""
+        expected = fb.calcular_ratio_salario_edad(df_sample)
+        result = to_pandas(pfb.calcular_ratio_salario_edad(df_sample))
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_crear_indice_satisfaccion(self, df_sample):
+        """Prueba crear_indice_satisfaccion con pesos y con una columna inexistente."""
+        columnas = ["satisfaccion_trabajo", "satisfaccion_ambiente", "no_existe"]
+        pesos = [0.5, 0.3, 0.2]
+        expected = fb.crear_indice_satisfaccion(df_sample, columnas, pesos)
+        result = to_pandas(pfb.crear_indice_satisfaccion(df_sample, columnas, pesos))
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_crear_indice_satisfaccion_sin_columnas(self, df_sample):
+        """Prueba que se lanza un error si ninguna columna existe."""
+        with pytest.raises(ValueError):
+            pfb.crear_indice_satisfaccion(df_sample, ["no_existe"])
+
+    @pytest.mark.parametrize("drop_first", [True, False])
+    def test_crear_variables_dummy(self, df_sample, drop_first):
+        """Prueba crear_variables_dummy."""
+        expected = fb.crear_variables_dummy(df_sample, drop_first=drop_first)
+        result = to_pandas(pfb.crear_variables_dummy(df_sample, drop_first=drop_first))
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_crear_flags_riesgo(self, df_sample):
+        """Prueba crear_flags_riesgo con y sin las columnas de origen."""
+        expected = fb.crear_flags_riesgo(df_sample)
+        result = to_pandas(pfb.crear_flags_riesgo(df_sample))
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+        df = df_sample.drop(columns=["salario"])
+        expected = fb.crear_flags_riesgo(df)
+        result = to_pandas(pfb.crear_flags_riesgo(df))
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_seleccionar_mejores_caracteristicas(self, df_sample):
+        """Prueba seleccionar_mejores_caracteristicas."""
+        expected = fb.seleccionar_mejores_caracteristicas(df_sample, k=3)
+        result = to_pandas(pfb.seleccionar_mejores_caracteristicas(df_sample, k=3))
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
@@ -0,0 +1,93 @@
+"""Tests para el módulo resampling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.resampling import (
+    indices_sobremuestreo,
+    indices_submuestreo,
+    pesos_balanceados,
+    sintetizar_smote,
+)
+from src.features.training_data import construir_matriz
+from src.preprocessing.config import RUTA_ENCODED_DATA
+
+
+@pytest.fixture
+def y():
+    """Objetivo con 20% de positivos."""
+    return np.array([0] * 80 + [1] * 20)
+
+
+def test_sobremuestreo(y):
+    indices = indices_sobremuestreo(y)
+
+    np.testing.assert_array_equal(indices[:100], np.arange(100))
+    assert np.bincount(y[indices]).tolist() == [80, 80]
+    assert set(indices[100:]) <= set(range(80, 100))
+    assert np.bincount(y[indices_sobremuestreo(y, 0.5)]).tolist() == [80, 40]
+
+
+def test_submuestreo(y):
+    indices = indices_submuestreo(y)
+
+    assert np.bincount(y[indices]).tolist() == [20, 20]
+    assert (np.diff(indices) > 0).all()
+    assert set(range(80, 100)) <= set(indices)
+    assert np.bincount(y[indices_submuestreo(y, 0.5)]).tolist() == [40, 20]
+
+
+def test_pesos_balanceados(y):
+    pesos = pesos_balanceados(y)
+
+    np.testing.assert_allclose(pesos[[0, -1]], [100 / 160, 100 / 40])
+    np.testing.assert_allclose(pesos[y == 0].sum(), pesos[y == 1].sum())
+
+
+def test_smote_interpola_entre_vecinos():
+    X = np.array([[0.0, 0], [1, 0], [2, 0], [10, 1], [11, 1], [12, 1], [13, 1]])
+    y = np.array([1, 1, 1, 0, 0, 0, 0])
+
+    X_sint, y_sint = sintetizar_smote(X, y, n_sinteticas=50, k_vecinos=2, tamano_lote=7)
+
+    assert X_sint.shape == (50, 2)
+    assert (y_sint == 1).all()
+    # Las filas sintéticas quedan dentro del rango de la clase minoritaria
+    assert X_sint[:, 0].min() >= 0 and X_sint[:, 0].max() <= 2
+    assert (X_sint[:, 1] == 0).all()
+
+
+def test_smote_columnas_discretas_y_por_defecto(y):
+    rng = np.random.default_rng(0)
+    X = np.column_stack([rng.normal(size=100), rng.integers(0, 2, 100)])
+
+    X_sint, _ = sintetizar_smote(X, y, discretas=[1])
+
+    assert len(X_sint) == 60
+    assert set(np.unique(X_sint[:, 1])) <= {0.0, 1.0}
+    assert not set(np.unique(X_sint[:, 0])) <= set(X[:, 0])
+
+
+def test_errores(y):
+    with pytest.raises(ValueError):
+        indices_sobremuestreo(np.zeros(10))
+    with pytest.raises(ValueError):
+        indices_submuestreo(y, proporcion=2)
+    with pytest.raises(ValueError):
+        sintetizar_smote(np.full((100, 2), np.nan), y)
+
+
+def test_datos_codificados():
+    df = pd.read_csv(RUTA_ENCODED_DATA).dropna()
+    X, y, columnas = construir_matriz(df)
+    discretas = [i for i, c in enumerate(columnas) if df[c].dtype == bool]
+
+    X_sint, y_sint = sintetizar_smote(X, y, discretas=discretas)
+
+    assert X_sint.dtype == np.float32
+    assert (
+        np.bincount(np.concatenate([y, y_sint]).astype(int)).tolist()
+        == [int((y == 0).sum())] * 2
+    )
+    assert np.isin(X_sint[:, discretas], [0, 1]).all()
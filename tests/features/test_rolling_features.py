@@ -0,0 +1,137 @@
+"""Tests para el módulo rolling_features."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.rolling_features import actualizar_ventanas, calcular_ventanas
+
+
+@pytest.fixture
+def historia():
+    """Historial con meses faltantes, valores faltantes y filas desordenadas."""
+    rng = np.random.default_rng(0)
+    filas = []
+    for empleado in [3, 1, 2]:
+        meses = np.sort(rng.choice(24, size=15, replace=False))
+        for mes in meses:
+            filas.append(
+                {
+                    "EmployeeID": empleado,
+                    "snapshot_date": pd.Timestamp("2023-01-31")
+                    + pd.offsets.MonthEnd(int(mes)),
+                    "JobSatisfaction": rng.choice([1.0, 2.0, 3.0, 4.0, np.nan]),
+                    "JobInvolvement": int(rng.integers(1, 5)),
+                    "MonthlyIncome": float(rng.integers(1000, 20000)),
+                }
+            )
+    return pd.DataFrame(filas).sample(frac=1, random_state=0)
+
+
+def _referencia(historia, w):
+    """Cálculo directo, empleado por empleado y fila por fila."""
+    datos = historia.sort_values(["EmployeeID", "snapshot_date"], ignore_index=True)
+    meses = datos["snapshot_date"].dt.year * 12 + datos["snapshot_date"].dt.month
+    medias, pendientes, cambios = [], [], []
+    for i in range(len(datos)):
+        mismo = (datos["EmployeeID"] == datos.loc[i, "EmployeeID"]).to_numpy()
+        ventana = datos[
+            mismo & (meses > meses[i] - w).to_numpy() & (meses <= meses[i]).to_numpy()
+        ]
+        medias.append(ventana["JobSatisfaction"].mean())
+        x = (
+            ventana["snapshot_date"].dt.year * 12 + ventana["snapshot_date"].dt.month
+        ).to_numpy(float)
+        pendientes.append(
+            np.polyfit(x, ventana["MonthlyIncome"], 1)[0] if len(x) > 1 else np.nan
+        )
+        previas = datos[mismo & (meses < meses[i]).to_numpy()]
+        cambios.append(
+            datos.loc[i, "JobInvolvement"] - previas["JobInvolvement"].iloc[-1]
+            if len(previas)
+            else np.nan
+        )
+    return np.array(medias), np.array(pendientes), np.array(cambios, dtype=float)
+
+
+def _calcular(df, **kwargs):
+    return calcular_ventanas(
+        df,
+        columnas_media=["JobSatisfaction"],
+        columnas_cambio=["JobInvolvement"],
+        columnas_pendiente=["MonthlyIncome"],
+        **kwargs,
+    )
+
+
+def test_coincide_con_calculo_directo(historia):
+    resultado = _calcular(historia)
+
+    assert resultado["EmployeeID"].is_monotonic_increasing
+    for w in [3, 12]:
+        medias, pendientes, cambios = _referencia(historia, w)
+        np.testing.assert_allclose(resultado[f"JobSatisfaction_media_{w}m"], medias)
+        np.testing.assert_allclose(
+            resultado[f"MonthlyIncome_pendiente_{w}m"], pendientes, rtol=1e-6
+        )
+        np.testing.assert_allclose(resultado["JobInvolvement_cambio"], cambios)
+
+
+def test_ventana_de_un_mes():
+    df = pd.DataFrame(
+        {
+            "EmployeeID": [1, 1, 2],
+            "snapshot_date": pd.to_datetime(["2024-01-31", "2024-02-29", "2024-01-31"]),
+            "JobSatisfaction": [1.0, 3.0, 4.0],
+        }
+    )
+    resultado = calcular_ventanas(
+        df,
+        columnas_media=["JobSatisfaction"],
+        columnas_cambio=[],
+        columnas_pendiente=[],
+        ventanas=[1, 2],
+    )
+    np.testing.assert_allclose(resultado["JobSatisfaction_media_1m"], [1.0, 3.0, 4.0])
+    np.testing.assert_allclose(resultado["JobSatisfaction_media_2m"], [1.0, 2.0, 4.0])
+
+
+def test_actualizar_coincide_con_recalculo(historia):
+    nuevo = pd.DataFrame(
+        {
+            "EmployeeID": [1, 2, 3, 4],
+            "snapshot_date": pd.Timestamp("2025-01-31"),
+            "JobSatisfaction": [4.0, np.nan, 1.0, 2.0],
+            "JobInvolvement": [1, 2, 3, 4],
+            "MonthlyIncome": [5000.0, 6000.0, 7000.0, 8000.0],
+        }
+    )
+
+    incremental = actualizar_ventanas(
+        historia,
+        nuevo,
+        columnas_media=["JobSatisfaction"],
+        columnas_cambio=["JobInvolvement"],
+        columnas_pendiente=["MonthlyIncome"],
+    )
+    completo = _calcular(pd.concat([historia, nuevo], ignore_index=True))
+    completo = completo[completo["snapshot_date"] == "2025-01-31"].reset_index(
+        drop=True
+    )
+
+    pd.testing.assert_frame_equal(incremental, completo, rtol=1e-6)
+
+
+def test_actualizar_periodo_anterior(historia):
+    with pytest.raises(ValueError):
+        actualizar_ventanas(historia, historia.head(1))
+
+
+def test_columna_inexistente(historia):
+    with pytest.raises(KeyError):
+        calcular_ventanas(historia, columnas_media=["WorkLifeBalance"])
+
+
+def test_ventana_invalida(historia):
+    with pytest.raises(ValueError):
+        _calcular(historia, ventanas=[0])
@@ -0,0 +1,117 @@
+"""Tests para el módulo training_data."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.training_data import (
+    cargar_lightgbm,
+    cargar_manifiesto,
+    cargar_xgboost,
+    construir_matriz,
+    exportar_datos_entrenamiento,
+)
+from src.preprocessing.column_pruning import detectar_columnas_redundantes
+from src.preprocessing.config import RUTA_ENCODED_DATA
+
+lgb = pytest.importorskip("lightgbm")
+xgb = pytest.importorskip("xgboost")
+
+
+@pytest.fixture(scope="module")
+def df_encoded():
+    """Salida de encoding_variables."""
+    return pd.read_csv(RUTA_ENCODED_DATA)
+
+
+def test_construir_matriz(df_encoded):
+    X, y, columnas = construir_matriz(df_encoded)
+
+    assert X.dtype == np.float32
+    assert X.shape == (len(df_encoded), len(df_encoded.columns) - 2)
+    assert "EmployeeID" not in columnas and "Attrition" not in columnas
+    np.testing.assert_array_equal(y, df_encoded["Attrition"])
+    with pytest.raises(KeyError):
+        construir_matriz(df_encoded.drop(columns="Attrition"))
+    with pytest.raises(ValueError):
+        construir_matriz(df_encoded.assign(Department="Sales"))
+
+
+def test_exportar_y_cargar(df_encoded, tmp_path):
+    manifiesto = exportar_datos_entrenamiento(df_encoded, str(tmp_path))
+    X, y, columnas = construir_matriz(df_encoded)
+
+    dtrain = cargar_lightgbm(manifiesto).construct()
+    assert dtrain.num_data() == len(df_encoded)
+    # LightGBM reemplaza los espacios de los nombres por "_"
+    assert dtrain.get_feature_name() == [c.replace(" ", "_") for c in columnas]
+    np.testing.assert_array_equal(dtrain.get_label(), y)
+
+    dmatrix = cargar_xgboost(manifiesto)
+    assert dmatrix.num_row() == len(df_encoded)
+    assert dmatrix.feature_names == columnas
+    np.testing.assert_array_equal(dmatrix.get_label(), y)
+
+    assert cargar_manifiesto(str(tmp_path / manifiesto["huella"][:16])) == manifiesto
+
+
+def test_entrenar_desde_binarios(df_encoded, tmp_path):
+    manifiesto = exportar_datos_entrenamiento(df_encoded, str(tmp_path))
+    X, _, columnas = construir_matriz(df_encoded)
+
+    booster = lgb.train(
+        {
+            "objective": "binary",
+            "num_iterations": 5,
+            **manifiesto["parametros_lightgbm"],
+        },
+        cargar_lightgbm(manifiesto),
+    )
+    modelo = xgb.train({"objective": "binary:logistic"}, cargar_xgboost(manifiesto), 5)
+
+    assert booster.predict(X).shape == (len(df_encoded),)
+    assert modelo.predict(xgb.DMatrix(X, feature_names=columnas)).shape == (
+        len(df_encoded),
+    )
+
+
+def test_huella_reutiliza_o_separa(df_encoded, tmp_path):
+    primero = exportar_datos_entrenamiento(df_encoded, str(tmp_path), ["lightgbm"])
+    ruta = primero["rutas"]["lightgbm"]
+    os.utime(ruta, ns=(0, 0))
+
+    # Mismos datos: no se vuelve a escribir; se agrega solo el formato nuevo
+    segundo = exportar_datos_entrenamiento(df_encoded, str(tmp_path))
+    assert segundo["huella"] == primero["huella"]
+    assert os.stat(ruta).st_mtime_ns == 0
+    assert set(segundo["rutas"]) == {"lightgbm", "xgboost"}
+
+    # Otros parámetros de binning u otros datos: otra carpeta
+    otro = exportar_datos_entrenamiento(
+        df_encoded, str(tmp_path), ["lightgbm"], {"max_bin": 63, "verbose": -1}
+    )
+    assert otro["huella"] != primero["huella"]
+    cambio = exportar_datos_entrenamiento(
+        df_encoded.drop(columns="Age"), str(tmp_path), ["lightgbm"]
+    )
+    assert cambio["huella"] != primero["huella"]
+
+
+def test_formato_no_soportado(df_encoded, tmp_path):
+    with pytest.raises(ValueError):
+        exportar_datos_entrenamiento(df_encoded, str(tmp_path), ["catboost"])
+
+
+def test_exportar_con_poda(df_encoded, tmp_path):
+    poda = detectar_columnas_redundantes(df_encoded)
+    manifiesto = exportar_datos_entrenamiento(
+        df_encoded, str(tmp_path), ["xgboost"], poda=poda
+    )
+
+    assert "EmployeeCount" not in manifiesto["columnas"]
+    assert manifiesto["columnas"] == [
+        c for c in poda["columnas"] if c not in ("EmployeeID", "Attrition")
+    ]
+    assert cargar_xgboost(manifiesto).num_col() == len(manifiesto["columnas"])
@@ -1,8 +1,15 @@
 import pandas as pd
 import numpy as np
+import pytest
 
 
-from src.preprocessing.outlier_detector import detect_outliers_isolation_forest, remove_outliers
+from src.preprocessing.outlier_detector import (
+    detect_outliers,
+    detect_outliers_isolation_forest,
+    outlier_mask,
+    remove_outliers,
+    screen_outliers,
+)
 
 # Dataset de ejemplo para pruebas
 def sample_data():
@@ -56,3 +63,84 @@ def test_no_false_modification():
     result = detect_outliers_isolation_forest(df, ['feature1', 'feature2'], contamination=0)
     assert result.shape[0] == original_shape[0], "Se modificaron filas cuando no debería"
     assert result['is_outlier'].sum() == 0, "Se detectaron outliers con contamination=0"
+
+# Dataset con errores groseros en dos departamentos de escalas distintas
+def sample_departments():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Department': ['Sales'] * 50 + ['R&D'] * 50,
+        'Age': rng.integers(25, 55, 100),
+        'MonthlyIncome': np.concatenate([rng.normal(20000, 1000, 50), rng.normal(80000, 1000, 50)]),
+    })
+    df.loc[3, 'Age'] = -5
+    df.loc[60, 'MonthlyIncome'] = 20000
+    return df
+
+# Test 6: Verifica que cada método agregue su propia columna de flags
+def test_screen_outliers_flags_per_method():
+    df = sample_departments()
+    flags = screen_outliers(df, ['Age', 'MonthlyIncome'], methods=('zscore', 'iqr', 'mad', 'rango'),
+                            rangos={'Age': [18, None]})
+    assert list(flags.columns) == ['outlier_zscore', 'outlier_iqr', 'outlier_mad', 'outlier_rango']
+    assert flags.index.equals(df.index)
+    assert flags['outlier_rango'].tolist() == [i == 3 for i in range(100)]
+    assert flags.loc[3].all()
+
+# Test 7: Verifica que por grupo se detecte un valor normal en otro departamento
+def test_screen_outliers_by_group():
+    df = sample_departments()
+    sin_grupo = screen_outliers(df, ['MonthlyIncome'], methods=('mad',))
+    por_grupo = screen_outliers(df, ['MonthlyIncome'], methods=('mad',), group='Department')
+    assert not sin_grupo.loc[60, 'outlier_mad']
+    assert por_grupo.loc[60, 'outlier_mad']
+
+# Test 8: Verifica que Isolation Forest solo se aplique a las filas que pasan los filtros
+def test_detect_outliers_runs_isolation_on_remaining_rows():
+    df = sample_departments()
+    result = detect_outliers(df, ['Age', 'MonthlyIncome'], methods=('rango',), rangos={'Age': [18, 100]},
+                             contamination=0.05)
+    assert not result.loc[3, 'outlier_isolation']
+    assert result.loc[3, 'is_outlier'] == 1
+    assert result['outlier_isolation'].sum() == 5
+    assert result['is_outlier'].sum() == 6
+    cleaned = remove_outliers(result)
+    assert list(cleaned.columns) == list(df.columns)
+    assert len(cleaned) == 94
+
+# Test 8b: Verifica que remove_outliers conserva las columnas propias con nombre 'outlier_<método>'
+def test_remove_outliers_conserva_columnas_propias():
+    df = sample_departments().assign(outlier_iqr=1.5)
+    result = detect_outliers(df.drop(columns='outlier_iqr'), ['Age', 'MonthlyIncome'],
+                             methods=('rango',), rangos={'Age': [18, 100]}, isolation=False)
+    result['outlier_iqr'] = df['outlier_iqr']
+    cleaned = remove_outliers(result)
+    assert list(cleaned.columns) == list(df.columns)
+    assert 'columnas_outliers' not in cleaned.attrs
+    assert len(cleaned) == len(df) - 1
+
+# Test 9: Verifica que los valores faltantes y las columnas constantes no se marquen
+def test_screen_outliers_missing_and_constant():
+    df = pd.DataFrame({'feature1': [1.0, 1.0, 1.0, np.nan, 50.0], 'feature2': [3, 3, 3, 3, 3]})
+    flags = screen_outliers(df, ['feature1', 'feature2'], methods=('zscore', 'iqr', 'mad'))
+    assert not flags.loc[3].any()
+    assert not flags['outlier_zscore'].iloc[:4].any()
+
+# Test 10: Verifica los errores por método o columna inexistente
+def test_screen_outliers_errors():
+    df = sample_data()
+    with pytest.raises(ValueError):
+        screen_outliers(df, ['feature1'], methods=('lof',))
+    with pytest.raises(KeyError):
+        screen_outliers(df, ['feature3'])
+
+# Test 11: Verifica que outlier_mask coincida con detect_outliers sin modificar df
+def test_outlier_mask_matches_detect_outliers():
+    df = sample_departments()
+    original = df.copy()
+    kwargs = dict(methods=('iqr', 'rango'), group='Department', contamination=0.05)
+    mask = outlier_mask(df, ['Age', 'MonthlyIncome'], **kwargs)
+    result = detect_outliers(df, ['Age', 'MonthlyIncome'], **kwargs)
+    assert mask.dtype == bool
+    assert (mask == result['is_outlier'].astype(bool).to_numpy()).all()
+    pd.testing.assert_frame_equal(df, original)
+
@@ -0,0 +1,97 @@
+"""Tests para el módulo column_pruning."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.column_pruning import (
+    aplicar_poda,
+    cargar_poda,
+    detectar_columnas_redundantes,
+    guardar_poda,
+    podar_columnas,
+)
+
+
+@pytest.fixture
+def df():
+    """Matriz codificada con columnas de todos los tipos de redundancia."""
+    n = 200
+    rng = np.random.default_rng(0)
+    edad = rng.integers(20, 60, n)
+    departamento = pd.Categorical(rng.choice(["HR", "RD", "Sales"], n))
+    datos = pd.DataFrame(
+        {
+            "EmployeeID": np.arange(n),
+            "Attrition": rng.integers(0, 2, n),
+            "Age": edad,
+            "EmployeeCount": 1,
+            "Over18": "Y",
+            "Rara": np.r_[1.0, np.zeros(n - 1)],
+            "AgeCopia": edad.astype(float),
+            "Faltantes": np.where(edad > 40, np.nan, 0.0),
+            "FaltantesCopia": np.where(edad > 40, np.nan, -0.0),
+        }
+    )
+    return pd.concat([datos, pd.get_dummies(departamento, prefix="Department")], axis=1)
+
+
+def test_detectar_columnas_redundantes(df):
+    reporte = detectar_columnas_redundantes(df, prefijos_one_hot=["Department"])
+
+    assert reporte["constantes"] == ["EmployeeCount", "Over18"]
+    assert reporte["casi_constantes"] == ["Rara"]
+    assert reporte["duplicadas"] == {
+        "AgeCopia": "Age",
+        "FaltantesCopia": "Faltantes",
+    }
+    assert reporte["one_hot"] == {"Department": "Department_HR"}
+    assert reporte["columnas"] == [
+        "EmployeeID",
+        "Attrition",
+        "Age",
+        "Faltantes",
+        "Department_RD",
+        "Department_Sales",
+    ]
+
+
+def test_duplicadas_por_valor_y_protegidas(df):
+    # Un booleano es igual a la columna entera con los mismos 0/1; la columna
+    # protegida se conserva aunque aparezca después
+    df = df.assign(Copia=df["Department_RD"].astype(int), Objetivo=df["Attrition"])
+    reporte = detectar_columnas_redundantes(
+        df[["Objetivo", "Attrition", "Department_RD", "Copia"]],
+        umbral_casi_constante=None,
+        prefijos_one_hot=[],
+    )
+    assert reporte["duplicadas"] == {
+        "Objetivo": "Attrition",
+        "Copia": "Department_RD",
+    }
+
+
+def test_one_hot_incompleto_se_conserva(df):
+    # Sin una de las indicadoras, el grupo ya no suma 1 en todas las filas
+    reporte = detectar_columnas_redundantes(
+        df.drop(columns="Department_Sales"), prefijos_one_hot=["Department"]
+    )
+    assert reporte["one_hot"] == {}
+
+
+def test_poda_reutilizable(df, tmp_path):
+    podado, reporte = podar_columnas(df, prefijos_one_hot=["Department"])
+    assert list(podado.columns) == reporte["columnas"]
+
+    ruta = str(tmp_path / "poda.json")
+    guardar_poda(reporte, ruta)
+    nuevo = df.iloc[:5].drop(columns="Over18")
+    pd.testing.assert_frame_equal(
+        aplicar_poda(nuevo, cargar_poda(ruta)), podado.iloc[:5]
+    )
+
+
+def test_umbral_invalido(df):
+    with pytest.raises(ValueError):
+        detectar_columnas_redundantes(df, umbral_casi_constante=1.5)
+    assert detectar_columnas_redundantes(df.iloc[:0])["descartadas"] == []
@@ -0,0 +1,109 @@
+"""Tests para el módulo columnar_store."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.columnar_store import (
+    load_feature_columns,
+    open_feature_matrix,
+    save_feature_matrix,
+)
+
+
+@pytest.fixture
+def encoded_df():
+    """DataFrame codificado con columnas enteras, decimales y booleanas."""
+    return pd.DataFrame(
+        {
+            "EmployeeID": [1, 2, 3],
+            "MonthlyIncome": [131160, 41890, 193280],
+            "average_employee_satisfaction": [3.0, np.nan, 2.5],
+            "Department_Sales": [True, False, True],
+        }
+    )
+
+
+def test_save_feature_matrix_crea_archivos(encoded_df, tmp_path):
+    """Verifica que se crean la matriz y el manifiesto."""
+    ruta_base = str(tmp_path / "encoded_data")
+    manifiesto = save_feature_matrix(encoded_df, ruta_base)
+
+    assert (tmp_path / "encoded_data.npy").exists()
+    assert (tmp_path / "encoded_data.json").exists()
+    assert manifiesto["columns"] == list(encoded_df.columns)
+    assert manifiesto["shape"] == [3, 4]
+
+
+def test_open_feature_matrix_es_memory_mapped(encoded_df, tmp_path):
+    """Verifica que la matriz se abre sin copiar y en orden de columnas."""
+    ruta_base = str(tmp_path / "encoded_data")
+    save_feature_matrix(encoded_df, ruta_base)
+
+    matriz, manifiesto = open_feature_matrix(ruta_base)
+
+    assert isinstance(matriz, np.memmap)
+    assert matriz.flags.f_contiguous
+    assert matriz.shape == (3, 4)
+    assert manifiesto["dtypes"]["Department_Sales"] == "bool"
+
+
+def test_load_feature_columns_restaura_tipos(encoded_df, tmp_path):
+    """Verifica que la carga completa reproduce el DataFrame original."""
+    ruta_base = str(tmp_path / "encoded_data")
+    save_feature_matrix(encoded_df, ruta_base)
+
+    result = load_feature_columns(ruta_base)
+
+    pd.testing.assert_frame_equal(result, encoded_df)
+
+
+def test_load_feature_columns_tipos_nullable(tmp_path):
+    """Verifica que se restauran los tipos nullable de pandas y sus faltantes."""
+    df = pd.DataFrame(
+        {
+            "NumCompaniesWorked": pd.array([1, None, 3], dtype="Int64"),
+            "Department_Sales": pd.array([True, None, False], dtype="boolean"),
+            "Age": [30, 40, 50],
+        }
+    )
+    ruta_base = str(tmp_path / "encoded_data")
+    save_feature_matrix(df, ruta_base)
+
+    result = load_feature_columns(ruta_base)
+
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_load_feature_columns_subconjunto(encoded_df, tmp_path):
+    """Verifica que se puede cargar un subconjunto arbitrario de columnas."""
+    ruta_base = str(tmp_path / "encoded_data")
+    save_feature_matrix(encoded_df, ruta_base)
+
+    result = load_feature_columns(ruta_base, ["Department_Sales", "EmployeeID"])
+
+    assert list(result.columns) == ["Department_Sales", "EmployeeID"]
+    assert result["EmployeeID"].tolist() == [1, 2, 3]
+
+
+def test_load_feature_columns_columna_inexistente(encoded_df, tmp_path):
+    """Verifica que se lanza un error si se pide una columna que no existe."""
+    ruta_base = str(tmp_path / "encoded_data")
+    save_feature_matrix(encoded_df, ruta_base)
+
+    with pytest.raises(KeyError):
+        load_feature_columns(ruta_base, ["NoExiste"])
+
+
+def test_save_feature_matrix_columnas_no_numericas(tmp_path):
+    """Verifica que se rechazan columnas de texto."""
+    df = pd.DataFrame({"EmployeeID": [1, 2], "JobRole": ["Manager", "Other"]})
+
+    with pytest.raises(ValueError):
+        save_feature_matrix(df, str(tmp_path / "encoded_data"))
+
+
+def test_open_feature_matrix_no_existe(tmp_path):
+    """Verifica que se lanza FileNotFoundError si la matriz no existe."""
+    with pytest.raises(FileNotFoundError):
+        open_feature_matrix(str(tmp_path / "no_existe"))
@@ -0,0 +1,142 @@
+"""Tests para el módulo data_profiler."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.config import RUTA_GENERAL
+from src.preprocessing.data_profiler import (
+    FileProfile,
+    HyperLogLog,
+    KLLSketch,
+    perfil_archivo,
+    perfilar_archivo,
+    perfilar_fuentes,
+    problemas_calidad,
+    verificar_calidad,
+)
+
+
+@pytest.fixture
+def csv_con_errores(tmp_path):
+    """Archivo con nulos, categorías inválidas y valores fuera de rango."""
+    ruta = tmp_path / "datos.csv"
+    pd.DataFrame(
+        {
+            "EmployeeID": range(1, 11),
+            "Over18": ["Y"] * 8 + ["N", None],
+            "JobSatisfaction": [1, 2, 3, 4, 5, 0, None, 2, 3, 4],
+        }
+    ).to_csv(ruta, index=False)
+    return str(ruta)
+
+
+def test_hyperloglog_estima_distintos():
+    valores = np.arange(100_000)
+    hll = HyperLogLog()
+    hll.add(valores)
+    hll.add(valores[:5000])  # Los repetidos no cambian la estimación
+
+    assert abs(hll.count() - 100_000) / 100_000 < 0.05
+
+
+def test_hyperloglog_merge():
+    a, b, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    a.add(np.arange(0, 60_000))
+    b.add(np.arange(40_000, 100_000))
+    union.add(np.arange(0, 100_000))
+
+    assert a.merge(b).count() == union.count()
+
+
+def test_kll_cuantiles():
+    rng = np.random.default_rng(0)
+    valores = rng.normal(size=200_000)
+    kll, parte = KLLSketch(), KLLSketch()
+    kll.add(valores[:120_000])
+    parte.add(valores[120_000:])
+    kll.merge(parte)
+
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+    estimados = kll.quantiles(qs)
+    # Error de rango: fracción de valores por debajo del cuantil estimado
+    rangos = [np.mean(valores <= e) for e in estimados]
+    np.testing.assert_allclose(rangos, qs, atol=0.02)
+    assert kll.n == 200_000
+    assert sum(len(nivel) for nivel in kll.niveles) < 5_000
+
+
+def test_perfil_exacto_por_bloques():
+    df = pd.read_csv(RUTA_GENERAL)
+    reporte = perfilar_archivo(RUTA_GENERAL, chunksize=500)
+
+    assert reporte["filas"] == len(df)
+    for col in ["NumCompaniesWorked", "TotalWorkingYears", "MonthlyIncome"]:
+        perfil = reporte["columnas"][col]
+        assert perfil["nulos"] == df[col].isna().sum()
+        assert perfil["min"] == df[col].min()
+        assert perfil["max"] == df[col].max()
+    frecuencias = reporte["columnas"]["Department"]["frecuencias"]
+    assert frecuencias == df["Department"].value_counts().to_dict()
+    # Las columnas con muchas categorías no guardan frecuencias
+    assert "frecuencias" not in reporte["columnas"]["EmployeeID"]
+
+
+def test_combinar_perfiles_de_archivos(tmp_path):
+    df = pd.read_csv(RUTA_GENERAL)
+    mitad = len(df) // 2
+    rutas = [tmp_path / "parte1.csv", tmp_path / "parte2.csv"]
+    df.iloc[:mitad].to_csv(rutas[0], index=False)
+    df.iloc[mitad:].to_csv(rutas[1], index=False)
+
+    completo = perfilar_archivo(RUTA_GENERAL)
+    partes = [perfil_archivo(str(ruta)) for ruta in rutas]
+    combinado = partes[0].merge(partes[1]).report()
+
+    assert combinado["filas"] == completo["filas"]
+    for col in ["NumCompaniesWorked", "MonthlyIncome", "Department"]:
+        esperado, perfil = completo["columnas"][col], combinado["columnas"][col]
+        for clave in ["nulos", "invalidos", "min", "max", "frecuencias"]:
+            assert perfil.get(clave) == esperado.get(clave)
+        assert abs(perfil["distintos_aprox"] - esperado["distintos_aprox"]) <= 1
+
+
+def test_combinar_perfiles_incompatibles():
+    numerico = FileProfile().update(pd.DataFrame({"a": [1, 2]}))
+    texto = FileProfile().update(pd.DataFrame({"a": ["x", "y"], "b": [1, 2]}))
+    with pytest.raises(ValueError):
+        numerico.merge(texto)
+    assert FileProfile().merge(texto).report()["columnas"].keys() == {"a", "b"}
+
+
+def test_detecta_invalidos(csv_con_errores):
+    reglas = {"Over18": {"valores": ["Y"]}, "JobSatisfaction": {"rango": [1, 4]}}
+    reporte = perfilar_archivo(csv_con_errores, reglas, chunksize=3)
+
+    assert reporte["columnas"]["Over18"]["invalidos"] == 1
+    assert reporte["columnas"]["Over18"]["nulos"] == 1
+    assert reporte["columnas"]["JobSatisfaction"]["invalidos"] == 2
+    assert reporte["columnas"]["EmployeeID"]["invalidos"] == 0
+
+
+def test_regla_columna_inexistente(csv_con_errores):
+    with pytest.raises(KeyError):
+        perfilar_archivo(csv_con_errores, {"Age": {"rango": [18, 100]}})
+
+
+def test_verificar_calidad(csv_con_errores):
+    reglas = {"datos": {"Over18": {"valores": ["Y"]}}}
+    reportes = perfilar_fuentes({"datos": csv_con_errores}, reglas)
+
+    problemas = problemas_calidad(reportes, max_tasa_nulos=0.05)
+    assert any("datos.Over18: 1 valores inválidos" in p for p in problemas)
+    assert any("datos.JobSatisfaction: tasa de nulos" in p for p in problemas)
+    with pytest.raises(ValueError, match="Over18"):
+        verificar_calidad(reportes)
+
+
+def test_fuentes_reales_cumplen_reglas():
+    reportes = perfilar_fuentes()
+
+    assert set(reportes) == {"general", "encuesta_empleados", "encuesta_jefes"}
+    verificar_calidad(reportes)
@@ -0,0 +1,118 @@
+"""Tests para el módulo downcast."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.config import RUTA_ENCODED_DATA
+from src.preprocessing.downcast import (
+    cargar_tipos,
+    guardar_reporte_tipos,
+    reducir_tipos,
+)
+
+
+@pytest.fixture
+def df_codificado():
+    """Columnas con los tipos típicos de la salida codificada."""
+    return pd.DataFrame(
+        {
+            "Attrition": np.array([0, 1, 0], dtype=np.int64),
+            "MonthlyIncome": np.array([19000, 199990, 57000], dtype=np.int64),
+            "Negativos": np.array([-200, 5, 30000], dtype=np.int64),
+            "JobLevel": np.array([1.0, 2.0, 5.0]),
+            "NumCompaniesWorked": np.array([1.0, np.nan, 9.0]),
+            "average_employee_satisfaction": np.array([2.0, 1 / 3, 3.5]),
+            "Department_Sales": [True, False, True],
+            "Department": ["Sales", "HR", "Sales"],
+        }
+    )
+
+
+def test_enteros_mas_pequenos(df_codificado):
+    resultado, reporte = reducir_tipos(df_codificado)
+
+    assert reporte["tipos"] == {
+        "Attrition": "int8",
+        "MonthlyIncome": "int32",
+        "Negativos": "int16",
+        "JobLevel": "int8",
+        "NumCompaniesWorked": "float32",
+        "average_employee_satisfaction": "float32",
+        "Department_Sales": "bool",
+        "Department": str(df_codificado["Department"].dtype),
+    }
+    assert reporte["bytes_despues"] < reporte["bytes_antes"]
+    # Los valores no cambian
+    pd.testing.assert_frame_equal(
+        resultado, df_codificado, check_dtype=False, rtol=1e-6
+    )
+    assert df_codificado["Attrition"].dtype == np.int64
+
+
+@pytest.mark.parametrize(
+    "precision, tipo_inexacto, tipo_exacto",
+    [
+        ("float64", "float64", "float64"),
+        ("float32", "float32", "float32"),
+        ("exacta", "float64", "float32"),
+    ],
+)
+def test_politica_de_precision(df_codificado, precision, tipo_inexacto, tipo_exacto):
+    _, reporte = reducir_tipos(df_codificado, precision)
+
+    assert reporte["tipos"]["average_employee_satisfaction"] == tipo_inexacto
+    assert reporte["tipos"]["NumCompaniesWorked"] == tipo_exacto
+    # Los float con solo enteros se convierten a entero con cualquier política
+    assert reporte["tipos"]["JobLevel"] == "int8"
+
+
+def test_columnas_indicadas_y_errores(df_codificado):
+    resultado, reporte = reducir_tipos(df_codificado, columnas=["Attrition"])
+
+    assert list(reporte["tipos"]) == ["Attrition"]
+    assert resultado["MonthlyIncome"].dtype == np.int64
+    with pytest.raises(KeyError):
+        reducir_tipos(df_codificado, columnas=["Age"])
+    with pytest.raises(ValueError):
+        reducir_tipos(df_codificado, "float16")
+
+
+def test_sin_entero_que_contenga_el_rango():
+    df = pd.DataFrame({"grande": [1e20, 2.0], "limite": [2.0**63, 0.0]})
+    reducido, reporte = reducir_tipos(df)
+
+    assert reporte["tipos"] == {"grande": "float64", "limite": "float64"}
+    pd.testing.assert_frame_equal(reducido, df)
+
+
+def test_enteros_sin_signo():
+    df = pd.DataFrame(
+        {
+            "grande": np.array([2**63 + 5, 1], dtype=np.uint64),
+            "pequeno": np.array([3, 200], dtype=np.uint64),
+        }
+    )
+    reducido, reporte = reducir_tipos(df)
+
+    assert reporte["tipos"] == {"grande": "uint64", "pequeno": "uint8"}
+    assert reducido["grande"].tolist() == [2**63 + 5, 1]
+    assert reducido["pequeno"].tolist() == [3, 200]
+
+
+def test_dataframe_vacio(df_codificado):
+    resultado, _ = reducir_tipos(df_codificado.head(0))
+    pd.testing.assert_frame_equal(resultado, df_codificado.head(0))
+
+
+def test_leer_csv_con_tipos_reducidos(tmp_path):
+    df = pd.read_csv(RUTA_ENCODED_DATA)
+    _, reporte = reducir_tipos(df)
+    ruta = str(tmp_path / "tipos.json")
+
+    guardar_reporte_tipos(reporte, ruta)
+    df_reducido = pd.read_csv(RUTA_ENCODED_DATA, dtype=cargar_tipos(ruta))
+
+    assert reporte["bytes_despues"] * 2 < reporte["bytes_antes"]
+    assert df_reducido.memory_usage(deep=True).sum() == reporte["bytes_despues"]
+    pd.testing.assert_frame_equal(df_reducido, df, check_dtype=False, rtol=1e-6)
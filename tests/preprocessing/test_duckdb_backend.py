@@ -0,0 +1,137 @@
+"""Tests para el módulo duckdb_backend."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feedback_jefes import procesar_feedback_jefes
+from src.preprocessing import duckdb_backend
+from src.preprocessing.read_employee_files import mean_columns, merge_files
+from src.preprocessing.read_feedback_files import merge_dataframe
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    """Crea archivos CSV desordenados, con faltantes y con una fila sin pareja."""
+    general = tmp_path / "general.csv"
+    encuesta = tmp_path / "encuesta.csv"
+    jefes = tmp_path / "jefes.csv"
+    general.write_text(
+        "EmployeeID,Attrition,NumCompaniesWorked\n"
+        "3,Yes,1\n1,No,NA\n2,No,4\n5,Yes,2\n"
+    )
+    encuesta.write_text("EmployeeID,A,B\n1,3,4\n2,,2\n3,1,\n4,2,2\n5,,\n")
+    jefes.write_text("EmployeeID,C,D\n2,3,3\n1,4,3\n3,2,4\n5,1,1\n")
+    return str(general), str(encuesta), str(jefes)
+
+
+def test_merge_files_igual_a_pandas(sample_files):
+    """Verifica que la unión en DuckDB coincide con la de pandas."""
+    dtypes = [{"EmployeeID": "int64", "NumCompaniesWorked": "float64"}, None]
+    result = duckdb_backend.merge_files(
+        sample_files[0], sample_files[1], "EmployeeID", dtypes=dtypes
+    )
+    expected = merge_files(sample_files[0], sample_files[1], "EmployeeID")
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_merge_files_missing_column(sample_files):
+    """Verifica que se lanza un error si falta la columna de unión."""
+    with pytest.raises(KeyError):
+        duckdb_backend.merge_files(sample_files[0], sample_files[1], "ID")
+
+
+def test_merge_dataframe_igual_a_pandas():
+    """Verifica que la unión de DataFrames conserva el orden de la izquierda."""
+    df1 = pd.DataFrame({"EmployeeID": [3, 1, 2], "Name": ["Luis", "Ana", "Juan"]})
+    df2 = pd.DataFrame({"EmployeeID": [1, 2, 3], "Score": [3.0, np.nan, 5.0]})
+
+    result = duckdb_backend.merge_dataframe(df1, df2, "EmployeeID")
+    expected = merge_dataframe(df1, df2, "EmployeeID")
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_mean_columns_ignora_faltantes():
+    """Verifica que el promedio por fila ignora valores faltantes como pandas."""
+    df = pd.DataFrame({"A": [3.0, np.nan, np.nan], "B": [5.0, 2.0, np.nan]})
+
+    result = duckdb_backend.mean_columns(df.copy(), "avg", ["A", "B"])
+    expected = mean_columns(df.copy(), "avg", ["A", "B"])
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_mean_columns_empty_list():
+    """Verifica que se lanza un error si la lista de columnas está vacía."""
+    with pytest.raises(ValueError):
+        duckdb_backend.mean_columns(pd.DataFrame({"A": [1]}), "avg", [])
+
+
+def _pandas_pipeline(general, encuesta, jefes):
+    """Reproduce con pandas la unión y los promedios del pipeline."""
+    df = merge_files(general, encuesta, "EmployeeID")
+    df = mean_columns(df, "avg_ab", ["A", "B"])
+    df = merge_dataframe(df, pd.read_csv(jefes), "EmployeeID")
+    return mean_columns(df, "avg_cd", ["C", "D"])
+
+
+def test_procesar_fuentes_igual_a_pandas(sample_files):
+    """Verifica que la consulta completa reproduce el resultado de pandas."""
+    rutas = dict(zip(["general", "encuesta", "jefes"], sample_files))
+    promedios = [
+        {"nombre": "avg_ab", "columnas": ["A", "B"]},
+        {"nombre": "avg_cd", "columnas": ["C", "D"]},
+    ]
+    dtypes = {"general": {"EmployeeID": "int64", "NumCompaniesWorked": "float64"}}
+
+    result = duckdb_backend.procesar_fuentes(
+        rutas, "EmployeeID", promedios, dtypes=dtypes
+    )
+
+    expected = _pandas_pipeline(*sample_files)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    assert result["EmployeeID"].tolist() == [3, 1, 2, 5]
+
+
+def test_procesar_fuentes_destino_y_disco(sample_files, tmp_path):
+    """Verifica que el resultado puede escribirse a disco con memoria limitada."""
+    rutas = dict(zip(["general", "encuesta", "jefes"], sample_files))
+    promedios = [None, {"nombre": "avg_cd", "columnas": ["C", "D"]}]
+    con = duckdb_backend.connect(
+        memory_limit="1GB", temp_directory=str(tmp_path / "spill")
+    )
+    destino = str(tmp_path / "resultado.csv")
+
+    ruta = duckdb_backend.procesar_fuentes(
+        rutas, "EmployeeID", promedios, destino=destino, con=con
+    )
+
+    result = pd.read_csv(ruta)
+    assert ruta == destino
+    assert "avg_cd" in result.columns
+    assert "avg_ab" not in result.columns
+    assert len(result) == 4
+
+
+def test_procesar_fuentes_una_sola_fuente(sample_files):
+    """Verifica que se necesitan al menos dos fuentes."""
+    with pytest.raises(ValueError):
+        duckdb_backend.procesar_fuentes({"general": sample_files[0]}, "EmployeeID", [])
+
+
+def test_procesar_feedback_jefes_backend_duckdb():
+    """Verifica que el pipeline con DuckDB es idéntico al de pandas."""
+    expected = procesar_feedback_jefes(backend="pandas")
+    result = procesar_feedback_jefes(backend="duckdb")
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+
+def test_procesar_feedback_jefes_backend_invalido():
+    """Verifica que se lanza un error con un backend no soportado."""
+    with pytest.raises(ValueError):
+        procesar_feedback_jefes(backend="spark")
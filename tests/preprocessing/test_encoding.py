@@ -1,6 +1,17 @@
+import numpy as np
 import pandas as pd
 import pytest
-from src.preprocessing.encoding import apply_label_encoding, apply_one_hot_encoding
+from scipy import sparse
+from sklearn.model_selection import KFold
+from src.preprocessing.encoding import (
+    apply_hashing_encoding,
+    apply_label_encoding,
+    apply_one_hot_encoding,
+    apply_target_encoding,
+    load_target_encoding,
+    save_target_encoding,
+    transform_target_encoding,
+)
 
 def test_apply_label_encoding():
     """Valida la codificación correcta de las columnas binarias."""
@@ -34,3 +45,137 @@ def test_apply_one_hot_encoding():
     # Verifica que las columnas originales ya no están
     assert 'Department' not in encoded_df.columns
     assert 'MaritalStatus' not in encoded_df.columns
+
+@pytest.fixture
+def df_target():
+    """DataFrame con una columna nominal y el objetivo 'Attrition'."""
+    rng = np.random.default_rng(0)
+    n = 200
+    return pd.DataFrame({
+        'JobRole': rng.choice(['Sales', 'HR', 'IT', 'Research'], size=n),
+        'Department': rng.choice(['A', 'B'], size=n),
+        'Attrition': rng.choice(['Yes', 'No'], size=n)
+    })
+
+def _target_encoding_directo(df, col, folds, smoothing):
+    """Cálculo directo fila por fila, con el objetivo y el prior fuera de fold."""
+    y = (df['Attrition'] == 'Yes').astype(float)
+    esperado = np.empty(len(df))
+    for i in range(len(df)):
+        fuera = folds != folds[i]
+        prior = y[fuera].mean()
+        misma = fuera & (df[col] == df[col].iloc[i]).to_numpy()
+        esperado[i] = (y[misma].sum() + smoothing * prior) / (misma.sum() + smoothing)
+    return esperado
+
+def test_apply_target_encoding_fuera_de_fold(df_target):
+    """Valida que cada fila se codifica solo con las filas de los otros folds."""
+    encoded_df, encoders = apply_target_encoding(
+        df_target, ['JobRole', 'Department'], n_splits=5, smoothing=10.0, random_state=0)
+
+    folds = np.empty(len(df_target), dtype=int)
+    for i, (_, indices) in enumerate(KFold(5, shuffle=True, random_state=0).split(df_target)):
+        folds[indices] = i
+
+    for col in ['JobRole', 'Department']:
+        np.testing.assert_allclose(
+            encoded_df[col], _target_encoding_directo(df_target, col, folds, 10.0))
+    # El objetivo y las demás columnas no cambian
+    assert encoded_df['Attrition'].equals(df_target['Attrition'])
+    assert set(encoders) == {'JobRole', 'Department'}
+
+def test_transform_target_encoding(df_target, tmp_path):
+    """Valida la codificación de datos nuevos con estadísticas persistidas."""
+    _, encoders = apply_target_encoding(df_target, ['JobRole'], smoothing=5.0)
+    ruta = tmp_path / 'target_encoding.json'
+    save_target_encoding(encoders, str(ruta))
+    cargados = load_target_encoding(str(ruta))
+
+    nuevos = pd.DataFrame({'JobRole': ['Sales', 'Manager', None]})
+    encoded_df = transform_target_encoding(nuevos, cargados)
+
+    y = (df_target['Attrition'] == 'Yes').astype(float)
+    prior = y.mean()
+    ventas = df_target['JobRole'] == 'Sales'
+    esperado_ventas = (y[ventas].sum() + 5.0 * prior) / (ventas.sum() + 5.0)
+    # Las categorías no vistas y los faltantes reciben la media global
+    np.testing.assert_allclose(encoded_df['JobRole'], [esperado_ventas, prior, prior])
+
+def test_apply_target_encoding_columna_inexistente(df_target):
+    """Valida el error cuando falta la columna objetivo."""
+    with pytest.raises(KeyError):
+        apply_target_encoding(df_target.drop(columns='Attrition'), ['JobRole'])
+
+def test_apply_hashing_encoding_ancho_fijo():
+    """Valida el ancho fijo y una entrada por valor no faltante."""
+    df = pd.DataFrame({
+        'Department': ['Sales', 'HR', None, 'IT'],
+        'JobRole': ['Manager', 'Analyst', 'Analyst', 'Nuevo rol']
+    })
+
+    matriz = apply_hashing_encoding(df, ['Department', 'JobRole'], n_features=2**20)
+
+    assert matriz.shape == (4, 2**20)
+    np.testing.assert_array_equal(np.asarray(matriz.sum(axis=1)).ravel(), [2, 2, 1, 2])
+    # Filas con el mismo valor activan la misma columna
+    assert (matriz[1].multiply(matriz[2])).sum() == 1
+
+def test_apply_hashing_encoding_estable_por_bloques():
+    """Valida que codificar por bloques da el mismo resultado que todo junto."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Department': rng.choice(['Sales', 'HR', 'IT'], size=100),
+        'MaritalStatus': rng.choice(['Single', 'Married', 'Divorced'], size=100)
+    })
+    columnas = ['Department', 'MaritalStatus']
+
+    completa = apply_hashing_encoding(df, columnas, n_features=64, alternate_sign=True)
+    bloques = [apply_hashing_encoding(df.iloc[i:i + 30], columnas, n_features=64,
+                                      alternate_sign=True)
+               for i in range(0, 100, 30)]
+
+    assert (completa != sparse.vstack(bloques)).nnz == 0
+
+def test_apply_hashing_encoding_no_depende_del_tipo():
+    """Valida que un valor va a la misma columna como int, float u objeto."""
+    enteros = pd.DataFrame({'Education': [1, 2, 3]})
+    flotantes = pd.DataFrame({'Education': [1.0, 2.0, np.nan]})
+    objetos = pd.DataFrame({'Education': np.array([1, 2.0, None], dtype=object)})
+
+    esperado = apply_hashing_encoding(enteros, ['Education'], n_features=64)
+    for df in (flotantes, objetos):
+        matriz = apply_hashing_encoding(df, ['Education'], n_features=64)
+        assert (matriz[:2] != esperado[:2]).nnz == 0
+        assert matriz[2].nnz == 0
+
+    # Los decimales no se truncan
+    decimales = pd.DataFrame({'Education': [1.5, 1.0]})
+    matriz = apply_hashing_encoding(decimales, ['Education'], n_features=2**20)
+    uno = apply_hashing_encoding(enteros.iloc[:1], ['Education'], n_features=2**20)
+    assert (matriz[0] != matriz[1]).nnz > 0
+    assert (matriz[1] != uno).nnz == 0
+
+def test_apply_hashing_encoding_texto_y_categorias():
+    """Valida que objetos, texto de pandas y categorías dan la misma matriz."""
+    valores = ['Sales', 'HR', None, 'Sales']
+    esperado = apply_hashing_encoding(pd.DataFrame({'Department': valores}),
+                                      ['Department'], n_features=64)
+    for dtype in ('string', 'category'):
+        df = pd.DataFrame({'Department': pd.Series(valores, dtype=dtype)})
+        matriz = apply_hashing_encoding(df, ['Department'], n_features=64)
+        assert (matriz != esperado).nnz == 0
+
+def test_apply_hashing_encoding_sin_columnas():
+    """Valida que sin columnas se obtiene una matriz vacía del ancho fijo."""
+    df = pd.DataFrame({'Department': ['Sales', 'HR']})
+    matriz = apply_hashing_encoding(df, [], n_features=8)
+    assert matriz.shape == (2, 8)
+    assert matriz.nnz == 0
+
+def test_apply_hashing_encoding_parametros_invalidos():
+    """Valida los errores por columna inexistente y ancho inválido."""
+    df = pd.DataFrame({'Department': ['Sales']})
+    with pytest.raises(KeyError):
+        apply_hashing_encoding(df, ['JobRole'])
+    with pytest.raises(ValueError):
+        apply_hashing_encoding(df, ['Department'], n_features=0)
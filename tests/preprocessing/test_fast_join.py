@@ -0,0 +1,89 @@
+"""Tests para el módulo fast_join."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.config import RUTA_GENERAL, RUTA_MANAGER_SURVEY
+from src.preprocessing.fast_join import estrategia_union, join_on_key
+from src.preprocessing.read_employee_files import read_file
+
+
+@pytest.fixture
+def right():
+    """Tabla derecha con llaves densas y ordenadas."""
+    return pd.DataFrame({"EmployeeID": [1, 2, 3, 4, 5], "Rating": [3, 4, 3, 2, 4]})
+
+
+def _esperado(left, right):
+    return pd.merge(left, right, on="EmployeeID", how="inner")
+
+
+def test_posicional(right):
+    left = pd.DataFrame({"EmployeeID": [1, 2, 3, 4, 5], "Age": list("abcde")})
+
+    assert estrategia_union(left, right, "EmployeeID") == "posicional"
+    pd.testing.assert_frame_equal(
+        join_on_key(left, right, "EmployeeID"), _esperado(left, right)
+    )
+
+
+def test_denso_con_llaves_faltantes_y_desordenadas(right):
+    left = pd.DataFrame(
+        {"EmployeeID": [5, 0, 2, 9, 2], "Age": [50, 0, 20, 90, 21]},
+        index=[10, 11, 12, 13, 14],
+    )
+
+    assert estrategia_union(left, right, "EmployeeID") == "denso"
+    pd.testing.assert_frame_equal(
+        join_on_key(left, right, "EmployeeID"), _esperado(left, right)
+    )
+
+
+def test_ordenado_no_denso():
+    left = pd.DataFrame({"EmployeeID": [3, 10, 7, 100], "Age": [1, 2, 3, 4]})
+    right = pd.DataFrame(
+        {"EmployeeID": [3, 7, 50, 100], "Rating": [1.0, 2.0, 3.0, 4.0]}
+    )
+
+    assert estrategia_union(left, right, "EmployeeID") == "ordenado"
+    pd.testing.assert_frame_equal(
+        join_on_key(left, right, "EmployeeID"), _esperado(left, right)
+    )
+
+
+@pytest.mark.parametrize(
+    "right",
+    [
+        pd.DataFrame({"EmployeeID": [2, 1, 3], "Rating": [1, 2, 3]}),
+        pd.DataFrame({"EmployeeID": [1, 1, 2], "Rating": [1, 2, 3]}),
+        pd.DataFrame({"EmployeeID": ["1", "2", "3"], "Rating": [1, 2, 3]}),
+        pd.DataFrame({"EmployeeID": [1, 2, 3], "Age": [1, 2, 3]}),
+    ],
+)
+def test_casos_con_hash(right):
+    left = pd.DataFrame({"EmployeeID": [1, 2, 3], "Age": [30, 40, 50]})
+    left["EmployeeID"] = left["EmployeeID"].astype(right["EmployeeID"].dtype)
+
+    assert estrategia_union(left, right, "EmployeeID") == "hash"
+    pd.testing.assert_frame_equal(
+        join_on_key(left, right, "EmployeeID"), _esperado(left, right)
+    )
+
+
+def test_archivos_reales():
+    general = read_file(RUTA_GENERAL)
+    jefes = read_file(RUTA_MANAGER_SURVEY)
+    muestra = general.sample(frac=0.5, random_state=0)
+
+    assert estrategia_union(general, jefes, "EmployeeID") == "posicional"
+    pd.testing.assert_frame_equal(
+        join_on_key(general, jefes, "EmployeeID"), _esperado(general, jefes)
+    )
+    pd.testing.assert_frame_equal(
+        join_on_key(muestra, jefes, "EmployeeID"), _esperado(muestra, jefes)
+    )
+    assert np.array_equal(
+        join_on_key(muestra, jefes, "EmployeeID")["EmployeeID"],
+        muestra["EmployeeID"],
+    )
@@ -0,0 +1,119 @@
+"""Tests para el módulo imputer."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feedback_jefes import procesar_feedback_jefes
+from src.preprocessing.imputer import (
+    ajustar_imputador,
+    aplicar_imputador,
+    cargar_imputador,
+    guardar_imputador,
+)
+
+
+@pytest.fixture
+def df_train():
+    """Datos con faltantes numéricos y categóricos en dos departamentos."""
+    return pd.DataFrame(
+        {
+            "Department": ["A", "A", "A", "B", "B", "B"],
+            "NumCompaniesWorked": [1.0, 3.0, np.nan, 7.0, 9.0, np.nan],
+            "EnvironmentSatisfaction": [1.0, np.nan, 1.0, 4.0, 4.0, 3.0],
+            "BusinessTravel": ["Rarely", "Rarely", None, "Often", None, "Often"],
+            "Age": [30, 40, 50, 20, 25, 35],
+        }
+    )
+
+
+def test_imputacion_global(df_train):
+    estado = ajustar_imputador(df_train)
+    resultado = aplicar_imputador(df_train, estado)
+
+    assert estado["numericas"] == ["NumCompaniesWorked", "EnvironmentSatisfaction"]
+    assert estado["categoricas"] == ["BusinessTravel"]
+    assert not resultado.isna().any().any()
+    assert resultado.loc[2, "NumCompaniesWorked"] == 5.0
+    assert resultado.loc[1, "EnvironmentSatisfaction"] == 3.0
+    assert resultado.loc[2, "BusinessTravel"] == "Often"
+    # Las columnas sin faltantes y los datos originales no cambian
+    pd.testing.assert_series_equal(resultado["Age"], df_train["Age"])
+    assert df_train["NumCompaniesWorked"].isna().sum() == 2
+
+
+def test_imputacion_por_grupo(df_train):
+    estado = ajustar_imputador(df_train, grupo="Department")
+    resultado = aplicar_imputador(df_train, estado)
+
+    assert list(resultado["NumCompaniesWorked"]) == [1.0, 3.0, 2.0, 7.0, 9.0, 8.0]
+    assert resultado.loc[1, "EnvironmentSatisfaction"] == 1.0
+    assert list(resultado["BusinessTravel"]) == ["Rarely"] * 3 + ["Often"] * 3
+
+
+def test_grupo_no_visto_usa_valor_global(df_train):
+    estado = ajustar_imputador(df_train, grupo="Department")
+    nuevos = pd.DataFrame(
+        {
+            "Department": ["C", "B"],
+            "NumCompaniesWorked": [np.nan, np.nan],
+            "EnvironmentSatisfaction": [np.nan, 2.0],
+            "BusinessTravel": [None, "Rarely"],
+        }
+    )
+
+    resultado = aplicar_imputador(nuevos, estado)
+
+    assert list(resultado["NumCompaniesWorked"]) == [5.0, 8.0]
+    assert list(resultado["EnvironmentSatisfaction"]) == [3.0, 2.0]
+    assert list(resultado["BusinessTravel"]) == ["Often", "Rarely"]
+
+
+def test_indicadores(df_train):
+    estado = ajustar_imputador(df_train, ["NumCompaniesWorked"], indicadores=True)
+    resultado = aplicar_imputador(df_train, estado)
+
+    assert resultado.columns[-1] == "NumCompaniesWorked_faltante"
+    assert list(resultado["NumCompaniesWorked_faltante"]) == [
+        False,
+        False,
+        True,
+        False,
+        False,
+        True,
+    ]
+    # Solo se imputan las columnas indicadas
+    assert resultado["EnvironmentSatisfaction"].isna().sum() == 1
+
+
+def test_guardar_y_cargar(df_train, tmp_path):
+    estado = ajustar_imputador(df_train, grupo="Department", indicadores=True)
+    ruta = tmp_path / "imputador.json"
+
+    guardar_imputador(estado, str(ruta))
+
+    pd.testing.assert_frame_equal(
+        aplicar_imputador(df_train, cargar_imputador(str(ruta))),
+        aplicar_imputador(df_train, estado),
+    )
+
+
+def test_datos_reales():
+    df = procesar_feedback_jefes()
+    estado = ajustar_imputador(df, grupo="Department", indicadores=True)
+    resultado = aplicar_imputador(df, estado)
+
+    assert "NumCompaniesWorked" in estado["numericas"]
+    assert "EnvironmentSatisfaction" in estado["numericas"]
+    assert not resultado[estado["numericas"]].isna().any().any()
+    assert resultado["EnvironmentSatisfaction_faltante"].sum() == (
+        df["EnvironmentSatisfaction"].isna().sum()
+    )
+
+
+def test_columna_inexistente(df_train):
+    with pytest.raises(KeyError):
+        ajustar_imputador(df_train, ["JobRole"])
+    estado = ajustar_imputador(df_train)
+    with pytest.raises(KeyError):
+        aplicar_imputador(df_train.drop(columns="BusinessTravel"), estado)
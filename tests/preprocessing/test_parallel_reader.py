@@ -0,0 +1,52 @@
+"""Tests para el módulo parallel_reader."""
+
+import pandas as pd
+import pytest
+
+from src.preprocessing.parallel_reader import read_files_parallel
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    """Crea tres archivos CSV temporales con una columna común."""
+    rutas = {
+        "general": tmp_path / "general.csv",
+        "encuesta": tmp_path / "encuesta.csv",
+        "jefes": tmp_path / "jefes.csv",
+    }
+    rutas["general"].write_text("EmployeeID,Name\n1,Ana\n2,Juan\n")
+    rutas["encuesta"].write_text("EmployeeID,Score\n1,3\n2,\n")
+    rutas["jefes"].write_text("EmployeeID,Rating\n1,4\n2,3\n")
+    return {nombre: str(ruta) for nombre, ruta in rutas.items()}
+
+
+def test_read_files_parallel_devuelve_todas_las_fuentes(sample_files):
+    """Verifica que se retorna un DataFrame por cada fuente configurada."""
+    result = read_files_parallel(sample_files)
+
+    assert list(result.keys()) == ["general", "encuesta", "jefes"]
+    for nombre, ruta in sample_files.items():
+        pd.testing.assert_frame_equal(result[nombre], pd.read_csv(ruta))
+
+
+def test_read_files_parallel_aplica_dtypes(sample_files):
+    """Verifica que se aplican los tipos de datos indicados por fuente."""
+    dtypes = {"encuesta": {"EmployeeID": "int32", "Score": "float32"}}
+    result = read_files_parallel(sample_files, dtypes=dtypes, max_workers=2)
+
+    assert result["encuesta"]["EmployeeID"].dtype == "int32"
+    assert result["encuesta"]["Score"].dtype == "float32"
+    assert result["jefes"]["Rating"].dtype == "int64"
+
+
+def test_read_files_parallel_propaga_error_por_archivo(sample_files):
+    """Verifica que se propaga la excepción original del archivo que falla."""
+    sample_files["jefes"] = "no_existe.csv"
+    with pytest.raises(FileNotFoundError, match="no_existe.csv"):
+        read_files_parallel(sample_files)
+
+
+def test_read_files_parallel_rutas_vacias():
+    """Verifica que se lanza un error si no se indican rutas."""
+    with pytest.raises(ValueError):
+        read_files_parallel({})
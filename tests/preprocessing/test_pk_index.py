@@ -0,0 +1,94 @@
+"""Tests para el módulo pk_index."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.config import RUTA_ENCODED_DATA
+from src.preprocessing.pk_index import IndicePK, construir_indice
+
+
+@pytest.fixture
+def df_empleados():
+    """Datos desordenados por llave, con texto y faltantes."""
+    return pd.DataFrame(
+        {
+            "Age": [41, 49, 37, 33, 27],
+            "EmployeeID": [5, 1, 40, 2, 3],
+            "Department": ["Sales", "Research & Development", "Sales", "HR", "Sales"],
+            "NumCompaniesWorked": [1.0, np.nan, 6.0, 1.0, 9.0],
+        }
+    )
+
+
+@pytest.fixture
+def ruta_csv(df_empleados, tmp_path):
+    ruta = str(tmp_path / "encoded_data.csv")
+    df_empleados.to_csv(ruta, index=False)
+    return ruta
+
+
+def test_construir_indice(ruta_csv, tmp_path):
+    ruta_indice = construir_indice(ruta_csv)
+    indice = np.load(ruta_indice)
+
+    assert ruta_indice == str(tmp_path / "encoded_data_pk.npy")
+    assert indice[:, 0].tolist() == [1, 2, 3, 5, 40]
+
+
+def test_buscar_una_fila(df_empleados, ruta_csv):
+    construir_indice(ruta_csv)
+    indice = IndicePK(ruta_csv)
+
+    fila = indice.buscar(40)
+
+    assert len(indice) == 5
+    pd.testing.assert_series_equal(fila, df_empleados.iloc[2], check_names=False)
+
+
+def test_buscar_lote_en_orden_pedido(df_empleados, ruta_csv):
+    construir_indice(ruta_csv)
+    indice = IndicePK(ruta_csv)
+
+    lote = indice.buscar_lote([3, 5, 1])
+
+    esperado = df_empleados.set_index("EmployeeID", drop=False).loc[[3, 5, 1]]
+    pd.testing.assert_frame_equal(lote, esperado.reset_index(drop=True))
+
+
+def test_llave_inexistente(ruta_csv):
+    construir_indice(ruta_csv)
+    with pytest.raises(KeyError):
+        IndicePK(ruta_csv).buscar_lote([1, 99])
+
+
+def test_llave_repetida_o_faltante(df_empleados, tmp_path):
+    ruta = str(tmp_path / "datos.csv")
+    df_empleados.assign(EmployeeID=[1, 1, 2, 3, 4]).to_csv(ruta, index=False)
+    with pytest.raises(ValueError):
+        construir_indice(ruta)
+    with pytest.raises(KeyError):
+        construir_indice(ruta, column_key="ID")
+
+
+def test_indice_desactualizado(df_empleados, ruta_csv):
+    construir_indice(ruta_csv)
+    df_empleados.head(2).to_csv(ruta_csv, index=False)
+    with pytest.raises(ValueError):
+        IndicePK(ruta_csv)
+
+
+def test_datos_codificados(tmp_path):
+    datos = pd.read_csv(RUTA_ENCODED_DATA)
+    ruta_indice = construir_indice(
+        RUTA_ENCODED_DATA, ruta_indice=str(tmp_path / "pk.npy")
+    )
+    indice = IndicePK(RUTA_ENCODED_DATA, ruta_indice)
+
+    claves = [4410, 1, 2000]
+    esperado = datos.set_index("EmployeeID", drop=False).loc[claves]
+    pd.testing.assert_frame_equal(
+        indice.buscar_lote(claves),
+        esperado.reset_index(drop=True),
+        check_dtype=False,
+    )
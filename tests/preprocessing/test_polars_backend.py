@@ -0,0 +1,153 @@
+"""Tests de conformidad entre el backend de Polars y las funciones de pandas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feedback_jefes import procesar_feedback_jefes
+from src.preprocessing import polars_backend as pb
+from src.preprocessing.cleaner import standardize_column_values
+from src.preprocessing.encoding import apply_label_encoding, apply_one_hot_encoding
+from src.preprocessing.read_employee_files import mean_columns, merge_files, read_file
+from src.preprocessing.read_feedback_files import merge_dataframe
+
+pytest.importorskip("polars")
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    """Crea dos archivos CSV desordenados y con valores faltantes."""
+    general = tmp_path / "general.csv"
+    encuesta = tmp_path / "encuesta.csv"
+    general.write_text(
+        "EmployeeID,Department,Age,NumCompaniesWorked\n"
+        "3,Sales,41,1\n1,Research & Development,49,NA\n"
+        "2,Sales,37,4\n5,Human Resources,33,2\n"
+    )
+    encuesta.write_text("EmployeeID,A,B\n1,3,4\n2,,2\n3,1,\n4,2,2\n5,,\n")
+    return str(general), str(encuesta)
+
+
+@pytest.fixture
+def categorical_df():
+    """DataFrame con columnas binarias y nominales como las del dataset real."""
+    return pd.DataFrame(
+        {
+            "EmployeeID": [1, 2, 3, 4],
+            "Attrition": ["Yes", "No", "Yes", "No"],
+            "Gender": ["Male", "Female", "Female", "Male"],
+            "Department": ["Sales", "HR", "Sales", "IT"],
+            "MaritalStatus": ["Single", "Married", None, "Divorced"],
+        }
+    )
+
+
+def test_read_file_igual_a_pandas(sample_files):
+    """Verifica que la lectura con filtros y proyección coincide con pandas."""
+    filters = [("Department", "==", "Sales"), ("Age", "between", (30, 40))]
+    expected = read_file(sample_files[0], columns=["EmployeeID"], filters=filters)
+    result = pb.to_pandas(
+        pb.read_file(sample_files[0], columns=["EmployeeID"], filters=filters)
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_read_file_not_found():
+    """Verifica que se lanza un FileNotFoundError si el archivo no existe."""
+    with pytest.raises(FileNotFoundError):
+        pb.read_file("no_existe.csv")
+
+
+def test_merge_files_igual_a_pandas(sample_files):
+    """Verifica que la unión conserva columnas, orden de filas y faltantes."""
+    expected = merge_files(sample_files[0], sample_files[1], "EmployeeID")
+    result = pb.to_pandas(
+        pb.merge_files(sample_files[0], sample_files[1], "EmployeeID")
+    )
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_merge_dataframe_missing_column():
+    """Verifica que se lanza un error si falta la columna de unión."""
+    df1 = pd.DataFrame({"EmployeeID": [1], "Name": ["Ana"]})
+    df2 = pd.DataFrame({"ID": [1], "Score": [3]})
+    with pytest.raises(KeyError):
+        pb.merge_dataframe(df1, df2, "EmployeeID")
+
+
+def test_merge_dataframe_igual_a_pandas():
+    """Verifica que la unión de DataFrames coincide con pandas."""
+    df1 = pd.DataFrame({"EmployeeID": [3, 1, 2], "Name": ["Luis", "Ana", "Juan"]})
+    df2 = pd.DataFrame({"EmployeeID": [1, 2, 4], "Score": [3.0, np.nan, 5.0]})
+
+    expected = merge_dataframe(df1, df2, "EmployeeID")
+    result = pb.to_pandas(pb.merge_dataframe(df1, df2, "EmployeeID"))
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_merge_dataframe_claves_repetidas():
+    """Verifica que con claves repetidas se conserva el orden de pandas."""
+    df1 = pd.DataFrame({"EmployeeID": [2, 1, 2], "Name": ["Juan", "Ana", "Rosa"]})
+    df2 = pd.DataFrame({"EmployeeID": [2, 1, 2], "Score": [1.0, 2.0, 3.0]})
+
+    expected = merge_dataframe(df1, df2, "EmployeeID")
+    result = pb.to_pandas(pb.merge_dataframe(df1, df2, "EmployeeID"))
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_mean_columns_igual_a_pandas():
+    """Verifica que el promedio por fila ignora faltantes como pandas."""
+    df = pd.DataFrame({"A": [3.0, np.nan, np.nan], "B": [5.0, 2.0, np.nan]})
+
+    expected = mean_columns(df.copy(), "avg", ["A", "B"])
+    result = pb.to_pandas(pb.mean_columns(df, "avg", ["A", "B"]))
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_mean_columns_errores():
+    """Verifica los errores por lista vacía y columnas inexistentes."""
+    df = pd.DataFrame({"A": [1, 2]})
+    with pytest.raises(ValueError):
+        pb.mean_columns(df, "avg", [])
+    with pytest.raises(KeyError):
+        pb.mean_columns(df, "avg", ["A", "C"])
+
+
+def test_apply_label_encoding_igual_a_pandas(categorical_df):
+    """Verifica que los códigos coinciden con los de LabelEncoder."""
+    expected, encoders = apply_label_encoding(categorical_df, ["Attrition", "Gender"])
+    result, categorias = pb.apply_label_encoding(
+        categorical_df, ["Attrition", "Gender"]
+    )
+
+    pd.testing.assert_frame_equal(pb.to_pandas(result), expected, check_dtype=False)
+    assert categorias["Attrition"] == list(encoders["Attrition"].classes_)
+
+
+def test_apply_one_hot_encoding_igual_a_pandas(categorical_df):
+    """Verifica que las columnas dummy coinciden con pandas.get_dummies."""
+    columns = ["Department", "MaritalStatus"]
+    expected = apply_one_hot_encoding(categorical_df, columns)
+    result = pb.to_pandas(pb.apply_one_hot_encoding(categorical_df, columns))
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_standardize_column_values_igual_a_pandas():
+    """Verifica que la estandarización coincide con la de cleaner."""
+    df = pd.DataFrame({"genero": ["M", "F", "m", "F", "f"]})
+    mapping = {"M": "Masculino", "m": "Masculino", "F": "Femenino", "f": "Femenino"}
+
+    expected = standardize_column_values(df, "genero", mapping)
+    result = pb.to_pandas(pb.standardize_column_values(df, "genero", mapping))
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    # Columna inexistente: los datos no cambian
+    result = pb.to_pandas(pb.standardize_column_values(df, "otra", mapping))
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+def test_procesar_feedback_jefes_backend_polars():
+    """Verifica que el pipeline con Polars es idéntico al de pandas."""
+    expected = procesar_feedback_jefes(backend="pandas")
+    result = procesar_feedback_jefes(backend="polars")
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
@@ -0,0 +1,68 @@
+"""Tests para el módulo row_filter."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.row_filter import SeleccionFilas
+
+
+@pytest.fixture
+def df():
+    """Datos con un duplicado, una fila inválida y un outlier."""
+    rng = np.random.default_rng(0)
+    datos = pd.DataFrame(
+        {
+            "EmployeeID": np.arange(1, 61),
+            "Age": rng.integers(25, 55, 60),
+            "MonthlyIncome": rng.normal(20000, 1000, 60),
+        },
+        index=np.arange(100, 160),
+    )
+    datos.loc[101, "EmployeeID"] = 1
+    datos.loc[102, "Age"] = 10
+    datos.loc[103, "MonthlyIncome"] = 90000
+    return datos
+
+
+def test_filtros_encadenados(df):
+    original = df.copy()
+    seleccion = (
+        SeleccionFilas(df)
+        .sin_invalidas({"Age": {"tipo": "int", "rango": [18, None]}})
+        .sin_duplicados(["EmployeeID"])
+        .sin_outliers(["MonthlyIncome"], methods=("iqr",), isolation=False)
+    )
+    resultado = seleccion.materializar()
+
+    assert list(resultado.index) == [100] + list(range(104, 160))
+    pd.testing.assert_frame_equal(df, original)
+    assert seleccion.resumen() == {
+        "filas_iniciales": 60,
+        "filas_finales": 57,
+        "descartes": {"esquema": 1, "duplicados": 1, "outliers": 1},
+    }
+
+
+def test_filtros_sobre_filas_seleccionadas(df):
+    # La fila 100 ya descartada no cuenta como primera aparición del ID 1
+    seleccion = SeleccionFilas(df).filtrar(df.index == 100, "manual")
+    seleccion.sin_duplicados(["EmployeeID"])
+    assert seleccion.descartes == {"manual": 1, "duplicados": 0}
+    assert 101 in seleccion.materializar().index
+
+
+def test_equivale_a_filtros_de_pandas(df):
+    seleccion = SeleccionFilas(df).sin_duplicados(["EmployeeID"], keep="last")
+    esperado = df.drop_duplicates(["EmployeeID"], keep="last")
+    pd.testing.assert_frame_equal(seleccion.materializar(), esperado)
+    pd.testing.assert_frame_equal(seleccion.materializar(["Age"]), esperado[["Age"]])
+    assert (df.iloc[seleccion.posiciones()].index == esperado.index).all()
+
+
+def test_errores(df):
+    seleccion = SeleccionFilas(df)
+    with pytest.raises(ValueError):
+        seleccion.filtrar([True, False], "manual")
+    with pytest.raises(KeyError):
+        seleccion.sin_duplicados(["Department"])
@@ -0,0 +1,177 @@
+"""Tests para el módulo schema."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.config import DTYPES_FUENTES, ESQUEMAS, RUTAS_FUENTES
+from src.preprocessing.read_employee_files import read_file
+from src.preprocessing.schema import (
+    SchemaValidationError,
+    ValidadorEsquema,
+    filas_invalidas,
+    validar_esquema,
+    validate_dataframe,
+)
+
+
+@pytest.fixture
+def schema():
+    """Esquema con todas las reglas soportadas."""
+    return {
+        "EmployeeID": {"tipo": "int", "unico": True},
+        "Age": {"tipo": "int", "rango": [18, None]},
+        "Over18": {"tipo": "str", "valores": ["Y"]},
+        "JobSatisfaction": {"tipo": "float", "nullable": True, "rango": [1, 4]},
+    }
+
+
+@pytest.fixture
+def df_valido():
+    """Datos que cumplen el esquema."""
+    return pd.DataFrame(
+        {
+            "EmployeeID": [1, 2, 3],
+            "Age": [25, 40, 61],
+            "Over18": ["Y", "Y", "Y"],
+            "JobSatisfaction": [1.0, np.nan, 4.0],
+        }
+    )
+
+
+def _reglas(error):
+    return {(v["columna"], v["regla"]) for v in error.value.violaciones}
+
+
+def test_datos_validos(schema, df_valido):
+    validate_dataframe(df_valido, schema)
+
+
+def test_resumen_de_violaciones(schema, df_valido):
+    df = df_valido.assign(
+        EmployeeID=[1, 1, 3],
+        Age=[25, 17, None],
+        Over18=["Y", "N", "Y"],
+        JobSatisfaction=[1.0, 5.0, 2.5],
+    )
+    with pytest.raises(SchemaValidationError) as error:
+        validate_dataframe(df, schema)
+
+    assert _reglas(error) == {
+        ("EmployeeID", "valores repetidos"),
+        ("Age", "valores nulos"),
+        ("Age", "fuera de rango [18, None]"),
+        ("Over18", "categoría no permitida"),
+        ("JobSatisfaction", "fuera de rango [1, 4]"),
+    }
+    assert isinstance(error.value, ValueError)
+    assert "Over18" in str(error.value)
+
+
+def test_tipos_invalidos(schema, df_valido):
+    df = df_valido.assign(Age=["25", "cuarenta", "61"], JobSatisfaction=[1.5, 2.0, 3.0])
+    with pytest.raises(SchemaValidationError) as error:
+        validate_dataframe(df, {**schema, "JobSatisfaction": {"tipo": "int"}})
+
+    violaciones = {v["regla"]: v for v in error.value.violaciones}
+    assert violaciones["valores no numéricos"]["ejemplos"] == ["cuarenta"]
+    assert violaciones["valores no enteros"]["ejemplos"] == [1.5]
+
+
+def test_tipo_texto(schema, df_valido):
+    validate_dataframe(df_valido.astype({"Over18": "category"}), schema)
+    with pytest.raises(SchemaValidationError) as error:
+        validate_dataframe(
+            df_valido.assign(Over18=[1, 2, 3]), {"Over18": {"tipo": "str"}}
+        )
+    assert _reglas(error) == {("Over18", "valores no texto")}
+
+
+def test_columna_faltante(schema, df_valido):
+    with pytest.raises(SchemaValidationError) as error:
+        validate_dataframe(df_valido.drop(columns="Over18"), schema)
+    assert _reglas(error) == {("Over18", "columna faltante")}
+
+
+def test_unicidad_entre_bloques(schema, df_valido):
+    validador = ValidadorEsquema(schema)
+    validador.validate(df_valido)
+    # Un bloque sin repetidos internos pero con un ID de un bloque anterior
+    bloque = df_valido.assign(EmployeeID=[4, 2, 5])
+
+    violaciones = validador.check(bloque)
+
+    assert violaciones == [
+        {
+            "columna": "EmployeeID",
+            "regla": "valores repetidos",
+            "filas": 1,
+            "ejemplos": [2],
+        }
+    ]
+    assert validador.filas == 6
+
+
+def test_unicidad_en_muchos_bloques():
+    validador = ValidadorEsquema({"EmployeeID": {"tipo": "int", "unico": True}})
+    ids = pd.DataFrame({"EmployeeID": np.arange(10_000)})
+    for inicio in range(0, len(ids), 1_000):
+        assert validador.check(ids.iloc[inicio : inicio + 1_000]) == []
+
+    violaciones = validador.check(pd.DataFrame({"EmployeeID": [10_000, 17, 9_999]}))
+    assert violaciones[0]["filas"] == 2
+    assert violaciones[0]["ejemplos"] == [17, 9_999]
+
+
+def test_unicidad_con_tipos_distintos_por_bloque():
+    validador = ValidadorEsquema({"Codigo": {"unico": True}})
+    assert validador.check(pd.DataFrame({"Codigo": [1, 2]})) == []
+    # Un bloque float no se trunca al compararlo con los enteros ya vistos
+    assert validador.check(pd.DataFrame({"Codigo": [1.5, 3.0]})) == []
+    violaciones = validador.check(pd.DataFrame({"Codigo": [1.5, 4.0, 4.0]}))
+    assert violaciones[0]["filas"] == 3
+
+    textos = ValidadorEsquema({"Codigo": {"unico": True}})
+    assert textos.check(pd.DataFrame({"Codigo": ["a", "b"]})) == []
+    violaciones = textos.check(pd.DataFrame({"Codigo": ["abc", "b"]}))
+    assert violaciones[0]["ejemplos"] == ["b"]
+
+
+def test_esquema_mal_definido():
+    with pytest.raises(ValueError):
+        validar_esquema({"Age": {"minimo": 18}})
+    with pytest.raises(ValueError):
+        validar_esquema({"Age": {"tipo": "fecha"}})
+
+
+@pytest.mark.parametrize("fuente", list(RUTAS_FUENTES))
+def test_fuentes_reales_cumplen_esquema(fuente):
+    df = read_file(
+        RUTAS_FUENTES[fuente], DTYPES_FUENTES[fuente], schema=ESQUEMAS[fuente]
+    )
+    assert len(df) == 4410
+
+
+def test_filas_invalidas(schema, df_valido):
+    df = pd.concat([df_valido, df_valido.iloc[[0]]], ignore_index=True).assign(
+        Age=[25, 17, None, 30],
+        Over18=["Y", "Y", "Y", "N"],
+        JobSatisfaction=[1.0, np.nan, 4.5, 2.0],
+    )
+    invalidas = filas_invalidas(df, schema)
+    # Fila 1: edad fuera de rango; fila 2: edad nula y satisfacción fuera de
+    # rango; fila 3: ID repetido y categoría no permitida
+    assert invalidas.tolist() == [False, True, True, True]
+    assert not filas_invalidas(df_valido, schema).any()
+
+    with pytest.raises(KeyError):
+        filas_invalidas(df_valido.drop(columns=["Age"]), schema)
+
+
+def test_filas_invalidas_entero_nullable():
+    schema = {"NumCompaniesWorked": {"tipo": "int", "nullable": True}}
+    df = pd.DataFrame({"NumCompaniesWorked": [1.0, np.nan, 3.0, 2.5]})
+
+    assert filas_invalidas(df, schema).tolist() == [False, False, False, True]
+    validate_dataframe(df.iloc[:3], schema)
+    assert not filas_invalidas(df.iloc[:3], schema).any()
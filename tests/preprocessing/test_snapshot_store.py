@@ -0,0 +1,198 @@
+"""Tests para el módulo snapshot_store."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing.config import RUTA_GENERAL
+from src.preprocessing.read_employee_files import read_file
+from src.preprocessing.snapshot_store import SnapshotStore
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def df_enero():
+    """Extracto real de general_data.csv."""
+    return read_file(RUTA_GENERAL)
+
+
+@pytest.fixture(scope="module")
+def df_febrero(df_enero):
+    """Extracto con dos bajas, tres aumentos de salario y una alta."""
+    df = df_enero[~df_enero["EmployeeID"].isin([1, 2])].copy()
+    aumentos = df["EmployeeID"].isin([3, 4, 5])
+    df.loc[aumentos, "MonthlyIncome"] = df.loc[aumentos, "MonthlyIncome"] * 2
+    nueva = df_enero[df_enero["EmployeeID"] == 10].assign(EmployeeID=99999)
+    return pd.concat([df, nueva], ignore_index=True)
+
+
+@pytest.fixture
+def store(tmp_path, df_enero, df_febrero):
+    """Historial con los snapshots de enero y febrero."""
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    store.ingest(df_enero, "2024-01-31")
+    store.ingest(df_febrero, "2024-02-29")
+    return store
+
+
+def _ordenado(df):
+    return df.sort_values("EmployeeID").reset_index(drop=True)
+
+
+def test_ingest_solo_guarda_diferencias(tmp_path, df_enero, df_febrero):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    primero = store.ingest(RUTA_GENERAL, "2024-01-31")
+    segundo = store.ingest(df_febrero, "2024-02-29")
+
+    assert primero == {
+        "altas": len(df_enero),
+        "modificaciones": 0,
+        "bajas": 0,
+        "sin_cambios": 0,
+    }
+    assert segundo == {
+        "altas": 1,
+        "modificaciones": 3,
+        "bajas": 2,
+        "sin_cambios": len(df_febrero) - 4,
+    }
+    cambios = pd.read_parquet(
+        tmp_path / "snapshots" / "snapshot_date=2024-02-29" / "cambios.parquet"
+    )
+    assert sorted(cambios["EmployeeID"]) == [3, 4, 5, 99999]
+
+
+def test_as_of_reconstruye_cada_snapshot(store, df_enero, df_febrero):
+    pd.testing.assert_frame_equal(store.as_of("2024-01-31"), _ordenado(df_enero))
+    pd.testing.assert_frame_equal(store.as_of("2024-02-29"), _ordenado(df_febrero))
+    # Una fecha intermedia usa el último snapshot anterior
+    pd.testing.assert_frame_equal(store.as_of("2024-02-15"), _ordenado(df_enero))
+
+
+def test_as_of_con_columnas(store, df_febrero):
+    resultado = store.as_of("2024-02-29", columns=["MonthlyIncome"])
+    assert list(resultado.columns) == ["EmployeeID", "MonthlyIncome"]
+    pd.testing.assert_frame_equal(
+        resultado, _ordenado(df_febrero[["EmployeeID", "MonthlyIncome"]])
+    )
+
+
+def test_changes(store):
+    cambios = store.changes("2024-01-31", "2024-02-29")
+
+    por_tipo = cambios.groupby("tipo_cambio")["EmployeeID"].apply(list).to_dict()
+    assert por_tipo == {
+        "alta": [99999],
+        "baja": [1, 2],
+        "modificacion": [3, 4, 5],
+    }
+    modificadas = cambios[cambios["tipo_cambio"] == "modificacion"]
+    assert all(
+        cols == ["MonthlyIncome"] for cols in modificadas["columnas_modificadas"]
+    )
+
+
+def test_historia(store, df_enero, df_febrero):
+    panel = store.historia(columns=["MonthlyIncome"])
+
+    assert len(panel) == len(df_enero) + len(df_febrero)
+    empleado_1 = panel[panel["EmployeeID"] == 1]
+    assert list(empleado_1["snapshot_date"]) == [pd.Timestamp("2024-01-31")]
+    empleado_3 = panel[panel["EmployeeID"] == 3]
+    salario = df_enero.loc[df_enero["EmployeeID"] == 3, "MonthlyIncome"].iloc[0]
+    assert list(empleado_3["MonthlyIncome"]) == [salario, salario * 2]
+
+
+def test_caracteristicas_longitudinales(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    for mes, satisfaccion in enumerate([1.0, 2.0, 3.0], start=1):
+        store.ingest(
+            pd.DataFrame(
+                {
+                    "EmployeeID": [1, 2],
+                    "MonthlyIncome": [1000 * mes, 500],
+                    "average_employee_satisfaction": [satisfaccion, 2.0],
+                }
+            ),
+            f"2024-0{mes}-01",
+        )
+
+    features = store.caracteristicas_longitudinales(
+        columna_satisfaccion="average_employee_satisfaction"
+    )
+
+    assert list(features["n_snapshots"]) == [3, 3]
+    np.testing.assert_allclose(features["crecimiento_salario"], [2.0, 0.0])
+    np.testing.assert_allclose(features["tendencia_satisfaccion"], [1.0, 0.0])
+
+
+def test_caracteristicas_longitudinales_general_data(store, df_enero, df_febrero):
+    # Valores por defecto sobre los extractos reales de general_data.csv
+    features = store.caracteristicas_longitudinales().set_index("EmployeeID")
+
+    assert "tendencia_satisfaccion" not in features.columns
+    assert len(features) == len(df_enero) + 1
+    assert features.loc[1, "n_snapshots"] == 1
+    assert features.loc[3, "n_snapshots"] == 2
+    np.testing.assert_allclose(features.loc[[3, 4, 5], "crecimiento_salario"], 1.0)
+    assert features.loc[6, "crecimiento_salario"] == 0
+
+
+def test_columnas_ausentes_en_una_particion(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    store.ingest(
+        pd.DataFrame({"EmployeeID": [1, 2], "MonthlyIncome": [1000, 500]}),
+        "2024-01-01",
+    )
+    store.ingest(
+        pd.DataFrame(
+            {
+                "EmployeeID": [1, 2],
+                "MonthlyIncome": [1000, 500],
+                "average_employee_satisfaction": [1.0, 3.0],
+            }
+        ),
+        "2024-02-01",
+    )
+    store.ingest(
+        pd.DataFrame(
+            {
+                "EmployeeID": [1, 2],
+                "MonthlyIncome": [2000, 500],
+                "average_employee_satisfaction": [2.0, 3.0],
+            }
+        ),
+        "2024-03-01",
+    )
+
+    panel = store.historia(["MonthlyIncome", "average_employee_satisfaction"])
+    assert panel["average_employee_satisfaction"].isna().sum() == 2
+    features = store.caracteristicas_longitudinales(
+        columna_satisfaccion="average_employee_satisfaction"
+    )
+    np.testing.assert_allclose(features["crecimiento_salario"], [1.0, 0.0])
+    np.testing.assert_allclose(features["tendencia_satisfaccion"], [1.0, 0.0])
+
+
+def test_reabrir_historial(store, df_febrero):
+    reabierto = SnapshotStore(str(store.raiz))
+    assert reabierto.snapshots == ["2024-01-31", "2024-02-29"]
+    pd.testing.assert_frame_equal(reabierto.as_of("2024-02-29"), _ordenado(df_febrero))
+
+
+def test_fecha_no_posterior(store, df_enero):
+    with pytest.raises(ValueError):
+        store.ingest(df_enero, "2024-02-01")
+
+
+def test_clave_repetida(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    with pytest.raises(ValueError):
+        store.ingest(pd.DataFrame({"EmployeeID": [1, 1]}), "2024-01-31")
+
+
+def test_sin_snapshots(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    with pytest.raises(ValueError):
+        store.as_of("2024-01-31")